@@ -0,0 +1,88 @@
+import hmac
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from app.config.settings import settings
+from app.core.pipeline.runner import PipelineRunner
+from app.data.repositories.insight_repo import JSONInsightRepository
+from app.data.repositories.rollup_repo import SQLiteInsightRollups
+from app.monetization.entitlements import EntitlementService
+from app.monetization.usage import UsageMeter
+
+
+@lru_cache
+def get_insight_rollups() -> SQLiteInsightRollups:
+    return SQLiteInsightRollups(settings.insight_rollups_path)
+
+
+@lru_cache
+def get_insight_repository() -> JSONInsightRepository:
+    from app.core.pipeline.factory import build_insight_repository
+
+    # Shares the rollups connection with the read endpoints.
+    return build_insight_repository(
+        get_insight_rollups() if settings.insight_rollups_enabled else None
+    )
+
+
+@lru_cache
+def get_usage_meter() -> Optional[UsageMeter]:
+    from app.core.pipeline.factory import build_usage_meter
+
+    return build_usage_meter()
+
+
+@lru_cache
+def get_entitlements() -> Optional[EntitlementService]:
+    from app.core.pipeline.factory import build_entitlements
+
+    meter = get_usage_meter()
+    return build_entitlements(meter) if meter else None
+
+
+@lru_cache
+def get_pipeline_runner() -> PipelineRunner:
+    if settings.pipeline_stub_providers:
+        from app.core.pipeline.stubs import build_stub_pipeline
+
+        pipeline = build_stub_pipeline(get_insight_repository())
+    else:
+        from app.core.pipeline.factory import build_pipeline
+
+        pipeline = build_pipeline(
+            get_usage_meter(), get_entitlements(), get_insight_repository()
+        )
+
+    return PipelineRunner(
+        pipeline,
+        max_concurrent=settings.pipeline_max_concurrent_runs,
+        max_pending=settings.pipeline_max_pending_runs,
+    )
+
+
+def require_account(x_api_key: str = Header(default="")) -> Optional[str]:
+    """
+    Account id for the X-Api-Key header. Stub mode without configured keys
+    is open (load tests) and runs are unattributed; otherwise an unknown key
+    is refused and, with no keys at all, the endpoints stay shut.
+    """
+    keys = settings.pipeline_api_keys
+    if not keys:
+        if settings.pipeline_stub_providers:
+            return None
+        raise HTTPException(status_code=404, detail="Pipeline API disabled")
+
+    for key, account_id in keys.items():
+        if hmac.compare_digest(x_api_key, key):
+            return account_id
+    raise HTTPException(status_code=401, detail="Valid API key required")
+
+
+def require_admin(x_admin_token: str = Header(default="")) -> None:
+    """Admin routes need DPP_ADMIN_TOKEN; without one configured they stay shut."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Admin routes disabled")
+    if not hmac.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
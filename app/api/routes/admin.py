@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from app.api.deps import require_admin
+from app.utils.profiling import lag_monitor, run_profiler
+
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.post("/profile")
+def start_profile(runs: int = Query(1, ge=1, le=50)):
+    """Profile the next ``runs`` pipeline runs into one collapsed-stack file."""
+    try:
+        capture = run_profiler.arm(runs)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+    return capture.to_dict()
+
+
+@router.get("/profile/{capture_id}")
+def get_profile(capture_id: str):
+    capture = run_profiler.captures.get(capture_id)
+    if capture is None:
+        raise HTTPException(status_code=404, detail="Unknown capture")
+
+    return capture.to_dict()
+
+
+@router.get("/profile/{capture_id}/folded")
+def download_profile(capture_id: str):
+    capture = run_profiler.captures.get(capture_id)
+    if capture is None or not capture.path.exists():
+        raise HTTPException(status_code=404, detail="Profile not ready")
+
+    return FileResponse(
+        capture.path, media_type="text/plain", filename=capture.path.name
+    )
+
+
+@router.get("/loop-lag")
+def get_loop_lag():
+    """Recent event-loop stalls with the stack that was blocking the loop."""
+    return {
+        "threshold_ms": lag_monitor.threshold * 1000,
+        "stalls": list(lag_monitor.stalls),
+    }
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.deps import get_insight_repository, get_insight_rollups
+from app.data.repositories.base import InsightRepositoryBase, InsightRollupsBase
+
+
+router = APIRouter(prefix="/insights", tags=["insights"])
+
+
+@router.get("/trends")
+async def get_insight_trends(
+    query: str = Query(..., min_length=1),
+    days: int = Query(90, ge=1, le=365),
+    rollups: InsightRollupsBase = Depends(get_insight_rollups),
+):
+    """Daily sentiment, confidence, source count and top trends for a query."""
+    end = datetime.now(timezone.utc).date()
+    start = end - timedelta(days=days - 1)
+
+    return {
+        "query": query,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": await rollups.range(query, start, end),
+    }
+
+
+@router.get("/latest")
+async def get_latest_insight(
+    query: str = Query(..., min_length=1),
+    repository: InsightRepositoryBase = Depends(get_insight_repository),
+):
+    """Most recent saved insight for a query."""
+    insight = await repository.load_latest_for_query(query)
+    if insight is None:
+        raise HTTPException(status_code=404, detail="No insight for this query")
+
+    return insight
@@ -0,0 +1,53 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+
+from app.api.deps import get_entitlements, get_pipeline_runner, require_account
+from app.core.pipeline.runner import PipelineQueueFullError, PipelineRunner
+from app.monetization.entitlements import EntitlementService
+from app.monetization.limits import METRICS, QuotaExceededError
+
+
+router = APIRouter(prefix="/pipeline", tags=["pipeline"])
+
+
+class RunRequest(BaseModel):
+    query: str = Field(..., min_length=1, max_length=500)
+
+
+@router.post("/runs", status_code=202)
+async def submit_run(
+    request: RunRequest,
+    account_id: Optional[str] = Depends(require_account),
+    runner: PipelineRunner = Depends(get_pipeline_runner),
+    entitlements: Optional[EntitlementService] = Depends(get_entitlements),
+):
+    """Queue a pipeline run; poll ``GET /pipeline/runs/{run_id}`` for the result."""
+    # Checked again when the run starts; this refuses it before it queues.
+    if entitlements and account_id:
+        try:
+            for metric in METRICS:
+                await entitlements.enforce(account_id, metric)
+        except QuotaExceededError as exc:
+            raise HTTPException(status_code=429, detail=str(exc))
+
+    try:
+        run = runner.submit(request.query, account_id=account_id)
+    except PipelineQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc))
+
+    return run.to_dict()
+
+
+@router.get("/runs/{run_id}")
+async def get_run(
+    run_id: str,
+    account_id: Optional[str] = Depends(require_account),
+    runner: PipelineRunner = Depends(get_pipeline_runner),
+):
+    run = runner.get(run_id)
+    if run is None or run.account_id != account_id:
+        raise HTTPException(status_code=404, detail="Unknown run")
+
+    return run.to_dict()
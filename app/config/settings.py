@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,12 +11,101 @@ class Settings(BaseSettings):
     api_version: str = "v1"
 
     log_level: str = "INFO"
+    loop_lag_monitor_enabled: bool = True
+    loop_lag_threshold_ms: float = 100.0
+    profile_output_dir: str = "storage/profiles"
+    admin_token: str = ""
+    log_format: str = "text"  # text | json
+    log_sample_rates: Dict[str, float] = {}  # logger prefix -> kept fraction
+    console_progress: bool = True
 
     ollama_base_url: str = "http://localhost:11434"
 
     scheduler_timezone: str = "UTC"
+    scheduler_prewarm: bool = True
+    scheduler_interval_minutes: int = 60
+    scheduler_queries: List[str] = [
+        "Dubai Luxury Residential Real Estate Market Size And Trends Analysis"
+    ]
+    scheduler_account_id: Optional[str] = None  # account billed for scheduled runs
 
     ollama_api_key: str = ""
+    ollama_model: str = "qwen3-vl:235b-instruct-cloud"
+    ollama_timeout: float = 60.0
+
+    ai_routing_enabled: bool = True
+    ai_fast_model: str = "gpt-oss:20b-cloud"
+    ai_fast_timeout: float = 30.0
+    ai_fast_max_documents: int = 4
+    ai_fast_max_tokens: int = 6000
+    ai_min_grounding: float = 0.7
+    ai_breaker_failures: int = 3
+    ai_breaker_reset_seconds: float = 60.0
+
+    search_query_planner: bool = True
+    search_max_per_domain: int = 2
+
+    crawl_backend: str = "local"  # local | queue
+    crawl_workers: int = 4
+    crawl_lease_seconds: float = 120.0
+    crawl_process_workers: int = 0  # 0 parses on the event loop
+    task_queue_path: str = "storage/queue/tasks.db"
+
+    crawl_hedging_enabled: bool = True
+    crawl_timeout_min: float = 5.0
+    crawl_timeout_max: float = 20.0
+    crawl_hedge_after_seconds: float = 8.0  # until a domain has history
+    crawl_hedge_quantile: float = 0.95  # hedge crawls slower than this percentile
+    crawl_max_hedge_ratio: float = 0.1  # latency hedges per crawl, at most
+    # Sites that answer crawlers with 403s; skipped by every crawl tier.
+    crawl_blocked_domains: List[str] = [
+        "constructionweekonline.com",
+        "influencedigest.com",
+        "metropolitan.realestate",
+    ]
+
+    crawl_scheduler_enabled: bool = True
+    crawl_concurrency: int = 4
+    crawl_target_documents: int = 6
+    crawl_min_average_authority: float = 0.5
+    crawl_min_total_chars: int = 6000
+
+    passage_selection_enabled: bool = True
+    passage_max_tokens_per_document: int = 600
+    passage_max_tokens_total: int = 4000
+    prompt_compaction_enabled: bool = True
+
+    corpus_index_enabled: bool = True
+    corpus_index_path: str = "storage/corpus/corpus.db"
+    # Older indexed documents are not used to top up scarce live results
+    # (0 uses none, None has no limit).
+    corpus_index_max_age_days: Optional[int] = 30
+
+    usage_metering_enabled: bool = False
+    usage_db_path: str = "storage/usage/usage.db"
+    usage_flush_seconds: float = 5.0
+    entitlement_cache_seconds: float = 60.0
+    default_plan: str = "free"
+
+    # Reuse the last analysis of a query and only send changed documents.
+    pipeline_incremental: bool = False
+    insight_storage_path: str = "storage/insights"
+    insight_rollups_enabled: bool = True
+    insight_rollups_path: str = "storage/insights/rollups.db"
+    pipeline_memory_budget_mb: int = 64
+    pipeline_spill_dir: Optional[str] = None  # system temp dir by default
+    # Runs submitted through the API, executed in the API process.
+    pipeline_max_concurrent_runs: int = 2
+    pipeline_max_pending_runs: int = 100
+    # Sleep-only providers instead of search/crawl/LLM, for load tests.
+    pipeline_stub_providers: bool = False
+    # X-Api-Key -> account id. Without keys the run endpoints are only served
+    # in stub mode.
+    pipeline_api_keys: Dict[str, str] = {}
+
+    event_backend: str = "none"  # none | memory | sqlite
+    event_store_path: str = "storage/events/events.db"
+    event_store_max_events: int = 10000  # newest events kept in the log
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,177 @@
+import os
+import sys
+import tempfile
+import threading
+import zlib
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+
+from app.utils.urls import domain_of
+
+
+FIELDS = ("url", "title", "content", "published_at", "author", "error")
+
+# Bodies shorter than this are kept as plain UTF-8; compressing them saves
+# too little to pay for the zlib call on every read.
+COMPRESS_MIN_BYTES = 2048
+
+
+class CompactDocument(Mapping):
+    """
+    Read-only, slotted stand-in for a crawled document dict. URL and domain
+    are interned, and the body is held as (optionally zlib-compressed) bytes,
+    either in memory or in the owning store's spill file. ``content`` is
+    decoded on access, so code written against plain dicts keeps working.
+    """
+
+    __slots__ = (
+        "url",
+        "domain",
+        "title",
+        "published_at",
+        "author",
+        "error",
+        "content_length",
+        "_body",
+        "_offset",
+        "_size",
+        "_compressed",
+        "_store",
+        "_extra",
+    )
+
+    def __init__(
+        self,
+        doc: Dict,
+        body: Optional[bytes],
+        compressed: bool,
+        store: "DocumentStore",
+        offset: int = -1,
+        size: int = 0,
+    ):
+        self.url = sys.intern(doc["url"])
+        self.domain = sys.intern(domain_of(doc["url"]))
+        self.title = doc.get("title")
+        self.published_at = doc.get("published_at")
+        self.author = doc.get("author")
+        self.error = doc.get("error")
+        self.content_length = len(doc.get("content") or "")
+        self._body = body
+        self._offset = offset
+        self._size = size
+        self._compressed = compressed
+        self._store = store
+        self._extra = {k: v for k, v in doc.items() if k not in FIELDS} or None
+
+    @property
+    def content(self) -> Optional[str]:
+        body = self._body
+        if body is None:
+            if self._offset < 0:
+                return None
+            body = self._store.read(self._offset, self._size)
+
+        if self._compressed:
+            body = zlib.decompress(body)
+
+        return body.decode("utf-8")
+
+    @property
+    def spilled(self) -> bool:
+        return self._body is None and self._offset >= 0
+
+    def __getitem__(self, key: str):
+        if key in FIELDS:
+            return getattr(self, key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from FIELDS
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(FIELDS) + len(self._extra or ())
+
+    def __repr__(self) -> str:
+        return f"CompactDocument(url={self.url!r}, chars={self.content_length})"
+
+
+def content_length(doc: Mapping) -> int:
+    """Characters of content; a compact document answers without decoding."""
+    if isinstance(doc, CompactDocument):
+        return doc.content_length
+    return len(doc.get("content") or "")
+
+
+class DocumentStore:
+    """
+    Holds the documents of one pipeline run within a memory budget. Bodies
+    are compressed, and once the resident total would exceed
+    ``memory_budget`` bytes further bodies are appended to an anonymous temp
+    file instead. ``close`` releases the file; spilled content is unreadable
+    afterwards.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int,
+        compress_min_bytes: int = COMPRESS_MIN_BYTES,
+        spill_dir: Optional[str] = None,
+    ):
+        self.memory_budget = memory_budget
+        self.compress_min_bytes = compress_min_bytes
+        self.spill_dir = spill_dir
+        self.resident_bytes = 0
+        self.spilled_bytes = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def add(self, doc: Dict) -> CompactDocument:
+        if isinstance(doc, CompactDocument):
+            return doc
+
+        content = doc.get("content")
+        if content is None:
+            return CompactDocument(doc, None, False, self)
+
+        body = content.encode("utf-8")
+        compressed = False
+        if len(body) >= self.compress_min_bytes:
+            packed = zlib.compress(body, 1)
+            if len(packed) < len(body):
+                body, compressed = packed, True
+
+        if self.resident_bytes + len(body) <= self.memory_budget:
+            self.resident_bytes += len(body)
+            return CompactDocument(doc, body, compressed, self)
+
+        offset = self._spill(body)
+        return CompactDocument(doc, None, compressed, self, offset, len(body))
+
+    def read(self, offset: int, size: int) -> bytes:
+        if self._file is None:
+            raise ValueError("Document store is closed")
+
+        return os.pread(self._file.fileno(), size, offset)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _spill(self, body: bytes) -> int:
+        with self._lock:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(
+                    prefix="pipeline-spill-", dir=self.spill_dir
+                )
+
+            offset = self._file.seek(0, os.SEEK_END)
+            self._file.write(body)
+            self._file.flush()
+            self.spilled_bytes += len(body)
+
+        return offset
@@ -1,14 +1,184 @@
+from typing import Optional
+
+from app.config.settings import settings
+from app.core.pipeline.crawl_scheduler import CrawlScheduler
+from app.core.pipeline.passages import PassageSelector
 from app.core.pipeline.pipeline_service import PipelineService
 from app.providers.search.duckduckgo import DuckDuckGoSearchProvider
+from app.providers.search.planner import PlannedSearchProvider
+from app.providers.crawler.base import CrawlProviderBase
 from app.providers.crawler.crawl4ai import Crawl4AIProvider
+from app.providers.crawler.hedged import HedgedCrawlProvider
+from app.providers.crawler.http import HttpCrawlProvider
+from app.providers.crawler.latency import DomainLatencyTracker
+from app.providers.crawler.postprocess import PostProcessPool
+from app.providers.crawler.queued import QueuedCrawlProvider
+from app.providers.ai.compaction import PromptCompactor
+from app.providers.ai.base import AIProviderBase
 from app.providers.ai.ollama import OllamaCloudProvider
+from app.providers.ai.routing import CircuitBreaker, RoutingAIProvider
+from app.data.repositories.base import InsightRollupsBase
 from app.data.repositories.insight_repo import JSONInsightRepository
+from app.data.repositories.corpus_repo import SQLiteCorpusIndex
+from app.data.repositories.rollup_repo import SQLiteInsightRollups
+from app.data.repositories.usage_repo import SQLiteUsageRepository
+from app.events.backends import InMemoryBrokerBackend, SQLiteEventBackend
+from app.events.bus import EventBus
+from app.monetization.entitlements import EntitlementService
+from app.monetization.plans import get_plan
+from app.monetization.usage import UsageMeter
+from app.utils.profiling import run_profiler
+from app.workers.task_queue import SQLiteTaskQueue
+
+
+def build_event_bus() -> Optional[EventBus]:
+    if settings.event_backend == "none":
+        return None
+    if settings.event_backend == "memory":
+        return EventBus(
+            InMemoryBrokerBackend(max_events=settings.event_store_max_events)
+        )
+    if settings.event_backend == "sqlite":
+        return EventBus(
+            SQLiteEventBackend(
+                settings.event_store_path, settings.event_store_max_events
+            )
+        )
+
+    raise ValueError(f"Unknown event backend: {settings.event_backend}")
+
+
+def build_usage_meter() -> Optional[UsageMeter]:
+    if not settings.usage_metering_enabled:
+        return None
+
+    return UsageMeter(
+        SQLiteUsageRepository(settings.usage_db_path),
+        flush_interval=settings.usage_flush_seconds,
+    )
+
+
+def build_entitlements(meter: UsageMeter) -> EntitlementService:
+    return EntitlementService(
+        meter.repository,
+        meter,
+        plan_resolver=lambda account_id: get_plan(settings.default_plan),
+        ttl=settings.entitlement_cache_seconds,
+    )
+
+
+def build_crawl_provider() -> CrawlProviderBase:
+    if settings.crawl_backend == "local":
+        process_pool = (
+            PostProcessPool(settings.crawl_process_workers)
+            if settings.crawl_process_workers > 0
+            else None
+        )
+        browser = Crawl4AIProvider(
+            timeout=int(settings.crawl_timeout_max), process_pool=process_pool
+        )
+
+        if not settings.crawl_hedging_enabled:
+            return browser
+
+        return HedgedCrawlProvider(
+            browser,
+            hedge=HttpCrawlProvider(
+                timeout=settings.crawl_timeout_max, process_pool=process_pool
+            ),
+            tracker=DomainLatencyTracker(
+                default_timeout=settings.crawl_timeout_max,
+                min_timeout=settings.crawl_timeout_min,
+                max_timeout=settings.crawl_timeout_max,
+                default_hedge_after=settings.crawl_hedge_after_seconds,
+                hedge_quantile=settings.crawl_hedge_quantile,
+            ),
+            max_hedge_ratio=settings.crawl_max_hedge_ratio,
+        )
+    if settings.crawl_backend == "queue":
+        # Crawling happens in worker processes (scripts/run_crawl_workers.py).
+        return QueuedCrawlProvider(SQLiteTaskQueue(settings.task_queue_path))
+
+    raise ValueError(f"Unknown crawl backend: {settings.crawl_backend}")
+
+
+def build_ai_provider() -> AIProviderBase:
+    compactor = PromptCompactor() if settings.prompt_compaction_enabled else None
+    strong = OllamaCloudProvider(
+        model=settings.ollama_model,
+        compactor=compactor,
+        timeout=settings.ollama_timeout,
+    )
+
+    if not settings.ai_routing_enabled:
+        return strong
+
+    return RoutingAIProvider(
+        fast=OllamaCloudProvider(
+            model=settings.ai_fast_model,
+            compactor=compactor,
+            timeout=settings.ai_fast_timeout,
+        ),
+        strong=strong,
+        max_fast_documents=settings.ai_fast_max_documents,
+        max_fast_tokens=settings.ai_fast_max_tokens,
+        min_grounding=settings.ai_min_grounding,
+        fast_breaker=CircuitBreaker(
+            settings.ai_breaker_failures, settings.ai_breaker_reset_seconds
+        ),
+        strong_breaker=CircuitBreaker(
+            settings.ai_breaker_failures, settings.ai_breaker_reset_seconds
+        ),
+    )
+
+
+def build_insight_repository(
+    rollups: Optional[InsightRollupsBase] = None,
+) -> JSONInsightRepository:
+    if rollups is None and settings.insight_rollups_enabled:
+        rollups = SQLiteInsightRollups(settings.insight_rollups_path)
+
+    return JSONInsightRepository(settings.insight_storage_path, rollups=rollups)
+
 
+def build_pipeline(
+    usage_meter: Optional[UsageMeter] = None,
+    entitlements: Optional[EntitlementService] = None,
+    insight_repository: Optional[JSONInsightRepository] = None,
+) -> PipelineService:
+    if settings.search_query_planner:
+        search_provider = PlannedSearchProvider(
+            DuckDuckGoSearchProvider(max_results=10, normalize=False)
+        )
+    else:
+        search_provider = DuckDuckGoSearchProvider()
 
-def build_pipeline() -> PipelineService:
     return PipelineService(
-        search_provider=DuckDuckGoSearchProvider(),
-        crawl_provider=Crawl4AIProvider(),
-        ai_provider=OllamaCloudProvider(),
-        insight_repository=JSONInsightRepository(),
+        search_provider=search_provider,
+        crawl_provider=build_crawl_provider(),
+        ai_provider=build_ai_provider(),
+        insight_repository=insight_repository or build_insight_repository(),
+        passage_selector=(
+            PassageSelector() if settings.passage_selection_enabled else None
+        ),
+        corpus_index=(
+            SQLiteCorpusIndex(settings.corpus_index_path)
+            if settings.corpus_index_enabled
+            else None
+        ),
+        index_max_age=(
+            settings.corpus_index_max_age_days * 86400
+            if settings.corpus_index_max_age_days is not None
+            else None
+        ),
+        incremental=settings.pipeline_incremental,
+        crawl_scheduler=(
+            CrawlScheduler() if settings.crawl_scheduler_enabled else None
+        ),
+        event_bus=build_event_bus(),
+        usage_meter=usage_meter,
+        entitlements=entitlements,
+        memory_budget=settings.pipeline_memory_budget_mb * 1024 * 1024,
+        spill_dir=settings.pipeline_spill_dir,
+        run_profiler=run_profiler,
     )
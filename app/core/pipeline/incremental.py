@@ -0,0 +1,52 @@
+from typing import Dict, List, Set, Tuple
+
+from app.utils.text import content_hash
+
+
+def fingerprint_documents(documents: List[Dict]) -> Dict[str, str]:
+    """Map each document URL to a fingerprint of its content."""
+    return {d["url"]: content_hash(d.get("content")) for d in documents}
+
+
+def diff_documents(
+    documents: List[Dict],
+    fingerprints: Dict[str, str],
+    previous_fingerprints: Dict[str, str],
+) -> Tuple[List[Dict], Set[str]]:
+    """
+    Split documents into those that are new or changed since the previous run
+    and the URLs whose content is unchanged.
+    """
+    changed = [
+        d
+        for d in documents
+        if previous_fingerprints.get(d["url"]) != fingerprints[d["url"]]
+    ]
+    unchanged = {
+        url for url, fp in fingerprints.items() if previous_fingerprints.get(url) == fp
+    }
+
+    return changed, unchanged
+
+
+def merge_evidence(
+    previous: List[Dict], updated: List[Dict], keep_urls: Set[str]
+) -> List[Dict]:
+    """
+    Carry over prior evidence for sources that are unchanged, then append the
+    evidence from the update, dropping exact duplicates.
+    """
+    merged: List[Dict] = []
+    seen = set()
+
+    carried = [ev for ev in previous if ev.get("source_url") in keep_urls]
+
+    for ev in carried + list(updated):
+        key = (ev.get("claim"), ev.get("source_url"))
+        if key in seen:
+            continue
+
+        seen.add(key)
+        merged.append(ev)
+
+    return merged
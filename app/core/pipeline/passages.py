@@ -0,0 +1,196 @@
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+from app.config.settings import settings
+from app.providers.search.utils import REAL_ESTATE_KEYWORDS
+from app.utils.text import estimate_tokens, tokenize
+
+
+logger = logging.getLogger(__name__)
+
+PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+# The user query is repeated so its terms outweigh the generic vocabulary.
+QUERY_WEIGHT = 3
+
+
+def bm25_scores(
+    corpus: List[List[str]], query: List[str], k1: float = 1.5, b: float = 0.75
+) -> List[float]:
+    """
+    Okapi BM25 with the Lucene IDF, which stays positive even when a term
+    occurs in most passages (common when a page is split into few passages).
+    """
+    doc_freq: Counter = Counter()
+    for tokens in corpus:
+        doc_freq.update(set(tokens))
+
+    total = len(corpus)
+    avg_len = sum(len(tokens) for tokens in corpus) / total
+    query_freq = Counter(query)
+    idf = {
+        term: math.log(1 + (total - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+        for term in query_freq
+        if doc_freq[term]
+    }
+
+    scores: List[float] = []
+    for tokens in corpus:
+        term_freq = Counter(tokens)
+        norm = k1 * (1 - b + b * len(tokens) / avg_len)
+        score = 0.0
+        for term, weight in idf.items():
+            tf = term_freq.get(term)
+            if tf:
+                score += query_freq[term] * weight * tf * (k1 + 1) / (tf + norm)
+        scores.append(score)
+
+    return scores
+
+
+class PassageSelector:
+    """
+    Keeps only the passages of each crawled document that are relevant to the
+    query, ranked with BM25 and packed into per-document and global token
+    budgets. Each selected passage keeps the URL of the document it came from.
+    """
+
+    def __init__(
+        self,
+        max_tokens_per_document: int = settings.passage_max_tokens_per_document,
+        max_tokens_total: int = settings.passage_max_tokens_total,
+        min_passage_chars: int = 200,
+        max_passage_chars: int = 1200,
+        vocabulary: Optional[List[str]] = None,
+    ):
+        self.max_tokens_per_document = max_tokens_per_document
+        self.max_tokens_total = max_tokens_total
+        self.min_passage_chars = min_passage_chars
+        self.max_passage_chars = max_passage_chars
+        self.vocabulary_tokens = sorted(
+            {t for kw in (vocabulary or REAL_ESTATE_KEYWORDS) for t in tokenize(kw)}
+        )
+
+    def split(self, content: str) -> List[str]:
+        """Split markdown into paragraph-sized passages."""
+        passages: List[str] = []
+        buffer = ""
+
+        for paragraph in PARAGRAPH_SPLIT.split(content or ""):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+
+            if len(paragraph) > self.max_passage_chars:
+                if buffer:
+                    passages.append(buffer)
+                    buffer = ""
+                passages.extend(self._split_long(paragraph))
+                continue
+
+            buffer = f"{buffer}\n\n{paragraph}" if buffer else paragraph
+
+            if len(buffer) >= self.min_passage_chars:
+                passages.append(buffer)
+                buffer = ""
+
+        if buffer:
+            passages.append(buffer)
+
+        return passages
+
+    def _split_long(self, paragraph: str) -> List[str]:
+        chunks: List[str] = []
+        chunk = ""
+
+        for sentence in SENTENCE_SPLIT.split(paragraph):
+            if chunk and len(chunk) + len(sentence) + 1 > self.max_passage_chars:
+                chunks.append(chunk)
+                chunk = ""
+            chunk = f"{chunk} {sentence}" if chunk else sentence
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def select(self, query: str, documents: List[Dict]) -> List[Dict]:
+        """
+        Return copies of ``documents`` whose ``content`` holds only the
+        selected passages, plus a ``passages`` list of
+        ``{"text", "score", "source_url"}``. Documents without any relevant
+        passage are dropped.
+        """
+        candidates = []  # (doc index, passage position, text, tokens)
+
+        for doc_index, doc in enumerate(documents):
+            for position, text in enumerate(self.split(doc.get("content") or "")):
+                tokens = tokenize(text)
+                if tokens:
+                    candidates.append((doc_index, position, text, tokens))
+
+        if not candidates:
+            return []
+
+        query_tokens = tokenize(query) * QUERY_WEIGHT + self.vocabulary_tokens
+        scores = bm25_scores([c[3] for c in candidates], query_tokens)
+
+        ranked = sorted(zip(candidates, scores), key=lambda item: item[1], reverse=True)
+
+        doc_budget: Dict[int, int] = {}
+        total_tokens = 0
+        chosen: Dict[int, List] = {}
+
+        for (doc_index, position, text, _), score in ranked:
+            if score <= 0:
+                break
+
+            cost = estimate_tokens(text)
+            if total_tokens + cost > self.max_tokens_total:
+                continue
+            if doc_budget.get(doc_index, 0) + cost > self.max_tokens_per_document:
+                continue
+
+            doc_budget[doc_index] = doc_budget.get(doc_index, 0) + cost
+            total_tokens += cost
+            chosen.setdefault(doc_index, []).append((position, text, float(score)))
+
+        selected: List[Dict] = []
+
+        for doc_index, doc in enumerate(documents):
+            if doc_index not in chosen:
+                continue
+
+            # Restore reading order so passages keep their original context.
+            passages = sorted(chosen[doc_index])
+            selected.append(
+                {
+                    **doc,
+                    "content": "\n\n".join(text for _, text, _ in passages),
+                    "passages": [
+                        {
+                            "text": text,
+                            "score": round(score, 3),
+                            "source_url": doc["url"],
+                        }
+                        for _, text, score in passages
+                    ],
+                }
+            )
+
+        original_tokens = sum(estimate_tokens(d.get("content")) for d in documents)
+        logger.info(
+            "Passage selection | docs=%d->%d | passages=%d/%d | tokens=%d->%d",
+            len(documents),
+            len(selected),
+            sum(len(p) for p in chosen.values()),
+            len(candidates),
+            original_tokens,
+            total_tokens,
+        )
+
+        return selected
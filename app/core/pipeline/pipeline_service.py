@@ -1,13 +1,40 @@
-from typing import List, Dict
+import time
+from contextlib import nullcontext
+from typing import List, Dict, Optional, Tuple
 
 from app.core.pipeline.interfaces import (
     SearchProvider,
     CrawlProvider,
     AIProvider,
 )
-from app.data.repositories.base import InsightRepositoryBase
+from app.core.pipeline.crawl_scheduler import CrawlScheduler
+from app.core.pipeline.documents import DocumentStore
+from app.core.pipeline.incremental import (
+    diff_documents,
+    fingerprint_documents,
+    merge_evidence,
+)
+from app.core.pipeline.passages import PassageSelector
+from app.data.repositories.base import CorpusIndexBase, InsightRepositoryBase
+from app.events.bus import EventBus
+from app.monetization.entitlements import EntitlementService
+from app.monetization.limits import CRAWLED_PAGES, LLM_TOKENS, METRICS, PIPELINE_RUNS
+from app.monetization.usage import UsageMeter
+from app.events.events import (
+    AnalysisCompleted,
+    DocumentCrawled,
+    Event,
+    InsightSaved,
+    SearchCompleted,
+)
 from app.trust.scoring import calculate_confidence
 from app.trust.explainer import explain_confidence
+from app.utils.profiling import RunProfiler
+from app.utils.text import estimate_tokens
+
+
+# Confidence is only scored once at least this many documents were collected.
+MIN_DOCUMENTS = 5
 
 
 class PipelineService:
@@ -17,24 +44,103 @@ class PipelineService:
         crawl_provider: CrawlProvider,
         ai_provider: AIProvider,
         insight_repository: InsightRepositoryBase,
+        passage_selector: Optional[PassageSelector] = None,
+        corpus_index: Optional[CorpusIndexBase] = None,
+        index_max_age: Optional[float] = None,
+        incremental: bool = False,
+        crawl_scheduler: Optional[CrawlScheduler] = None,
+        event_bus: Optional[EventBus] = None,
+        usage_meter: Optional[UsageMeter] = None,
+        entitlements: Optional[EntitlementService] = None,
+        memory_budget: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        run_profiler: Optional[RunProfiler] = None,
     ):
         self.search_provider = search_provider
         self.crawl_provider = crawl_provider
         self.ai_provider = ai_provider
         self.insight_repository = insight_repository
+        self.passage_selector = passage_selector
+        self.corpus_index = corpus_index
+        # Seconds since crawl after which indexed documents are not used to
+        # top up a run; None accepts any age.
+        self.index_max_age = index_max_age
+        self.incremental = incremental
+        self.crawl_scheduler = crawl_scheduler
+        self.event_bus = event_bus
+        self.usage_meter = usage_meter
+        # Runs for an account are refused once any of its daily quotas is used up.
+        self.entitlements = entitlements
+        # Bytes of document bodies kept in memory per run before spilling to
+        # disk; None keeps crawled documents as plain dicts.
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.run_profiler = run_profiler
+
+    async def run(
+        self,
+        query: str,
+        incremental: Optional[bool] = None,
+        account_id: Optional[str] = None,
+    ) -> Dict:
+        if incremental is None:
+            incremental = self.incremental
+
+        store = (
+            DocumentStore(self.memory_budget, spill_dir=self.spill_dir)
+            if self.memory_budget is not None
+            else None
+        )
+
+        profile = self.run_profiler.profile() if self.run_profiler else nullcontext()
+
+        try:
+            async with profile:
+                return await self._run(query, incremental, account_id, store)
+        finally:
+            if store:
+                store.close()
+
+    async def _run(
+        self,
+        query: str,
+        incremental: bool,
+        account_id: Optional[str],
+        store: Optional[DocumentStore],
+    ) -> Dict:
+        if self.entitlements and account_id:
+            for metric in METRICS:
+                await self.entitlements.enforce(account_id, metric)
+
+        self._meter(account_id, PIPELINE_RUNS, 1)
 
-    async def run(self, query: str) -> Dict:
         urls = await self.search_provider.search(query)
+        await self._publish(SearchCompleted(query=query, urls=urls))
 
-        documents: List[Dict] = []
+        documents = await self._crawl(urls, store)
+        for doc in documents:
+            await self._publish(
+                DocumentCrawled(
+                    query=query,
+                    url=doc["url"],
+                    title=doc.get("title"),
+                    content=doc.get("content"),
+                    published_at=doc.get("published_at"),
+                    author=doc.get("author"),
+                )
+            )
 
-        for url in urls:
-            doc = await self.crawl_provider.crawl(url)
+        from_index = 0
+        if self.corpus_index:
+            await self.corpus_index.add(documents)
 
-            if doc.get("error") or not doc.get("content"):
-                continue
+            if len(documents) < MIN_DOCUMENTS:
+                from_index = await self._supplement_from_index(query, documents)
 
-            documents.append(doc)
+        self._meter(account_id, CRAWLED_PAGES, len(documents) - from_index)
+        # Indexed documents give the model context but are not new
+        # corroboration, so confidence is scored on the live crawl only.
+        live = [d for d in documents if not d.get("from_index")]
 
         if not documents:
             return {
@@ -42,10 +148,47 @@ class PipelineService:
                 "documents_collected": 0,
             }
 
-        insights = await self.ai_provider.analyze(documents)
+        fingerprints = fingerprint_documents(documents)
+        previous = (
+            await self.insight_repository.load_latest_for_query(query)
+            if incremental
+            else None
+        )
+
+        if (
+            previous
+            and previous.get("fingerprints")
+            and "error" not in previous.get("insights", {"error": None})
+        ):
+            insights, analyzed = await self._analyze_incremental(
+                query, documents, fingerprints, previous, account_id
+            )
+            mode = "incremental" if analyzed else "reused"
+        else:
+            insights = await self._analyze(
+                self._select_passages(query, documents), account_id
+            )
+            analyzed, mode = len(documents), "full"
+
+        if "error" in insights:
+            # A failed analysis must not overwrite the last good insight.
+            return {
+                "query": query,
+                "error": insights["error"],
+                "documents_collected": len(documents),
+            }
+
+        await self._publish(
+            AnalysisCompleted(
+                query=query,
+                insights=insights,
+                documents_analyzed=analyzed,
+                analysis_mode=mode,
+            )
+        )
 
-        if len(documents) >= 5:  # Only calculate confidence if we have enough documents
-            confidence = calculate_confidence(documents, insights)
+        if len(live) >= MIN_DOCUMENTS:
+            confidence = calculate_confidence(live, insights)
             confidence_explanation = explain_confidence(confidence)
 
             insights["confidence"] = confidence
@@ -53,15 +196,171 @@ class PipelineService:
 
         result = {
             "query": query,
-            "documents_collected": len(documents),
+            "documents_collected": len(live),
+            "documents_from_index": from_index,
+            "documents_analyzed": analyzed,
+            "analysis_mode": mode,
             "insights": insights,
             "sources": [d["url"] for d in documents],
+            "fingerprints": fingerprints,
         }
 
         await self.insight_repository.save(result)
+        await self._publish(InsightSaved(query=query, result=result))
 
         return result
 
+    def _meter(self, account_id: Optional[str], metric: str, amount: int) -> None:
+        if self.usage_meter and account_id:
+            self.usage_meter.record(account_id, metric, amount)
+
+    async def _analyze(
+        self,
+        documents: List[Dict],
+        account_id: Optional[str],
+        previous: Optional[Dict] = None,
+    ) -> Dict:
+        self._meter(
+            account_id,
+            LLM_TOKENS,
+            sum(estimate_tokens(d.get("content") or "") for d in documents),
+        )
+
+        if previous is not None and hasattr(self.ai_provider, "update"):
+            return await self.ai_provider.update(previous, documents)
+
+        return await self.ai_provider.analyze(documents)
+
+    async def _publish(self, event: Event) -> None:
+        if self.event_bus:
+            await self.event_bus.publish(event)
+
+    async def _crawl(
+        self, urls: List[str], store: Optional[DocumentStore] = None
+    ) -> List[Dict]:
+        """
+        Crawl the URLs and keep the usable documents. With a store, each
+        document is compacted as soon as it arrives, so the raw dicts of a
+        large run are never all held at once.
+        """
+
+        async def crawl(url: str) -> Dict:
+            doc = await self.crawl_provider.crawl(url)
+            if store is None or doc.get("error") or not doc.get("content"):
+                return doc
+            return store.add(doc)
+
+        known = (
+            await self.corpus_index.lookup(urls)
+            if self.crawl_scheduler and self.corpus_index
+            else {}
+        )
+
+        if hasattr(self.crawl_provider, "crawl_many"):
+            # Batch providers fan the URLs out to their own workers; the
+            # scheduler only decides the order they are enqueued in.
+            if self.crawl_scheduler:
+                urls = self.crawl_scheduler.rank(urls, known)
+            crawled = await self.crawl_provider.crawl_many(urls)
+            return [
+                store.add(d) if store else d
+                for d in crawled
+                if not d.get("error") and d.get("content")
+            ]
+
+        if self.crawl_scheduler:
+            return await self.crawl_scheduler.crawl(urls, crawl, known)
+
+        documents: List[Dict] = []
+
+        for url in urls:
+            doc = await crawl(url)
+
+            if doc.get("error") or not doc.get("content"):
+                continue
+
+            documents.append(doc)
+
+        return documents
+
+    def _select_passages(self, query: str, documents: List[Dict]) -> List[Dict]:
+        if not self.passage_selector:
+            return documents
+
+        # Fall back to full documents if nothing scored as relevant.
+        return self.passage_selector.select(query, documents) or documents
+
+    async def _analyze_incremental(
+        self,
+        query: str,
+        documents: List[Dict],
+        fingerprints: Dict[str, str],
+        previous: Dict,
+        account_id: Optional[str] = None,
+    ) -> Tuple[Dict, int]:
+        """
+        Send only new or changed documents, together with the previous
+        insight, to the AI provider and merge the evidence lists. Returns the
+        insights and the number of documents that were analyzed.
+        """
+        prior = {
+            key: value
+            for key, value in previous["insights"].items()
+            if key not in ("confidence", "confidence_explanation")
+        }
+        changed, unchanged = diff_documents(
+            documents, fingerprints, previous["fingerprints"]
+        )
+
+        if not changed:
+            prior["evidence"] = merge_evidence(prior.get("evidence", []), [], unchanged)
+            return prior, 0
+
+        analysis_documents = self._select_passages(query, changed)
+
+        insights = await self._analyze(analysis_documents, account_id, prior)
+
+        if "error" not in insights:
+            insights["evidence"] = merge_evidence(
+                prior.get("evidence", []), insights.get("evidence", []), unchanged
+            )
+
+        return insights, len(changed)
+
+    async def _supplement_from_index(self, query: str, documents: List[Dict]) -> int:
+        """Top up scarce live results with previously crawled documents."""
+        seen = {d["url"] for d in documents}
+        cutoff = (
+            time.time() - self.index_max_age if self.index_max_age is not None else None
+        )
+        added = 0
+
+        for doc in await self.corpus_index.search(query, limit=MIN_DOCUMENTS * 2):
+            if len(documents) >= MIN_DOCUMENTS:
+                break
+            if doc["url"] in seen:
+                continue
+            if cutoff is not None and (doc.get("crawled_at") or 0) <= cutoff:
+                continue
+
+            documents.append({**doc, "from_index": True})
+            seen.add(doc["url"])
+            added += 1
+
+        return added
+
+    async def warmup(self) -> None:
+        """Load provider dependencies up front (used by long-lived processes)."""
+        for provider in (self.search_provider, self.crawl_provider, self.ai_provider):
+            if hasattr(provider, "warmup"):
+                await provider.warmup()
+
     async def close(self):
         if hasattr(self.crawl_provider, "close"):
             await self.crawl_provider.close()
+        if hasattr(self.corpus_index, "close"):
+            self.corpus_index.close()
+        if self.event_bus:
+            await self.event_bus.stop()
+            if hasattr(self.event_bus.backend, "close"):
+                self.event_bus.backend.close()
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.core.pipeline.pipeline_service import PipelineService
+
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class PipelineQueueFullError(Exception):
+    pass
+
+
+class PipelineRun:
+    def __init__(self, query: str, account_id: Optional[str] = None):
+        self.run_id = uuid.uuid4().hex
+        self.query = query
+        self.account_id = account_id
+        self.status = QUEUED
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "run_id": self.run_id,
+            "query": self.query,
+            "status": self.status,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+        }
+
+
+class PipelineRunner:
+    """
+    Runs submitted queries in the background of the API process, at most
+    ``max_concurrent`` at a time. Submissions beyond ``max_pending`` waiting
+    runs are refused so overload surfaces as errors instead of unbounded
+    memory. Only the most recent ``history`` runs are kept for lookups.
+    """
+
+    def __init__(
+        self,
+        pipeline: PipelineService,
+        max_concurrent: int = 2,
+        max_pending: int = 100,
+        history: int = 500,
+    ):
+        self.pipeline = pipeline
+        self.max_pending = max_pending
+        self.history = history
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._runs: "OrderedDict[str, PipelineRun]" = OrderedDict()
+        self._tasks: Dict[asyncio.Task, PipelineRun] = {}
+        self._pending = 0
+
+    def submit(self, query: str, account_id: Optional[str] = None) -> PipelineRun:
+        if self._pending >= self.max_pending:
+            raise PipelineQueueFullError(
+                f"{self._pending} pipeline runs already waiting"
+            )
+
+        run = PipelineRun(query, account_id)
+        self._runs[run.run_id] = run
+        while len(self._runs) > self.history:
+            self._runs.popitem(last=False)
+
+        self._pending += 1
+        self._tasks[asyncio.create_task(self._execute(run))] = run
+        return run
+
+    def get(self, run_id: str) -> Optional[PipelineRun]:
+        return self._runs.get(run_id)
+
+    async def close(self) -> None:
+        tasks = dict(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Tasks cancelled before their first step never ran _execute.
+        for run in tasks.values():
+            if run.finished_at is None:
+                run.status, run.error = FAILED, "Cancelled"
+                run.finished_at = time.time()
+        self._pending = 0
+
+        await self.pipeline.close()
+
+    async def _execute(self, run: PipelineRun) -> None:
+        try:
+            async with self._slots:
+                self._pending -= 1
+                run.status = RUNNING
+                result = await self.pipeline.run(run.query, account_id=run.account_id)
+
+            run.result = result
+            run.error = result.get("error")
+            run.status = FAILED if run.error else DONE
+        except asyncio.CancelledError:
+            run.status, run.error = FAILED, "Cancelled"
+            raise
+        except Exception as exc:
+            logger.exception("Pipeline run failed | run=%s", run.run_id)
+            run.status, run.error = FAILED, str(exc)
+        finally:
+            run.finished_at = time.time()
+            self._tasks.pop(asyncio.current_task(), None)
@@ -0,0 +1,78 @@
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+from app.core.pipeline.pipeline_service import PipelineService
+from app.data.repositories.base import InsightRepositoryBase
+from app.providers.ai.base import AIProviderBase
+from app.providers.crawler.base import CrawlProviderBase
+from app.providers.search.base import SearchProviderBase
+
+
+class StubSearchProvider(SearchProviderBase):
+    def __init__(self, results: int = 6, latency: float = 0.02):
+        self.results = results
+        self.latency = latency
+
+    async def search(self, query: str) -> List[str]:
+        await asyncio.sleep(self.latency)
+        slug = hashlib.sha1(query.encode("utf-8")).hexdigest()[:8]
+        return [f"https://stub{i}.test/{slug}" for i in range(self.results)]
+
+
+class StubCrawlProvider(CrawlProviderBase):
+    def __init__(self, latency: float = 0.05, paragraphs: int = 20):
+        self.latency = latency
+        self.paragraphs = paragraphs
+
+    async def crawl(self, url: str) -> Dict:
+        await asyncio.sleep(self.latency)
+        content = "\n\n".join(
+            f"Apartment prices in Dubai Marina rose {i % 15}% year on year, "
+            f"while rental yields held near {5 + i % 4}% ({url})."
+            for i in range(self.paragraphs)
+        )
+        return {
+            "url": url,
+            "title": f"Stub report {url.rsplit('/', 2)[-2]}",
+            "content": content,
+            "published_at": None,
+            "author": None,
+            "error": None,
+        }
+
+
+class StubAIProvider(AIProviderBase):
+    def __init__(self, latency: float = 0.2):
+        self.latency = latency
+
+    async def analyze(self, documents: List[Dict]) -> Dict:
+        await asyncio.sleep(self.latency)
+        return {
+            "summary": f"Stub analysis of {len(documents)} documents.",
+            "key_trends": ["prices rising", "stable yields"],
+            "market_sentiment": "positive",
+            "evidence": [
+                {"claim": "Prices rose year on year", "source_url": d["url"]}
+                for d in documents[:3]
+            ],
+        }
+
+
+def build_stub_pipeline(
+    insight_repository: InsightRepositoryBase,
+    latency: float = 0.05,
+    documents: int = 6,
+    ai_latency: Optional[float] = None,
+) -> PipelineService:
+    """
+    Pipeline with network-free providers that only sleep, for load tests and
+    local development. Everything after the providers (scoring, storage,
+    rollups) is the real code.
+    """
+    return PipelineService(
+        search_provider=StubSearchProvider(documents, latency),
+        crawl_provider=StubCrawlProvider(latency),
+        ai_provider=StubAIProvider(latency * 4 if ai_latency is None else ai_latency),
+        insight_repository=insight_repository,
+    )
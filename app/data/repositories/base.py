@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 
 
 class InsightRepositoryBase(ABC):
@@ -12,3 +13,54 @@ class InsightRepositoryBase(ABC):
     async def load_latest(self) -> Optional[Dict]:
         """Load the latest insight data from the repository."""
         raise NotImplementedError
+
+    async def load_latest_for_query(self, query: str) -> Optional[Dict]:
+        """
+        Load the most recent insight data saved for the given query.
+        Repositories that do not keep per-query results return None, which
+        makes every run a full analysis.
+        """
+        return None
+
+
+class CorpusIndexBase(ABC):
+    @abstractmethod
+    async def add(self, documents: List[Dict]) -> None:
+        """Index crawled documents, replacing earlier versions of the same URL."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Return the indexed documents most relevant to the query."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lookup(self, urls: List[str]) -> Dict[str, Dict]:
+        """Return the indexed documents for whichever of the URLs are known."""
+        raise NotImplementedError
+
+
+class UsageRepositoryBase(ABC):
+    @abstractmethod
+    async def add(self, counts: Dict[Tuple[str, str, str], int]) -> None:
+        """Add a batch of usage counts keyed by (account_id, metric, period)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def totals(
+        self, account_ids: List[str], period: str
+    ) -> Dict[str, Dict[str, int]]:
+        """Return recorded usage per account and metric for the period."""
+        raise NotImplementedError
+
+
+class InsightRollupsBase(ABC):
+    @abstractmethod
+    async def update(self, result: Dict, saved_at: Optional[datetime] = None) -> None:
+        """Fold a saved pipeline result into its query's rollup for that day."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def range(self, query: str, start: date, end: date) -> List[Dict]:
+        """Daily rollups for the query between start and end, inclusive."""
+        raise NotImplementedError
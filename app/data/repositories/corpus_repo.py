@@ -0,0 +1,299 @@
+import asyncio
+import logging
+import math
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Union
+
+from app.data.repositories.base import CorpusIndexBase
+from app.utils.dates import restore_date, serialize_date
+from app.utils.ranking import reciprocal_rank_fusion
+from app.utils.text import content_hash, tokenize
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on LSH bucket hits re-ranked by exact cosine similarity.
+MAX_NEIGHBOURS = 1000
+# LSH neighbours below this cosine similarity are treated as bucket noise.
+MIN_SIMILARITY = 0.1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT,
+    content TEXT NOT NULL,
+    published_at TEXT,
+    author TEXT,
+    content_hash TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    vector BLOB NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(title, content);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    tbl INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    doc_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lsh_lookup ON lsh_buckets (tbl, bucket);
+CREATE INDEX IF NOT EXISTS lsh_doc ON lsh_buckets (doc_id);
+"""
+
+
+class HashingVectorizer:
+    """
+    Signed feature-hashing vectors (sublinear TF, L2-normalised) so documents
+    can be embedded locally without a fitted vocabulary or model.
+    """
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+
+    def transform(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+
+        for token, count in Counter(tokenize(text)).items():
+            digest = zlib.crc32(token.encode("utf-8"))
+            sign = 1.0 if digest & 1 else -1.0
+            vector[(digest >> 1) % self.dimensions] += sign * (1 + math.log(count))
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm:
+            vector = [v / norm for v in vector]
+
+        return vector
+
+
+class RandomHyperplaneLSH:
+    """
+    Cosine-similarity LSH: each table hashes a vector to a bucket made of the
+    sign bits of its projection onto ``bits`` pseudo-random hyperplanes.
+    Hyperplanes are derived deterministically so buckets stay valid on disk.
+    """
+
+    def __init__(self, dimensions: int, tables: int = 8, bits: int = 12):
+        self.tables = tables
+        self.bits = bits
+        self.planes = [
+            [
+                [
+                    1.0 if zlib.crc32(f"{t}:{b}:{d}".encode()) & 1 else -1.0
+                    for d in range(dimensions)
+                ]
+                for b in range(bits)
+            ]
+            for t in range(tables)
+        ]
+
+    def buckets(self, vector: List[float]) -> List[int]:
+        nonzero = [(d, v) for d, v in enumerate(vector) if v]
+        result = []
+
+        for table in self.planes:
+            bucket = 0
+            for bit, plane in enumerate(table):
+                if sum(plane[d] * v for d, v in nonzero) >= 0:
+                    bucket |= 1 << bit
+            result.append(bucket)
+
+        return result
+
+
+class SQLiteCorpusIndex(CorpusIndexBase):
+    """
+    Persistent index of every crawled document: an FTS5 full-text table plus
+    an LSH approximate-nearest-neighbour index over hashing vectors, both in
+    a single SQLite file. Search fuses the two rankings.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "storage/corpus/corpus.db",
+        dimensions: int = 256,
+        tables: int = 8,
+        bits: int = 12,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.vectorizer = HashingVectorizer(dimensions)
+        self.lsh = RandomHyperplaneLSH(dimensions, tables, bits)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    async def add(self, documents: List[Dict]) -> None:
+        await asyncio.to_thread(self._add, documents)
+
+    async def search(self, query: str, limit: int = 10) -> List[Dict]:
+        return await asyncio.to_thread(self._search, query, limit)
+
+    async def lookup(self, urls: List[str]) -> Dict[str, Dict]:
+        return await asyncio.to_thread(self._lookup, urls)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _add(self, documents: List[Dict]) -> None:
+        now = time.time()
+        indexed = 0
+
+        with self._lock, self._conn:
+            for doc in documents:
+                content = doc.get("content")
+                if not doc.get("url") or not content:
+                    continue
+
+                fingerprint = content_hash(content)
+                row = self._conn.execute(
+                    "SELECT id, content_hash FROM documents WHERE url = ?",
+                    (doc["url"],),
+                ).fetchone()
+
+                if row and row["content_hash"] == fingerprint:
+                    self._conn.execute(
+                        "UPDATE documents SET crawled_at = ? WHERE id = ?",
+                        (now, row["id"]),
+                    )
+                    continue
+
+                if row:
+                    self._delete(row["id"])
+
+                vector = self.vectorizer.transform(
+                    f"{doc.get('title') or ''} {content}"
+                )
+                cursor = self._conn.execute(
+                    "INSERT INTO documents (url, title, content, published_at, author, "
+                    "content_hash, crawled_at, vector) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        doc["url"],
+                        doc.get("title"),
+                        content,
+                        serialize_date(doc.get("published_at")),
+                        doc.get("author"),
+                        fingerprint,
+                        now,
+                        array("f", vector).tobytes(),
+                    ),
+                )
+                doc_id = cursor.lastrowid
+
+                self._conn.execute(
+                    "INSERT INTO documents_fts (rowid, title, content) VALUES (?, ?, ?)",
+                    (doc_id, doc.get("title") or "", content),
+                )
+                self._conn.executemany(
+                    "INSERT INTO lsh_buckets (tbl, bucket, doc_id) VALUES (?, ?, ?)",
+                    [
+                        (table, bucket, doc_id)
+                        for table, bucket in enumerate(self.lsh.buckets(vector))
+                    ],
+                )
+                indexed += 1
+
+        logger.info("Corpus index updated | new_or_changed=%d", indexed)
+
+    def _delete(self, doc_id: int) -> None:
+        self._conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+        self._conn.execute("DELETE FROM lsh_buckets WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+    def _search(self, query: str, limit: int) -> List[Dict]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        candidates = limit * 4
+
+        with self._lock:
+            text_ranked = [
+                row["rowid"]
+                for row in self._conn.execute(
+                    "SELECT rowid FROM documents_fts WHERE documents_fts MATCH ? "
+                    "ORDER BY bm25(documents_fts) LIMIT ?",
+                    (" OR ".join(f'"{t}"' for t in set(tokens)), candidates),
+                )
+            ]
+
+            query_vector = self.vectorizer.transform(query)
+            buckets = self.lsh.buckets(query_vector)
+            clause = " OR ".join("(tbl = ? AND bucket = ?)" for _ in buckets)
+            params = [value for pair in enumerate(buckets) for value in pair]
+            neighbour_ids = [
+                row["doc_id"]
+                for row in self._conn.execute(
+                    f"SELECT DISTINCT doc_id FROM lsh_buckets WHERE {clause} LIMIT ?",
+                    [*params, MAX_NEIGHBOURS],
+                )
+            ]
+
+            vector_ranked = self._rank_by_cosine(query_vector, neighbour_ids)[
+                :candidates
+            ]
+
+            top_ids = reciprocal_rank_fusion([text_ranked, vector_ranked])[:limit]
+            rows = {
+                row["id"]: row
+                for row in self._conn.execute(
+                    "SELECT id, url, title, content, published_at, author, crawled_at "
+                    f"FROM documents WHERE id IN ({','.join('?' * len(top_ids))})",
+                    top_ids,
+                )
+            }
+
+        return [_row_to_document(rows[doc_id]) for doc_id in top_ids if doc_id in rows]
+
+    def _lookup(self, urls: List[str]) -> Dict[str, Dict]:
+        if not urls:
+            return {}
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, url, title, content, published_at, author, crawled_at "
+                f"FROM documents WHERE url IN ({','.join('?' * len(urls))})",
+                list(urls),
+            ).fetchall()
+
+        return {row["url"]: _row_to_document(row) for row in rows}
+
+    def _rank_by_cosine(
+        self, query_vector: List[float], doc_ids: List[int]
+    ) -> List[int]:
+        if not doc_ids:
+            return []
+
+        scored = []
+        for row in self._conn.execute(
+            f"SELECT id, vector FROM documents WHERE id IN ({','.join('?' * len(doc_ids))})",
+            doc_ids,
+        ):
+            vector = array("f")
+            vector.frombytes(row["vector"])
+            similarity = sum(a * b for a, b in zip(query_vector, vector))
+            if similarity >= MIN_SIMILARITY:
+                scored.append((similarity, row["id"]))
+
+        return [doc_id for _, doc_id in sorted(scored, reverse=True)]
+
+
+def _row_to_document(row: sqlite3.Row) -> Dict:
+    return {
+        "url": row["url"],
+        "title": row["title"],
+        "content": row["content"],
+        "published_at": restore_date(row["published_at"]),
+        "author": row["author"],
+        "crawled_at": row["crawled_at"],
+        "error": None,
+    }
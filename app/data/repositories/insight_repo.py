@@ -1,18 +1,37 @@
+import hashlib
 import json
+import os
+import re
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional
 
-from app.data.repositories.base import InsightRepositoryBase
+from app.data.repositories.base import InsightRepositoryBase, InsightRollupsBase
+from app.utils.text import query_key
 
 
 class JSONInsightRepository(InsightRepositoryBase):
-    def __init__(self, base_path: str = "storage/insights"):
+    def __init__(
+        self,
+        base_path: str = "storage/insights",
+        rollups: Optional[InsightRollupsBase] = None,
+    ):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.queries_path = self.base_path / "queries"
+        self.queries_path.mkdir(exist_ok=True)
+        # Per-query daily aggregates, kept up to date on every save.
+        self.rollups = rollups
 
     async def save(self, data: Dict) -> None:
-        file_path = self.base_path / "latest.json"
-        file_path.write_text(json.dumps(data, indent=2))
+        payload = json.dumps(data, indent=2)
+        _write_atomic(self.base_path / "latest.json", payload)
+
+        if data.get("query"):
+            _write_atomic(self._query_path(data["query"]), payload)
+
+            if self.rollups:
+                await self.rollups.update(data)
 
     async def load_latest(self) -> Optional[Dict]:
         file_base = self.base_path / "latest.json"
@@ -21,3 +40,31 @@ class JSONInsightRepository(InsightRepositoryBase):
             return None
 
         return json.loads(file_base.read_text())
+
+    async def load_latest_for_query(self, query: str) -> Optional[Dict]:
+        file_path = self._query_path(query)
+
+        if not file_path.exists():
+            return None
+
+        return json.loads(file_path.read_text())
+
+    def _query_path(self, query: str) -> Path:
+        normalized = query_key(query)
+        slug = re.sub(r"[^a-z0-9]+", "-", normalized).strip("-")[:60]
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:10]
+
+        return self.queries_path / f"{slug}-{digest}.json"
+
+
+def _write_atomic(path: Path, payload: str) -> None:
+    # Readers in other API workers must never see a truncated file, so the
+    # payload is written next to the target and renamed over it.
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
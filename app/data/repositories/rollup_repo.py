@@ -0,0 +1,155 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import Counter
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from app.data.repositories.base import InsightRollupsBase
+from app.utils.text import query_key
+
+
+SENTIMENTS = ("positive", "neutral", "negative")
+
+# Trend counters kept per day; the long tail is dropped on write.
+MAX_TRENDS_PER_DAY = 50
+
+# Seconds a writer waits for another process's transaction before failing.
+BUSY_TIMEOUT = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS insight_rollups (
+    query_key TEXT NOT NULL,
+    day TEXT NOT NULL,
+    query TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    positive INTEGER NOT NULL,
+    neutral INTEGER NOT NULL,
+    negative INTEGER NOT NULL,
+    confidence_sum REAL NOT NULL,
+    confidence_runs INTEGER NOT NULL,
+    sources_sum INTEGER NOT NULL,
+    trends TEXT NOT NULL,
+    PRIMARY KEY (query_key, day)
+);
+"""
+
+
+class SQLiteInsightRollups(InsightRollupsBase):
+    """
+    Materialized per-query, per-day aggregates of saved insights: sentiment
+    counts, confidence and source sums, and trend counters. Each save
+    updates one row, so reading a date range touches one row per day
+    regardless of how many runs were stored.
+    """
+
+    def __init__(self, path: Union[str, Path] = "storage/insights/rollups.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=BUSY_TIMEOUT, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    async def update(self, result: Dict, saved_at: Optional[datetime] = None) -> None:
+        if not result.get("query") or "error" in result:
+            return
+
+        day = (saved_at or datetime.now(timezone.utc)).date().isoformat()
+        await asyncio.to_thread(self._update, result, day)
+
+    async def range(self, query: str, start: date, end: date) -> List[Dict]:
+        return await asyncio.to_thread(
+            self._range, query_key(query), start.isoformat(), end.isoformat()
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _update(self, result: Dict, day: str) -> None:
+        insights = result.get("insights") or {}
+        sentiment = str(insights.get("market_sentiment") or "").lower()
+        confidence = (insights.get("confidence") or {}).get("score")
+        trends = [
+            " ".join(str(t).lower().split())[:120]
+            for t in insights.get("key_trends") or []
+            if str(t).strip()
+        ]
+        key = query_key(result["query"])
+
+        # BEGIN IMMEDIATE takes the write lock before the trends are read,
+        # so writers in other processes queue (up to BUSY_TIMEOUT) instead of
+        # overwriting each other's merge; the counters are added in SQL.
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT trends FROM insight_rollups WHERE query_key = ? AND day = ?",
+                (key, day),
+            ).fetchone()
+
+            trend_counts: Counter = Counter(json.loads(row["trends"]) if row else {})
+            trend_counts.update(set(trends))
+            scored = isinstance(confidence, (int, float))
+
+            self._conn.execute(
+                "INSERT INTO insight_rollups (query_key, day, query, runs, "
+                "positive, neutral, negative, confidence_sum, confidence_runs, "
+                "sources_sum, trends) VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (query_key, day) DO UPDATE SET "
+                "query = excluded.query, runs = runs + 1, "
+                "positive = positive + excluded.positive, "
+                "neutral = neutral + excluded.neutral, "
+                "negative = negative + excluded.negative, "
+                "confidence_sum = confidence_sum + excluded.confidence_sum, "
+                "confidence_runs = confidence_runs + excluded.confidence_runs, "
+                "sources_sum = sources_sum + excluded.sources_sum, "
+                "trends = excluded.trends",
+                (
+                    key,
+                    day,
+                    result["query"],
+                    *(int(sentiment == s) for s in SENTIMENTS),
+                    confidence if scored else 0.0,
+                    int(scored),
+                    len(result.get("sources") or []),
+                    json.dumps(dict(trend_counts.most_common(MAX_TRENDS_PER_DAY))),
+                ),
+            )
+
+    def _range(self, key: str, start: str, end: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM insight_rollups WHERE query_key = ? "
+                "AND day BETWEEN ? AND ? ORDER BY day",
+                (key, start, end),
+            ).fetchall()
+
+        return [_row_to_rollup(row) for row in rows]
+
+
+def _row_to_rollup(row: sqlite3.Row, top_trends: int = 5) -> Dict:
+    trends = Counter(json.loads(row["trends"]))
+
+    return {
+        "day": row["day"],
+        "query": row["query"],
+        "runs": row["runs"],
+        "sentiment": {s: row[s] for s in SENTIMENTS},
+        "mean_confidence": (
+            round(row["confidence_sum"] / row["confidence_runs"], 1)
+            if row["confidence_runs"]
+            else None
+        ),
+        "mean_sources": round(row["sources_sum"] / row["runs"], 1),
+        "top_trends": [
+            {"trend": trend, "count": count}
+            for trend, count in trends.most_common(top_trends)
+        ],
+    }
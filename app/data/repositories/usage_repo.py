@@ -0,0 +1,73 @@
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from app.data.repositories.base import UsageRepositoryBase
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    account_id TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    period TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (account_id, metric, period)
+);
+"""
+
+
+class SQLiteUsageRepository(UsageRepositoryBase):
+    """
+    Usage counters aggregated per account, metric and period. Each batch is
+    applied as upserts in a single transaction.
+    """
+
+    def __init__(self, path: Union[str, Path] = "storage/usage/usage.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    async def add(self, counts: Dict[Tuple[str, str, str], int]) -> None:
+        if counts:
+            await asyncio.to_thread(self._add, counts)
+
+    async def totals(
+        self, account_ids: List[str], period: str
+    ) -> Dict[str, Dict[str, int]]:
+        if not account_ids:
+            return {}
+
+        return await asyncio.to_thread(self._totals, account_ids, period)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _add(self, counts: Dict[Tuple[str, str, str], int]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO usage (account_id, metric, period, amount) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (account_id, metric, period) "
+                "DO UPDATE SET amount = amount + excluded.amount",
+                [(*key, amount) for key, amount in counts.items()],
+            )
+
+    def _totals(self, account_ids: List[str], period: str) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT account_id, metric, amount FROM usage WHERE period = ? "
+                f"AND account_id IN ({','.join('?' * len(account_ids))})",
+                (period, *account_ids),
+            ).fetchall()
+
+        totals: Dict[str, Dict[str, int]] = {}
+        for account_id, metric, amount in rows:
+            totals.setdefault(account_id, {})[metric] = amount
+
+        return totals
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from app.events.events import EVENT_TYPES, Event
+
+
+logger = logging.getLogger(__name__)
+
+# Retention is enforced every this many appends rather than on each one.
+PRUNE_EVERY = 100
+
+
+class EventBackendBase(ABC):
+    """Durable event log with per-consumer offsets (at-least-once delivery)."""
+
+    @abstractmethod
+    async def append(self, event: Event) -> int:
+        """Persist an event and return its position in the log."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read(
+        self, consumer: str, topics: List[str], limit: int = 100
+    ) -> List[Tuple[int, Event]]:
+        """Return events on the given topics after the consumer's offset."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ack(self, consumer: str, position: int) -> None:
+        """Advance the consumer's offset past the given position."""
+        raise NotImplementedError
+
+
+class InMemoryBrokerBackend(EventBackendBase):
+    """
+    Process-local stand-in for an external broker, with the same offset
+    semantics, for development and tests. Keeps the newest ``max_events``
+    events like the SQLite backend.
+    """
+
+    def __init__(self, max_events: Optional[int] = 10000):
+        self.max_events = max_events
+        self._log: List[Tuple[int, str, Event]] = []
+        # Events dropped from the front of the log; positions stay absolute.
+        self._trimmed = 0
+        self._offsets: Dict[str, int] = {}
+
+    async def append(self, event: Event) -> int:
+        position = self._trimmed + len(self._log) + 1
+        self._log.append((position, type(event).__name__, event))
+
+        if self.max_events and position % PRUNE_EVERY == 0:
+            excess = len(self._log) - self.max_events
+            if excess > 0:
+                del self._log[:excess]
+                self._trimmed += excess
+
+        return position
+
+    async def read(
+        self, consumer: str, topics: List[str], limit: int = 100
+    ) -> List[Tuple[int, Event]]:
+        start = max(0, self._offsets.get(consumer, 0) - self._trimmed)
+
+        return [
+            (position, event)
+            for position, topic, event in self._log[start:]
+            if topic in topics
+        ][:limit]
+
+    async def ack(self, consumer: str, position: int) -> None:
+        self._offsets[consumer] = max(self._offsets.get(consumer, 0), position)
+
+
+class SQLiteEventBackend(EventBackendBase):
+    """
+    Event log in a SQLite file. Only the newest ``max_events`` events are
+    kept (None keeps everything); a durable consumer that falls further
+    behind than that loses the oldest events it had not acknowledged.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "storage/events/events.db",
+        max_events: Optional[int] = 10000,
+    ):
+        self.max_events = max_events
+        self._appended = 0
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                position INTEGER PRIMARY KEY AUTOINCREMENT,
+                topic TEXT NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS events_topic ON events (topic, position);
+            CREATE TABLE IF NOT EXISTS offsets (
+                consumer TEXT PRIMARY KEY,
+                position INTEGER NOT NULL
+            );
+            """
+        )
+
+    async def append(self, event: Event) -> int:
+        return await asyncio.to_thread(self._append, event)
+
+    async def read(
+        self, consumer: str, topics: List[str], limit: int = 100
+    ) -> List[Tuple[int, Event]]:
+        return await asyncio.to_thread(self._read, consumer, topics, limit)
+
+    async def ack(self, consumer: str, position: int) -> None:
+        await asyncio.to_thread(self._ack, consumer, position)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _append(self, event: Event) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO events (topic, payload) VALUES (?, ?)",
+                (type(event).__name__, event.model_dump_json()),
+            )
+            position = cursor.lastrowid
+
+            self._appended += 1
+            if self.max_events and self._appended % PRUNE_EVERY == 0:
+                self._prune(position - self.max_events)
+
+        return position
+
+    def _prune(self, up_to: int) -> None:
+        pruned = self._conn.execute(
+            "DELETE FROM events WHERE position <= ?", (up_to,)
+        ).rowcount
+        if pruned:
+            logger.info("Event log pruned | events=%d", pruned)
+
+    def _read(
+        self, consumer: str, topics: List[str], limit: int
+    ) -> List[Tuple[int, Event]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT position FROM offsets WHERE consumer = ?", (consumer,)
+            ).fetchone()
+            rows = self._conn.execute(
+                "SELECT position, topic, payload FROM events WHERE position > ? "
+                f"AND topic IN ({','.join('?' * len(topics))}) "
+                "ORDER BY position LIMIT ?",
+                (row[0] if row else 0, *topics, limit),
+            ).fetchall()
+
+        return [
+            (position, EVENT_TYPES[topic].model_validate(json.loads(payload)))
+            for position, topic, payload in rows
+        ]
+
+    def _ack(self, consumer: str, position: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO offsets (consumer, position) VALUES (?, ?) "
+                "ON CONFLICT(consumer) DO UPDATE SET "
+                "position = MAX(position, excluded.position)",
+                (consumer, position),
+            )
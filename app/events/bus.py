@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple, Type
+
+from app.events.backends import EventBackendBase
+from app.events.events import Event
+
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Event], Awaitable[None]]
+
+
+class Subscription:
+    def __init__(
+        self,
+        event_types: Tuple[Type[Event], ...],
+        handler: Handler,
+        max_queue: int,
+        concurrency: int,
+        durable_name: Optional[str],
+    ):
+        self.event_types = event_types
+        self.handler = handler
+        self.concurrency = concurrency
+        self.durable_name = durable_name
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.workers: List[asyncio.Task] = []
+
+    @property
+    def topics(self) -> List[str]:
+        return [t.__name__ for t in self.event_types]
+
+
+class EventBus:
+    """
+    In-process async event bus. Every subscription has its own bounded queue
+    and worker tasks, so a slow or failing handler only affects itself;
+    ``publish`` waits when a subscriber's queue is full (backpressure).
+
+    With a backend, events are also appended to a durable log. Durable
+    subscriptions acknowledge each handled event and, on ``start``, replay
+    whatever they had not acknowledged before the previous shutdown. A
+    handler failure is logged and the event is skipped, not retried.
+    """
+
+    def __init__(self, backend: Optional[EventBackendBase] = None):
+        self.backend = backend
+        self._subscriptions: List[Subscription] = []
+        self._started = False
+
+    def subscribe(
+        self,
+        event_types: Tuple[Type[Event], ...],
+        handler: Handler,
+        max_queue: int = 100,
+        concurrency: int = 1,
+        durable_name: Optional[str] = None,
+    ) -> Subscription:
+        if durable_name and concurrency != 1:
+            raise ValueError("Durable subscriptions must be processed in order")
+
+        subscription = Subscription(
+            tuple(event_types), handler, max_queue, concurrency, durable_name
+        )
+        self._subscriptions.append(subscription)
+
+        if self._started:
+            self._start_workers(subscription)
+
+        return subscription
+
+    async def start(self) -> None:
+        if self._started:
+            return
+
+        self._started = True
+
+        for subscription in self._subscriptions:
+            if subscription.durable_name and self.backend:
+                await self._replay(subscription)
+            self._start_workers(subscription)
+
+    async def publish(self, event: Event) -> None:
+        if not self._started:
+            await self.start()
+
+        position = await self.backend.append(event) if self.backend else None
+
+        for subscription in self._subscriptions:
+            if isinstance(event, subscription.event_types):
+                await subscription.queue.put((position, event))
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        for subscription in self._subscriptions:
+            await subscription.queue.join()
+
+    async def stop(self) -> None:
+        await self.drain()
+
+        for subscription in self._subscriptions:
+            for worker in subscription.workers:
+                worker.cancel()
+            await asyncio.gather(*subscription.workers, return_exceptions=True)
+            subscription.workers.clear()
+
+        self._started = False
+
+    def _start_workers(self, subscription: Subscription) -> None:
+        for _ in range(subscription.concurrency):
+            subscription.workers.append(asyncio.create_task(self._work(subscription)))
+
+    async def _replay(self, subscription: Subscription) -> None:
+        while True:
+            backlog = await self.backend.read(
+                subscription.durable_name, subscription.topics
+            )
+            if not backlog:
+                return
+
+            logger.info(
+                "Replaying %d events for %s", len(backlog), subscription.durable_name
+            )
+            for position, event in backlog:
+                await self._handle(subscription, position, event)
+
+    async def _work(self, subscription: Subscription) -> None:
+        while True:
+            position, event = await subscription.queue.get()
+            try:
+                await self._handle(subscription, position, event)
+            finally:
+                subscription.queue.task_done()
+
+    async def _handle(
+        self, subscription: Subscription, position: Optional[int], event: Event
+    ) -> None:
+        try:
+            await subscription.handler(event)
+        except Exception:
+            logger.exception(
+                "Event handler failed | event=%s | handler=%s",
+                type(event).__name__,
+                getattr(subscription.handler, "__qualname__", subscription.handler),
+            )
+
+        if subscription.durable_name and self.backend and position is not None:
+            await self.backend.ack(subscription.durable_name, position)
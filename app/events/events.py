@@ -0,0 +1,40 @@
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel, Field
+
+
+class Event(BaseModel):
+    event_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    occurred_at: float = Field(default_factory=time.time)
+    query: str
+
+
+class SearchCompleted(Event):
+    urls: List[str]
+
+
+class DocumentCrawled(Event):
+    url: str
+    title: Optional[str] = None
+    content: Optional[str] = None
+    published_at: Optional[Union[datetime, str]] = None
+    author: Optional[str] = None
+
+
+class AnalysisCompleted(Event):
+    insights: Dict
+    documents_analyzed: int
+    analysis_mode: str
+
+
+class InsightSaved(Event):
+    result: Dict
+
+
+EVENT_TYPES: Dict[str, Type[Event]] = {
+    cls.__name__: cls
+    for cls in (SearchCompleted, DocumentCrawled, AnalysisCompleted, InsightSaved)
+}
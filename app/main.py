@@ -1,16 +1,47 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.api.deps import get_pipeline_runner, get_usage_meter
+from app.api.routes import admin, insights, pipeline
 from app.config.settings import settings
 from app.utils.logging import setup_logging
+from app.utils.profiling import lag_monitor
 
 
 setup_logging(settings.log_level)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.loop_lag_monitor_enabled:
+        await lag_monitor.start()
+
+    meter = get_usage_meter()
+    if meter:
+        await meter.start()
+
+    yield
+
+    # Only close the runner if a request created it.
+    if get_pipeline_runner.cache_info().currsize:
+        await get_pipeline_runner().close()
+    if meter:
+        # Flushes whatever was recorded since the last periodic write.
+        await meter.stop()
+    await lag_monitor.stop()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.api_version,
+    lifespan=lifespan,
 )
 
+app.include_router(insights.router)
+app.include_router(pipeline.router)
+app.include_router(admin.router)
+
 
 @app.get("/health")
 def check_health():
@@ -0,0 +1,109 @@
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from app.data.repositories.base import UsageRepositoryBase
+from app.monetization.limits import QuotaExceededError
+from app.monetization.plans import Plan
+from app.monetization.usage import UsageMeter, current_period
+
+
+class EntitlementSnapshot:
+    __slots__ = ("plan", "period", "used", "loaded_at")
+
+    def __init__(self, plan: Plan, period: str, used: Dict[str, int]):
+        self.plan = plan
+        self.period = period
+        self.used = used
+        self.loaded_at = time.monotonic()
+
+
+class EntitlementService:
+    """
+    Answers quota checks from a cached per-account snapshot of stored usage
+    plus whatever the meter has not flushed yet. The repository is only read
+    when an account is first seen, when its snapshot expires or the day rolls
+    over, and (in one query) for accounts touched by a meter flush.
+    """
+
+    def __init__(
+        self,
+        repository: UsageRepositoryBase,
+        meter: UsageMeter,
+        plan_resolver: Callable[[str], Plan],
+        ttl: float = 60.0,
+    ):
+        self.repository = repository
+        self.meter = meter
+        self.plan_resolver = plan_resolver
+        self.ttl = ttl
+        self._snapshots: Dict[str, EntitlementSnapshot] = {}
+
+        meter.on_flush(self._refresh_flushed)
+
+    async def snapshot(self, account_id: str) -> EntitlementSnapshot:
+        snapshot = self._snapshots.get(account_id)
+        period = current_period()
+
+        if (
+            snapshot is None
+            or snapshot.period != period
+            or time.monotonic() - snapshot.loaded_at > self.ttl
+        ):
+            await self._load([account_id], period)
+            snapshot = self._snapshots[account_id]
+
+        return snapshot
+
+    async def remaining(self, account_id: str, metric: str) -> Optional[int]:
+        """Units left today, or None when the plan has no limit for the metric."""
+        snapshot = await self.snapshot(account_id)
+        limit = snapshot.plan.limit(metric)
+
+        if limit is None:
+            return None
+
+        return max(0, limit - self._used(account_id, metric, snapshot))
+
+    async def check(self, account_id: str, metric: str, amount: int = 1) -> bool:
+        remaining = await self.remaining(account_id, metric)
+        return remaining is None or remaining >= amount
+
+    async def enforce(self, account_id: str, metric: str, amount: int = 1) -> None:
+        snapshot = await self.snapshot(account_id)
+        limit = snapshot.plan.limit(metric)
+
+        if limit is None:
+            return
+
+        used = self._used(account_id, metric, snapshot)
+        if used + amount > limit:
+            raise QuotaExceededError(account_id, metric, limit, used)
+
+    def invalidate(self, account_id: str) -> None:
+        """Drop the cached snapshot, e.g. after a plan change."""
+        self._snapshots.pop(account_id, None)
+
+    def _used(self, account_id: str, metric: str, snapshot: EntitlementSnapshot) -> int:
+        return snapshot.used.get(metric, 0) + self.meter.pending(
+            account_id, metric, snapshot.period
+        )
+
+    async def _load(self, account_ids: Iterable[str], period: str) -> None:
+        account_ids = list(account_ids)
+        totals = await self.repository.totals(account_ids, period)
+
+        for account_id in account_ids:
+            self._snapshots[account_id] = EntitlementSnapshot(
+                self.plan_resolver(account_id), period, totals.get(account_id, {})
+            )
+
+    async def _refresh_flushed(self, batch: Dict) -> None:
+        period = current_period()
+        accounts = {
+            account_id
+            for account_id, _, batch_period in batch
+            if batch_period == period and account_id in self._snapshots
+        }
+
+        if accounts:
+            await self._load(accounts, period)
@@ -0,0 +1,16 @@
+PIPELINE_RUNS = "pipeline_runs"
+CRAWLED_PAGES = "crawled_pages"
+LLM_TOKENS = "llm_tokens"
+
+METRICS = (PIPELINE_RUNS, CRAWLED_PAGES, LLM_TOKENS)
+
+
+class QuotaExceededError(Exception):
+    def __init__(self, account_id: str, metric: str, limit: int, used: int):
+        self.account_id = account_id
+        self.metric = metric
+        self.limit = limit
+        self.used = used
+        super().__init__(
+            f"Quota exceeded for {account_id}: {metric} {used}/{limit} per day"
+        )
@@ -0,0 +1,34 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from app.monetization.limits import CRAWLED_PAGES, LLM_TOKENS, PIPELINE_RUNS
+
+
+class Plan(BaseModel):
+    name: str
+    # Metrics without a limit are unlimited.
+    daily_limits: Dict[str, int] = {}
+
+    def limit(self, metric: str) -> Optional[int]:
+        return self.daily_limits.get(metric)
+
+
+PLANS: Dict[str, Plan] = {
+    "free": Plan(
+        name="free",
+        daily_limits={PIPELINE_RUNS: 5, CRAWLED_PAGES: 100, LLM_TOKENS: 50_000},
+    ),
+    "pro": Plan(
+        name="pro",
+        daily_limits={PIPELINE_RUNS: 100, CRAWLED_PAGES: 3_000, LLM_TOKENS: 2_000_000},
+    ),
+    "enterprise": Plan(name="enterprise"),
+}
+
+
+def get_plan(name: str) -> Plan:
+    if name not in PLANS:
+        raise ValueError(f"Unknown plan: {name}")
+
+    return PLANS[name]
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.data.repositories.base import UsageRepositoryBase
+
+
+logger = logging.getLogger(__name__)
+
+UsageKey = Tuple[str, str, str]  # (account_id, metric, period)
+FlushListener = Callable[[Dict[UsageKey, int]], Awaitable[None]]
+
+
+def current_period(now: Optional[datetime] = None) -> str:
+    """Usage is aggregated per UTC day."""
+    return (now or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
+
+
+class _Shard:
+    __slots__ = ("lock", "counts")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[UsageKey, int] = defaultdict(int)
+
+
+class UsageMeter:
+    """
+    In-memory usage counters, sharded by account so concurrent recorders
+    rarely contend on the same lock. Counts are written to the repository in
+    one batch every ``flush_interval`` seconds (and on ``stop``), so
+    recording never touches the database on the request path.
+    """
+
+    def __init__(
+        self,
+        repository: UsageRepositoryBase,
+        shards: int = 16,
+        flush_interval: float = 5.0,
+    ):
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self._shards = [_Shard() for _ in range(shards)]
+        # Counts taken out of the shards but not yet written.
+        self._in_flight: Dict[UsageKey, int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._listeners: List[FlushListener] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, account_id: str, metric: str, amount: int = 1) -> None:
+        if amount <= 0:
+            return
+
+        key = (account_id, metric, current_period())
+        shard = self._shard(account_id)
+
+        with shard.lock:
+            shard.counts[key] += amount
+
+    def pending(
+        self, account_id: str, metric: str, period: Optional[str] = None
+    ) -> int:
+        """Usage recorded for the account that the repository does not have yet."""
+        key = (account_id, metric, period or current_period())
+        shard = self._shard(account_id)
+
+        with shard.lock:
+            buffered = shard.counts.get(key, 0)
+
+        return buffered + self._in_flight.get(key, 0)
+
+    def on_flush(self, listener: FlushListener) -> None:
+        """Call ``listener`` with each batch after it has been written."""
+        self._listeners.append(listener)
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            batch: Dict[UsageKey, int] = defaultdict(int)
+
+            for shard in self._shards:
+                with shard.lock:
+                    counts, shard.counts = shard.counts, defaultdict(int)
+                for key, amount in counts.items():
+                    batch[key] += amount
+
+            if not batch:
+                return 0
+
+            self._in_flight = dict(batch)
+            try:
+                await self.repository.add(self._in_flight)
+            except Exception:
+                # Put the batch back so it is retried on the next flush.
+                for (account_id, metric, period), amount in self._in_flight.items():
+                    shard = self._shard(account_id)
+                    with shard.lock:
+                        shard.counts[(account_id, metric, period)] += amount
+                self._in_flight = {}
+                raise
+
+            # The batch is stored now; listeners that re-read the repository
+            # must not see it in pending() as well.
+            written, self._in_flight = self._in_flight, {}
+            for listener in self._listeners:
+                try:
+                    await listener(written)
+                except Exception:
+                    logger.exception("Usage flush listener failed")
+
+            return len(batch)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Usage flush failed")
+
+    def _shard(self, account_id: str) -> _Shard:
+        return self._shards[hash(account_id) % len(self._shards)]
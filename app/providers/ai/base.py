@@ -7,3 +7,10 @@ class AIProviderBase(ABC):
     async def analyze(self, documents: List[Dict]) -> Dict:
         """Analyze a list of documents and return the analysis results."""
         raise NotImplementedError
+
+    async def update(self, previous: Dict, documents: List[Dict]) -> Dict:
+        """
+        Revise a previous analysis with new or changed documents. Providers
+        without a dedicated update prompt fall back to analyzing them afresh.
+        """
+        return await self.analyze(documents)
@@ -0,0 +1,230 @@
+import logging
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.utils.text import estimate_tokens
+from app.utils.urls import domain_of
+
+
+logger = logging.getLogger(__name__)
+
+# Short lines matching these are dropped even when they occur only once.
+BOILERPLATE_PATTERNS = re.compile(
+    r"cookie|newsletter|subscribe|sign up|sign in|log in|all rights reserved|"
+    r"privacy policy|terms (of use|and conditions)|share (this|on)|follow us|"
+    r"related (listings|properties|articles|news)|similar (listings|properties)|"
+    r"read more|back to top|skip to (main )?content|download (our|the) app",
+    re.IGNORECASE,
+)
+
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_EMPHASIS = re.compile(r"\*{2,}|_{2,}|`+")
+_MARKER = re.compile(r"^(#{1,6}|>|[-*+])\s+")
+_TABLE_RULE = re.compile(r"^\|?[\s:|-]*-{3,}[\s:|-]*\|?$")
+_SOURCE_ID = re.compile(r"\bS\d+\b")
+# Figures or a sentence ending: the line states something rather than
+# labelling navigation.
+_CLAIM = re.compile(r"\d|[.!?]$")
+
+
+class CompactedPrompt:
+    def __init__(
+        self,
+        text: str,
+        source_ids: Dict[str, str],
+        original_tokens: int,
+        boilerplate_lines: int,
+    ):
+        self.text = text
+        self.source_ids = source_ids
+        self.original_tokens = original_tokens
+        self.compact_tokens = estimate_tokens(text)
+        self.boilerplate_lines = boilerplate_lines
+
+    @property
+    def saved_ratio(self) -> float:
+        if not self.original_tokens:
+            return 0.0
+        return 1 - self.compact_tokens / self.original_tokens
+
+
+class PromptCompactor:
+    """
+    Turns documents into a compact, delimited article list for the LLM:
+    markdown links, images and table rules are stripped, whitespace and
+    table rows collapsed, and short recurring lines (navigation, cookie
+    banners, "related listings") dropped. Each source is
+    introduced by a short ID such as ``[S1]`` that ``resolve_evidence`` maps
+    back to its URL.
+    """
+
+    def __init__(self, min_documents: int = 2, max_line_chars: int = 160):
+        self.min_documents = min_documents
+        self.max_line_chars = max_line_chars
+
+    def compact(self, documents: List[Dict]) -> CompactedPrompt:
+        documents = [d for d in documents if d.get("content")]
+        cleaned = [self._clean_lines(d["content"]) for d in documents]
+        boilerplate = self.find_boilerplate(
+            cleaned, [domain_of(d["url"]) for d in documents]
+        )
+
+        blocks: List[str] = []
+        source_ids: Dict[str, str] = {}
+        dropped = 0
+
+        for index, (doc, lines) in enumerate(zip(documents, cleaned), start=1):
+            source_id = f"S{index}"
+            source_ids[source_id] = doc["url"]
+
+            kept: List[str] = []
+            seen = set()
+            for line in lines:
+                key = _line_key(line)
+                if key in boilerplate or key in seen or self._is_noise(line):
+                    dropped += 1
+                    continue
+                seen.add(key)
+                kept.append(line)
+
+            header = " | ".join(
+                part
+                for part in (
+                    f"[{source_id}]",
+                    doc.get("title"),
+                    _format_date(doc.get("published_at")),
+                    domain_of(doc["url"]),
+                )
+                if part
+            )
+            blocks.append(header + "\n" + "\n".join(kept))
+
+        prompt = CompactedPrompt(
+            "\n\n".join(blocks),
+            source_ids,
+            original_tokens=estimate_tokens(str(_legacy_sources(documents))),
+            boilerplate_lines=dropped,
+        )
+
+        logger.info(
+            "Prompt compaction | sources=%d | tokens=%d -> %d | saved=%.0f%% | "
+            "boilerplate_lines=%d",
+            len(documents),
+            prompt.original_tokens,
+            prompt.compact_tokens,
+            prompt.saved_ratio * 100,
+            dropped,
+            extra={
+                "tokens_before": prompt.original_tokens,
+                "tokens_after": prompt.compact_tokens,
+            },
+        )
+
+        return prompt
+
+    def find_boilerplate(
+        self, documents: List[List[str]], domains: Optional[List[str]] = None
+    ) -> set:
+        """
+        Keys of short lines that occur in at least ``min_documents``
+        documents. Lines repeated within one site are template text; lines
+        shared across sites are only dropped when they carry no figure and
+        no sentence ending, so a fact several outlets quote verbatim (and
+        its cross-source support) survives.
+        """
+        domains = domains or [""] * len(documents)
+        counts: Counter = Counter()
+        per_domain: Counter = Counter()
+        samples: Dict[str, str] = {}
+
+        for lines, domain in zip(documents, domains):
+            keys = {}
+            for line in lines:
+                if len(line) <= self.max_line_chars:
+                    keys.setdefault(_line_key(line), line)
+
+            for key, line in keys.items():
+                counts[key] += 1
+                per_domain[(domain, key)] += 1
+                samples.setdefault(key, line)
+
+        boilerplate = {
+            key for (_, key), count in per_domain.items() if count >= self.min_documents
+        }
+        boilerplate.update(
+            key
+            for key, count in counts.items()
+            if count >= self.min_documents and not _CLAIM.search(samples[key])
+        )
+        boilerplate.discard("")
+
+        return boilerplate
+
+    def _is_noise(self, line: str) -> bool:
+        return len(line) <= self.max_line_chars and bool(
+            BOILERPLATE_PATTERNS.search(line)
+        )
+
+    def _clean_lines(self, content: str) -> List[str]:
+        content = _LINK.sub(r"\1", _IMAGE.sub("", content))
+        lines: List[str] = []
+
+        for raw in content.splitlines():
+            line = raw.strip()
+
+            if _TABLE_RULE.match(line):
+                continue
+            if line.startswith("|"):
+                line = "; ".join(
+                    cell.strip() for cell in line.strip("|").split("|") if cell.strip()
+                )
+
+            line = " ".join(_MARKER.sub("", _EMPHASIS.sub("", line)).split())
+            if line:
+                lines.append(line)
+
+        return lines
+
+
+def resolve_evidence(result: Dict, source_ids: Dict[str, str]) -> Dict:
+    """Replace source IDs cited in ``evidence`` with the URLs they stand for."""
+    if not source_ids or not isinstance(result.get("evidence"), list):
+        return result
+
+    for item in result["evidence"]:
+        if not isinstance(item, dict):
+            continue
+
+        cited = str(item.get("source_url") or item.get("source") or "")
+        match = _SOURCE_ID.search(cited)
+        if match and match.group(0) in source_ids:
+            item["source_url"] = source_ids[match.group(0)]
+            item.pop("source", None)
+
+    return result
+
+
+def _line_key(line: str) -> str:
+    return " ".join(re.sub(r"[^\w%]+", " ", line.lower()).split())
+
+
+def _format_date(value) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    return value or None
+
+
+def _legacy_sources(documents: List[Dict]) -> List[Dict]:
+    # What the prompt used to embed, kept to report the savings.
+    return [
+        {
+            "url": d["url"],
+            "title": d.get("title"),
+            "published_at": d.get("published_at"),
+            "content": d.get("content"),
+        }
+        for d in documents
+    ]
@@ -1,16 +1,14 @@
 import json
 import logging
-from typing import Dict, List
-
-import httpx
-from rich.console import Console
+from typing import Dict, List, Optional, Tuple
 
 from app.providers.ai.base import AIProviderBase
+from app.providers.ai.compaction import PromptCompactor, resolve_evidence
 from app.config.settings import settings
+from app.utils.console import progress
 
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 
 class OllamaCloudProvider(AIProviderBase):
@@ -18,23 +16,51 @@ class OllamaCloudProvider(AIProviderBase):
         self,
         model: str = "qwen3-vl:235b-instruct-cloud",
         temperature: float = 0.2,  #  Lower values (like 0.2) make the model more deterministic and factual, while higher values make it more creative and random.
+        compactor: Optional[PromptCompactor] = None,
+        timeout: float = 60,
     ):
         self.model = model
         self.temperature = temperature
+        self.compactor = compactor
+        self.timeout = timeout
         self.base_url = settings.ollama_base_url
         self.api_key = settings.ollama_api_key
 
+    async def warmup(self) -> None:
+        import httpx  # noqa: F401
+
     async def analyze(self, documents: List[Dict]) -> Dict:
         logger.info(
             "Starting Ollama analysis | model=%s | docs=%d", self.model, len(documents)
         )
-        console.print(f"[dim]→ Ollama analyze[/dim] ({len(documents)} documents)")
+        progress.print(f"[dim]→ Ollama analyze[/dim] ({len(documents)} documents)")
+
+        articles, source_ids = self._articles(documents)
+        result = await self._complete(self._build_prompt(articles, bool(source_ids)))
+
+        return resolve_evidence(result, source_ids)
+
+    async def update(self, previous: Dict, documents: List[Dict]) -> Dict:
+        logger.info(
+            "Starting Ollama incremental update | model=%s | docs=%d",
+            self.model,
+            len(documents),
+        )
+        progress.print(f"[dim]→ Ollama update[/dim] ({len(documents)} documents)")
+
+        articles, source_ids = self._articles(documents)
+        result = await self._complete(
+            self._build_update_prompt(previous, articles, bool(source_ids))
+        )
 
-        prompt = self._build_prompt(documents)
+        return resolve_evidence(result, source_ids)
+
+    async def _complete(self, prompt: str) -> Dict:
+        import httpx
 
         try:
-            async with httpx.AsyncClient(timeout=60) as client:
-                console.print(
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                progress.print(
                     f"[cyan]Calling Ollama API[/cyan] → {self.model}", style="dim"
                 )
 
@@ -80,12 +106,12 @@ class OllamaCloudProvider(AIProviderBase):
 
             if "error" in result:
                 logger.warning("Ollama returned invalid JSON | model=%s", self.model)
-                console.print("[yellow]Warning: invalid JSON response[/yellow]")
+                progress.print("[yellow]Warning: invalid JSON response[/yellow]")
             else:
                 logger.info(
                     "Ollama analysis completed successfully | model=%s", self.model
                 )
-                console.print("[green]✓ Analysis complete[/green]")
+                progress.print("[green]✓ Analysis complete[/green]")
 
             return result
 
@@ -95,18 +121,18 @@ class OllamaCloudProvider(AIProviderBase):
                 exc.response.status_code,
                 exc.response.text[:200],
             )
-            console.print(f"[red]API error {exc.response.status_code}[/red]")
+            progress.print(f"[red]API error {exc.response.status_code}[/red]")
 
             return {"error": f"HTTP {exc.response.status_code}", "raw": str(exc)}
 
         except Exception as exc:
             logger.exception("Unexpected error during Ollama analysis")
-            console.print(f"[red]Unexpected error:[/red] {str(exc)}")
+            progress.print(f"[red]Unexpected error:[/red] {str(exc)}")
 
             return {"error": str(exc), "raw": None}
 
-    def _build_prompt(self, documents: List[Dict]) -> str:
-        sources = [
+    def _sources(self, documents: List[Dict]) -> List[Dict]:
+        return [
             {
                 "url": d["url"],
                 "title": d.get("title"),
@@ -117,6 +143,17 @@ class OllamaCloudProvider(AIProviderBase):
             if d.get("content")
         ]
 
+    def _articles(self, documents: List[Dict]) -> Tuple[str, Dict[str, str]]:
+        """Serialized articles and, when compacted, the source ID -> URL map."""
+        if not self.compactor:
+            return str(self._sources(documents)), {}
+
+        compacted = self.compactor.compact(documents)
+        return compacted.text, compacted.source_ids
+
+    def _build_prompt(self, articles: str, source_ids: bool = False) -> str:
+        cite = _cite_hint(source_ids)
+
         return f"""
                     Analyze the following real estate articles and return JSON in this format:
 
@@ -127,13 +164,56 @@ class OllamaCloudProvider(AIProviderBase):
                             "evidence": [
                                 {{
                                     "claim": "...",
-                                    "source_url": "..."
+                                    "source_url": "{cite}"
                                 }}
                             ],
                         }}
 
                     Articles:
-                    {sources}
+                    {articles}
+                """
+
+    def _build_update_prompt(
+        self, previous: Dict, articles: str, source_ids: bool = False
+    ) -> str:
+        cite = _cite_hint(source_ids)
+        prior = json.dumps(
+            {
+                key: previous.get(key)
+                for key in ("summary", "key_trends", "market_sentiment")
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+        return f"""
+                    Below is a previous analysis of Dubai real estate articles, followed
+                    by articles that are new or have changed since it was written.
+
+                    Update the previous analysis using ONLY the new articles: revise the
+                    summary, trends and sentiment where the new articles warrant it, and
+                    keep what they do not contradict. Cite evidence from the new articles
+                    only; evidence for unchanged articles is carried over separately.
+
+                    Return JSON in this format:
+
+                        {{
+                            "summary": "...",
+                            "key_trends": ["...", "..."],
+                            "market_sentiment": "positive|neutral|negative",
+                            "evidence": [
+                                {{
+                                    "claim": "...",
+                                    "source_url": "{cite}"
+                                }}
+                            ],
+                        }}
+
+                    Previous analysis:
+                    {prior}
+
+                    New or changed articles:
+                    {articles}
                 """
 
     def _parse_response(self, content: str) -> Dict:
@@ -144,3 +224,9 @@ class OllamaCloudProvider(AIProviderBase):
                 "error": "Invalid JSON from AI",
                 "raw_output": content,
             }
+
+
+def _cite_hint(source_ids: bool) -> str:
+    # Compacted articles are introduced by IDs like [S1]; citing the ID is
+    # cheaper and less error-prone than copying the URL.
+    return "S1 (the article's source ID)" if source_ids else "..."
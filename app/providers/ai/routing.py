@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from app.providers.ai.base import AIProviderBase
+from app.utils.text import estimate_tokens
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+SENTIMENTS = ("positive", "neutral", "negative")
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures and rejects calls
+    for ``reset_timeout`` seconds. After that a single probe call is let
+    through (half-open): success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self._probing = False
+
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def release(self) -> None:
+        """Give back a probe that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning("Circuit opened after %d failures", self.failures)
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+
+def validate_insights(
+    result: Dict, documents: List[Dict], min_grounding: float
+) -> List[str]:
+    """
+    Problems that make an analysis not worth keeping. ``grounding`` is the
+    share of evidence items citing one of the analyzed URLs; a low share
+    means the model is citing sources it was not given.
+    """
+    if "error" in result:
+        return [str(result["error"])]
+
+    problems: List[str] = []
+
+    if not isinstance(result.get("summary"), str) or not result["summary"].strip():
+        problems.append("missing summary")
+    if not isinstance(result.get("key_trends"), list):
+        problems.append("key_trends is not a list")
+    if result.get("market_sentiment") not in SENTIMENTS:
+        problems.append("invalid market_sentiment")
+
+    evidence = result.get("evidence")
+    if not isinstance(evidence, list) or not evidence:
+        problems.append("no evidence")
+    else:
+        urls = {d["url"] for d in documents}
+        grounded = sum(
+            1 for e in evidence if isinstance(e, dict) and e.get("source_url") in urls
+        )
+        if grounded / len(evidence) < min_grounding:
+            problems.append(f"low grounding ({grounded}/{len(evidence)})")
+
+    return problems
+
+
+class RoutingAIProvider(AIProviderBase):
+    """
+    Model cascade: small document sets go to the ``fast`` provider first and
+    are escalated to ``strong`` when the answer fails validation; larger sets
+    go straight to ``strong``. Each provider sits behind its own circuit
+    breaker, so a degraded endpoint is skipped instead of timing out on
+    every run, and the other model is used while it recovers.
+    """
+
+    def __init__(
+        self,
+        fast: AIProviderBase,
+        strong: AIProviderBase,
+        max_fast_documents: int = 4,
+        max_fast_tokens: int = 6000,
+        min_grounding: float = 0.7,
+        fast_breaker: Optional[CircuitBreaker] = None,
+        strong_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.fast = fast
+        self.strong = strong
+        self.max_fast_documents = max_fast_documents
+        self.max_fast_tokens = max_fast_tokens
+        self.min_grounding = min_grounding
+        self.breakers = {
+            "fast": fast_breaker or CircuitBreaker(),
+            "strong": strong_breaker or CircuitBreaker(),
+        }
+
+    async def analyze(self, documents: List[Dict]) -> Dict:
+        return await self._route(documents, lambda p: p.analyze(documents))
+
+    async def update(self, previous: Dict, documents: List[Dict]) -> Dict:
+        return await self._route(
+            documents,
+            lambda p: (
+                p.update(previous, documents)
+                if hasattr(p, "update")
+                else p.analyze(documents)
+            ),
+        )
+
+    async def warmup(self) -> None:
+        for provider in (self.fast, self.strong):
+            if hasattr(provider, "warmup"):
+                await provider.warmup()
+
+    def is_simple(self, documents: List[Dict]) -> bool:
+        tokens = sum(estimate_tokens(d.get("content") or "") for d in documents)
+        return (
+            len(documents) <= self.max_fast_documents and tokens <= self.max_fast_tokens
+        )
+
+    async def _route(self, documents: List[Dict], call) -> Dict:
+        tiers = ["fast", "strong"] if self.is_simple(documents) else ["strong", "fast"]
+        # The fast model only stands in for large sets when strong is down.
+        fallback_only = "fast" if tiers[0] == "strong" else None
+
+        best: Optional[Dict] = None
+        failure: Optional[Dict] = None
+
+        for tier in tiers:
+            # An answer that did not even parse is no reason to skip it.
+            if tier == fallback_only and best is not None and "error" not in best:
+                break
+
+            breaker = self.breakers[tier]
+            if not breaker.allow():
+                logger.info(
+                    "AI tier skipped, circuit %s | tier=%s", breaker.state, tier
+                )
+                continue
+
+            provider = self.fast if tier == "fast" else self.strong
+            try:
+                result = await call(provider)
+            except asyncio.CancelledError:
+                # Otherwise a cancelled half-open probe holds the tier shut.
+                breaker.release()
+                raise
+            except Exception as exc:
+                logger.exception("AI tier raised | tier=%s", tier)
+                result = {"error": str(exc), "raw": None}
+
+            if _endpoint_failed(result):
+                breaker.record_failure()
+                failure = result
+                continue
+
+            breaker.record_success()
+            problems = validate_insights(result, documents, self.min_grounding)
+
+            if not problems:
+                logger.info("AI analysis accepted | tier=%s", tier)
+                return result
+
+            logger.info(
+                "AI analysis rejected | tier=%s | problems=%s",
+                tier,
+                "; ".join(problems),
+            )
+            if best is None or "error" in best or tier == "strong":
+                best = result
+
+        # Every tier that answered fell short; keep the best effort (preferring
+        # the strong model). Only endpoint failures end in an error.
+        return best or failure or {"error": "AI circuit open", "raw": None}
+
+
+def _endpoint_failed(result: Dict) -> bool:
+    # Transport and HTTP errors count against the breaker; an answer that
+    # did not parse ("raw_output") means the endpoint works but the model
+    # needs escalating.
+    return "error" in result and "raw_output" not in result
@@ -7,3 +7,15 @@ class CrawlProviderBase(ABC):
     async def crawl(self, url: str) -> Dict:
         """Crawl the given URL and return the extracted data as a dictionary."""
         raise NotImplementedError
+
+
+def failed_result(url: str, error: str) -> Dict:
+    """The document dict every provider returns for a URL it could not crawl."""
+    return {
+        "url": url,
+        "title": None,
+        "content": None,
+        "published_at": None,
+        "author": None,
+        "error": error,
+    }
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from app.providers.crawler.base import CrawlProviderBase, failed_result
+from app.providers.crawler.latency import DomainLatencyTracker
+
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedCrawlProvider(CrawlProviderBase):
+    """
+    Wraps a primary crawl provider with per-domain adaptive timeouts and
+    request hedging. When the primary has not answered within the domain's
+    usual latency (``tracker.hedge_after``), the same URL is also sent to
+    the ``hedge`` provider and the first usable result wins; the loser is
+    cancelled. The whole crawl is bounded by ``tracker.timeout_for``.
+    Latency hedges are capped at ``max_hedge_ratio`` of all crawls so a
+    uniformly slow period does not double the load; a primary that fails
+    outright is always retried on the hedge.
+    """
+
+    def __init__(
+        self,
+        primary: CrawlProviderBase,
+        hedge: Optional[CrawlProviderBase] = None,
+        tracker: Optional[DomainLatencyTracker] = None,
+        max_hedge_ratio: Optional[float] = 0.1,
+    ):
+        self.primary = primary
+        self.hedge = hedge
+        self.tracker = tracker or DomainLatencyTracker()
+        self.max_hedge_ratio = max_hedge_ratio
+        self.crawls = 0
+        self.hedges_launched = 0
+        self.hedges_won = 0
+
+    async def crawl(self, url: str) -> Dict:
+        timeout = self.tracker.timeout_for(url)
+        started = time.monotonic()
+        deadline = started + timeout
+
+        attempts: Dict[asyncio.Task, str] = {
+            asyncio.create_task(self.primary.crawl(url)): "primary"
+        }
+        self.crawls += 1
+        hedge_at = (
+            started + self.tracker.hedge_after(url)
+            if self.hedge and self._within_hedge_budget()
+            else None
+        )
+        hedged = False
+        last: Optional[Dict] = None
+        timed_out = False
+
+        try:
+            while True:
+                now = time.monotonic()
+
+                if hedge_at is not None and now >= hedge_at:
+                    attempts[asyncio.create_task(self.hedge.crawl(url))] = "hedge"
+                    hedge_at = None
+                    hedged = True
+                    self.hedges_launched += 1
+                    logger.info(
+                        "Hedging crawl | url=%s | after=%.1fs", url, now - started
+                    )
+
+                if not attempts:
+                    break
+                if now >= deadline:
+                    timed_out = True
+                    break
+
+                wake = min(deadline, hedge_at) if hedge_at is not None else deadline
+                done, _ = await asyncio.wait(
+                    attempts, timeout=wake - now, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    tier = attempts.pop(task)
+                    doc = _result(task, url)
+
+                    if not doc.get("error") and doc.get("content"):
+                        self.tracker.record(url, time.monotonic() - started)
+                        if tier == "hedge":
+                            self.hedges_won += 1
+                        return doc
+
+                    last = doc
+
+                # The primary failed outright: hedge now rather than waiting
+                # out the delay.
+                if not attempts and self.hedge and not hedged:
+                    hedge_at = time.monotonic()
+        finally:
+            for task in attempts:
+                task.cancel()
+            if attempts:
+                await asyncio.gather(*attempts, return_exceptions=True)
+
+        if timed_out:
+            # Count timeouts at their full cost so the domain's p95 rises.
+            self.tracker.record(url, time.monotonic() - started)
+            logger.warning("Crawl timed out | url=%s | timeout=%.1fs", url, timeout)
+            return failed_result(url, f"Timed out after {timeout:.1f}s")
+
+        return last or failed_result(url, "Crawl failed")
+
+    async def warmup(self) -> None:
+        for provider in self._providers():
+            if hasattr(provider, "warmup"):
+                await provider.warmup()
+
+    async def close(self) -> None:
+        for provider in self._providers():
+            if hasattr(provider, "close"):
+                await provider.close()
+
+    def _within_hedge_budget(self) -> bool:
+        if self.max_hedge_ratio is None:
+            return True
+        return self.hedges_launched < max(1.0, self.max_hedge_ratio * self.crawls)
+
+    def _providers(self) -> List[CrawlProviderBase]:
+        return [p for p in (self.primary, self.hedge) if p is not None]
+
+
+def _result(task: asyncio.Task, url: str) -> Dict:
+    if task.exception():
+        return failed_result(url, str(task.exception()))
+    return task.result()
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.config.settings import settings
+from app.providers.crawler.base import CrawlProviderBase, failed_result
+from app.providers.crawler.postprocess import (
+    PostProcessPool,
+    process_html,
+    process_pdf,
+)
+from app.utils.urls import is_blocked
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+
+class HttpCrawlProvider(CrawlProviderBase):
+    """
+    Browserless fetch tier: a plain HTTP GET parsed with the same
+    scraping and markdown settings as the browser crawl. Much cheaper than
+    Crawl4AI, but misses pages that need JavaScript to render; used as the
+    hedge for slow browser crawls.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 20,
+        process_pool: Optional[PostProcessPool] = None,
+        blocked_domains: List[str] = settings.crawl_blocked_domains,
+    ):
+        self.timeout = timeout
+        self.process_pool = process_pool
+        self.blocked_domains = list(blocked_domains)
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._client
+
+    async def crawl(self, url: str) -> Dict:
+        if is_blocked(url, self.blocked_domains):
+            return failed_result(url, "Blocked domain")
+
+        try:
+            response = await self._get_client().get(url)
+
+            if response.status_code >= 400:
+                return failed_result(url, f"HTTP {response.status_code}")
+
+            is_pdf = urlparse(url).path.lower().endswith(".pdf") or (
+                "application/pdf" in response.headers.get("content-type", "")
+            )
+
+            if is_pdf:
+                doc = await self._parse_pdf(url, response.content)
+            else:
+                doc = await self._parse_html(url, response.text)
+        except Exception as exc:
+            logger.warning("HTTP crawl failed for %s: %s", url, exc)
+            return failed_result(url, str(exc))
+
+        if not doc.get("content"):
+            return failed_result(url, "Empty content")
+
+        return doc
+
+    async def _parse_html(self, url: str, html: str) -> Dict:
+        if self.process_pool:
+            return await self.process_pool.html(url, html)
+        return (await asyncio.to_thread(process_html, url, html)).model_dump()
+
+    async def _parse_pdf(self, url: str, data: bytes) -> Dict:
+        if self.process_pool:
+            return await self.process_pool.pdf(url, data)
+        return (
+            await asyncio.to_thread(process_pdf, url, data, None, len(data))
+        ).model_dump()
+
+    async def warmup(self) -> None:
+        self._get_client()
+
+    async def close(self) -> None:
+        # The process pool belongs to whoever passed it in.
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
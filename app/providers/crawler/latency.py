@@ -0,0 +1,90 @@
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from app.utils.urls import domain_of
+
+
+class DomainLatencyTracker:
+    """
+    Rolling crawl latencies per domain, plus one window across all domains.
+    Timeouts and hedge delays come from the domain's own percentiles once it
+    has ``min_samples`` crawls, otherwise from the global window, otherwise
+    from the configured defaults.
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        min_samples: int = 5,
+        default_timeout: float = 20.0,
+        min_timeout: float = 5.0,
+        max_timeout: float = 20.0,
+        timeout_multiplier: float = 2.0,
+        default_hedge_after: float = 8.0,
+        hedge_quantile: float = 0.95,
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.default_hedge_after = default_hedge_after
+        self.hedge_quantile = hedge_quantile
+        self._domains: Dict[str, Deque[float]] = {}
+        self._all: Deque[float] = deque(maxlen=window * 4)
+
+    def record(self, url: str, seconds: float) -> None:
+        domain = domain_of(url)
+        if domain not in self._domains:
+            self._domains[domain] = deque(maxlen=self.window)
+
+        self._domains[domain].append(seconds)
+        self._all.append(seconds)
+
+    def percentile(self, url: str, quantile: float) -> Optional[float]:
+        samples = self._samples(url)
+        return _percentile(sorted(samples), quantile) if samples else None
+
+    def timeout_for(self, url: str) -> float:
+        """``timeout_multiplier`` x p95, clamped to [min_timeout, max_timeout]."""
+        p95 = self.percentile(url, 0.95)
+        if p95 is None:
+            return self.default_timeout
+
+        return min(
+            self.max_timeout, max(self.min_timeout, p95 * self.timeout_multiplier)
+        )
+
+    def hedge_after(self, url: str) -> float:
+        """Seconds to wait before launching a hedged second attempt."""
+        latency = self.percentile(url, self.hedge_quantile)
+        if latency is None:
+            return self.default_hedge_after
+
+        return min(latency, self.timeout_for(url))
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {
+            domain: {
+                "samples": len(samples),
+                "p50": _percentile(sorted(samples), 0.5),
+                "p95": _percentile(sorted(samples), 0.95),
+            }
+            for domain, samples in self._domains.items()
+        }
+
+    def _samples(self, url: str) -> List[float]:
+        samples = self._domains.get(domain_of(url), ())
+        if len(samples) >= self.min_samples:
+            return list(samples)
+        if len(self._all) >= self.min_samples:
+            return list(self._all)
+        return []
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
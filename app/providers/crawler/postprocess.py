@@ -0,0 +1,225 @@
+import asyncio
+import io
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Dict, Optional
+
+from dateutil import parser
+
+from app.config.settings import settings
+from app.providers.crawler.schema import CrawledDocument
+
+
+logger = logging.getLogger(__name__)
+
+EXCLUDED_TAGS = ["nav", "header", "footer", "script", "style"]
+
+MARKDOWN_OPTIONS = {
+    "ignore_links": True,
+    "escape_html": True,
+    "skip_internal_links": True,
+    "body_width": 0,
+}
+
+# PDFs at least this large are handed to the pool through shared memory
+# instead of being pickled through the executor's pipe.
+SHARED_MEMORY_THRESHOLD = 1 << 20
+
+
+def extract_published_date(content: str) -> Optional[datetime]:
+    """
+    Extract publication dates from content using multiple strategies
+    """
+    if not content:
+        return None
+
+    # Common date patterns found in blog posts
+    date_patterns = [
+        # YYYY-MM-DD format
+        r"\b(202[5-6][-/]\d{1,2}[-/]\d{1,2})\b",
+        # DD/MM/YYYY or DD-MM-YYYY format (for 2025-2026)
+        r"\b\d{1,2}[/-]\d{1,2}[/-](202[5-6])\b",
+        # Month DD, YYYY format (for 2025-2026)
+        r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(202[5-6])\b",
+        # DD Month YYYY format (for 2025-2026)
+        r"\b\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(202[5-6])\b",
+        # Mon DD, YYYY format (for 2025-2026)
+        r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+(202[5-6])\b",
+        # DD Mon YYYY format (for 2025-2026)
+        r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(202[5-6])\b",
+        # Month YYYY format (for cases like "Last update: January 2026")
+        r"\b(Last update|Next update|Updated|Published|Released):\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s+(202[5-6])\b",
+        # Month YYYY without prefix (for cases like "January 2026")
+        r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(202[5-6])\b",
+        # datetime or dateTime patterns
+        r'\b(datetime|dateTime)\s*[=:]\s*[\'"]*(\d{4}-\d{2}-\d{2}T?\d{2}:\d{2}:\d{2})',
+        # Published/March 15, 2025-2026
+        r"\b(Published|Posted|Updated|Last updated|Published on):\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(202[5-6])\b",
+        # Post published March 15th, 2025-2026
+        r"\b(Post published|Published|Written on|Date posted|Updated):\s*\w+\s+\d{1,2}(?:st|nd|rd|th)?,\s+(202[5-6])\b",
+    ]
+
+    extracted_dates = []
+
+    # Try regex patterns first
+    for pattern in date_patterns:
+        matches = re.findall(
+            pattern, content[:2000], re.IGNORECASE
+        )  # Limit to first 2000 chars for performance
+        for match in matches:
+            try:
+                # Handle tuple matches (month name groups)
+                if isinstance(match, tuple):
+                    match_str = " ".join([m for m in match if m])
+                else:
+                    match_str = match
+
+                # Clean up the match string
+                clean_match = re.sub(
+                    r"(Published|Posted|Updated|Last updated|Published on|Post published|Written on|Date posted):\s*",
+                    "",
+                    match_str,
+                    flags=re.IGNORECASE,
+                )
+                clean_match = clean_match.strip()
+
+                parsed_date = parser.parse(clean_match)
+                extracted_dates.append(parsed_date)
+            except Exception:
+                continue
+
+    # If no dates found via regex, try more aggressive parsing
+    if not extracted_dates:
+        # Look for dates in first portion of content where publish info is likely
+        content_start = content[:1000]  # First 1000 characters should contain headers
+        words = content_start.split()
+
+        # Look for patterns like "March 15, 2024" in the beginning
+        for i, word in enumerate(words):
+            if i < len(words) - 2:
+                potential_phrase = " ".join(words[i : i + 3])  # Check 3-word phrases
+                try:
+                    # Try to parse potential date phrases
+                    parsed = parser.parse(potential_phrase, fuzzy=True)
+                    # Check if it looks like a reasonable date (not too old/new)
+                    if 1990 <= parsed.year <= 2030:
+                        extracted_dates.append(parsed)
+                except Exception:
+                    pass
+
+    if extracted_dates:
+        # Return the most recent date (assuming newer dates are more relevant)
+        # Or return the earliest date (assuming first mentioned is publication date)
+
+        return min(extracted_dates)
+
+    return None
+
+
+def process_html(url: str, html: str) -> CrawledDocument:
+    """
+    CPU-bound half of an HTML crawl: scraping, pruned markdown generation and
+    date extraction. Runs inside a pool process.
+    """
+    from crawl4ai.content_filter_strategy import PruningContentFilter
+    from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+    scraped = LXMLWebScrapingStrategy().scrap(
+        url,
+        html,
+        excluded_tags=EXCLUDED_TAGS,
+        exclude_external_links=True,
+        exclude_internal_links=True,
+    )
+    markdown = DefaultMarkdownGenerator(
+        content_filter=PruningContentFilter(threshold=0.50, threshold_type="dynamic"),
+        options=MARKDOWN_OPTIONS,
+    ).generate_markdown(input_html=scraped.cleaned_html, base_url=url)
+
+    metadata = scraped.metadata or {}
+
+    return CrawledDocument(
+        url=url,
+        title=metadata.get("title"),
+        content=markdown.fit_markdown,
+        published_at=metadata.get("published_date")
+        or extract_published_date(markdown.raw_markdown),
+        author=metadata.get("author"),
+    )
+
+
+def process_pdf(url: str, data: Optional[bytes], shm_name: Optional[str], size: int):
+    """Extract text from a PDF passed either inline or via shared memory."""
+    from pypdf import PdfReader
+
+    if shm_name:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            data = bytes(shm.buf[:size])
+        finally:
+            shm.close()
+
+    reader = PdfReader(io.BytesIO(data))
+    text = "\n\n".join(page.extract_text() or "" for page in reader.pages)
+    info = reader.metadata or {}
+
+    return CrawledDocument(
+        url=url,
+        title=info.get("/Title"),
+        content=text,
+        published_at=extract_published_date(text),
+        author=info.get("/Author"),
+    )
+
+
+class PostProcessPool:
+    """
+    Process pool for post-fetch parsing, so markdown generation, date parsing
+    and PDF text extraction do not stall the event loop. The pool is created
+    on first use.
+    """
+
+    def __init__(self, workers: int = settings.crawl_process_workers):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info("Starting post-processing pool (workers=%d)", self.workers)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def html(self, url: str, html: str) -> Dict:
+        loop = asyncio.get_running_loop()
+        doc = await loop.run_in_executor(self._get_executor(), process_html, url, html)
+        return doc.model_dump()
+
+    async def pdf(self, url: str, data: bytes) -> Dict:
+        loop = asyncio.get_running_loop()
+
+        if len(data) < SHARED_MEMORY_THRESHOLD:
+            doc = await loop.run_in_executor(
+                self._get_executor(), process_pdf, url, data, None, len(data)
+            )
+            return doc.model_dump()
+
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[: len(data)] = data
+            doc = await loop.run_in_executor(
+                self._get_executor(), process_pdf, url, None, shm.name, len(data)
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return doc.model_dump()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+from app.providers.crawler.base import CrawlProviderBase, failed_result
+from app.utils.dates import restore_date
+from app.workers.task_queue import DONE, FINISHED, TaskQueueBase
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedCrawlProvider(CrawlProviderBase):
+    """
+    Coordinator side of distributed crawling: URLs are enqueued for the crawl
+    workers and their results gathered back from the shared queue.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueueBase,
+        max_attempts: int = 3,
+        poll_interval: float = 0.25,
+        timeout: float = 300.0,
+        retention: float = 3600.0,
+    ):
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        # Finished tasks older than this are deleted after each batch.
+        self.retention = retention
+
+    async def crawl(self, url: str) -> Dict:
+        return (await self.crawl_many([url]))[0]
+
+    async def crawl_many(self, urls: List[str]) -> List[Dict]:
+        """Enqueue every URL at once so all workers can pick them up in parallel."""
+        task_ids = await self.queue.enqueue(
+            [{"url": url} for url in urls], max_attempts=self.max_attempts
+        )
+        results: Dict[int, Dict] = {}
+        deadline = time.monotonic() + self.timeout
+
+        try:
+            while len(results) < len(task_ids) and time.monotonic() < deadline:
+                waiting = [t for t in task_ids if t not in results]
+
+                for task_id, task in (await self.queue.get(waiting)).items():
+                    if task.status == DONE:
+                        results[task_id] = {
+                            **task.result,
+                            "published_at": restore_date(
+                                task.result.get("published_at")
+                            ),
+                        }
+                    elif task.status in FINISHED:
+                        results[task_id] = failed_result(
+                            task.payload["url"], task.error or "Crawl failed"
+                        )
+
+                if len(results) < len(task_ids):
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            # Withdraw anything still queued when we time out or are cancelled.
+            await self.queue.cancel([t for t in task_ids if t not in results])
+
+        purged = await self.queue.purge(self.retention)
+        if purged:
+            logger.info("Purged %d finished crawl tasks", purged)
+
+        return [
+            results.get(task_id)
+            or failed_result(url, "Timed out waiting for crawl worker")
+            for task_id, url in zip(task_ids, urls)
+        ]
@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Union
 
 from pydantic import BaseModel
 
@@ -7,6 +8,6 @@ class CrawledDocument(BaseModel):
     url: str
     title: Optional[str]
     content: Optional[str]
-    published_at: Optional[str]
+    published_at: Optional[Union[datetime, str]]
     author: Optional[str]
     error: Optional[str] = None
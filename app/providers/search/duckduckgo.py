@@ -1,31 +1,48 @@
+import asyncio
 import logging
 from typing import List
 
-from ddgs import DDGS
-from rich.console import Console
-
 from app.providers.search.base import SearchProviderBase
 from app.providers.search.utils import normalize_query
+from app.utils.console import progress
 
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 
 class DuckDuckGoSearchProvider(SearchProviderBase):
-    def __init__(self, max_results: int = 15):
+    def __init__(self, max_results: int = 15, normalize: bool = True):
         self.max_results = max_results
+        # Disabled when a query planner already builds focused sub-queries.
+        self.normalize = normalize
+
+    async def warmup(self) -> None:
+        import ddgs  # noqa: F401
 
     async def search(self, query: str) -> List[str]:
-        normalized_query = normalize_query(query)
+        search_query = normalize_query(query) if self.normalize else query
+
+        progress.print(f"[dim]→ DDG search:[/] {query}", style="cyan")
+
+        # DDGS is synchronous; run it in a thread so concurrent searches
+        # do not block the event loop.
+        urls = await asyncio.to_thread(self._search, search_query)
+
+        logger.info("DuckDuckGo search finished - found %d urls", len(urls))
+        progress.print(
+            f"[green]✓ Found {len(urls)} link{'s' if len(urls) != 1 else ''}[/]"
+        )
+
+        return urls
 
-        console.print(f"[dim]→ DDG search:[/] {query}", style="cyan")
+    def _search(self, query: str) -> List[str]:
+        from ddgs import DDGS
 
         urls: List[str] = []
 
         with DDGS() as ddgs:
             results = ddgs.text(
-                normalized_query,
+                query,
                 max_results=self.max_results,
                 # region="en-ae",
             )
@@ -35,9 +52,4 @@ class DuckDuckGoSearchProvider(SearchProviderBase):
                 if url:
                     urls.append(url)
 
-        logger.info("DuckDuckGo search finished - found %d urls", len(urls))
-        console.print(
-            f"[green]✓ Found {len(urls)} link{'s' if len(urls) != 1 else ''}[/]"
-        )
-
         return urls
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from app.config.settings import settings
+from app.providers.search.base import SearchProviderBase
+from app.utils.ranking import reciprocal_rank_fusion
+from app.utils.urls import canonical_url, domain_of
+
+
+logger = logging.getLogger(__name__)
+
+# Each facet becomes one focused sub-query appended to the user query.
+QUERY_FACETS: Dict[str, str] = {
+    "prices": "property prices price per square foot",
+    "rental_yield": "rental yield rental index rent",
+    "off_plan": "off-plan launches developers handover",
+    "regulation": "DLD regulation Ejari service charge",
+    "region": "UAE Abu Dhabi property market",
+}
+
+
+class QueryPlanner:
+    def __init__(self, facets: Optional[Dict[str, str]] = None, region: str = "Dubai"):
+        self.facets = facets or QUERY_FACETS
+        self.region = region
+
+    def plan(self, query: str) -> List[str]:
+        """Expand a query into the query itself plus one sub-query per facet."""
+        core = " ".join(query.split())
+        if self.region.lower() not in core.lower():
+            core = f"{self.region} {core}"
+
+        return [core] + [f"{core} {terms}" for terms in self.facets.values()]
+
+
+class PlannedSearchProvider(SearchProviderBase):
+    """
+    Runs the planner's sub-queries concurrently against another search
+    provider and merges the result lists with reciprocal rank fusion,
+    allowing at most ``max_per_domain`` URLs from any single domain.
+    """
+
+    def __init__(
+        self,
+        provider: SearchProviderBase,
+        planner: Optional[QueryPlanner] = None,
+        max_results: int = 15,
+        max_per_domain: int = settings.search_max_per_domain,
+    ):
+        self.provider = provider
+        self.planner = planner or QueryPlanner()
+        self.max_results = max_results
+        self.max_per_domain = max_per_domain
+
+    async def warmup(self) -> None:
+        if hasattr(self.provider, "warmup"):
+            await self.provider.warmup()
+
+    async def search(self, query: str) -> List[str]:
+        sub_queries = self.planner.plan(query)
+
+        results = await asyncio.gather(
+            *(self.provider.search(q) for q in sub_queries), return_exceptions=True
+        )
+
+        rankings: List[List[str]] = []
+        for sub_query, result in zip(sub_queries, results):
+            if isinstance(result, Exception):
+                logger.warning("Sub-query failed: %s | %s", sub_query, result)
+                continue
+            rankings.append([canonical_url(url) for url in result])
+
+        urls = self._diversify(reciprocal_rank_fusion(rankings))
+
+        logger.info(
+            "Planned search finished | sub_queries=%d | urls=%d",
+            len(sub_queries),
+            len(urls),
+        )
+
+        return urls
+
+    def _diversify(self, ranked: List[str]) -> List[str]:
+        per_domain: Dict[str, int] = {}
+        urls: List[str] = []
+
+        for url in ranked:
+            domain = domain_of(url)
+            if per_domain.get(domain, 0) >= self.max_per_domain:
+                continue
+
+            per_domain[domain] = per_domain.get(domain, 0) + 1
+            urls.append(url)
+
+            if len(urls) >= self.max_results:
+                break
+
+        return urls
@@ -0,0 +1,65 @@
+import logging
+from typing import List, Optional
+
+from app.config.settings import settings
+from app.core.pipeline.pipeline_service import PipelineService
+from app.scheduler.base import SchedulerBase
+
+
+logger = logging.getLogger(__name__)
+
+
+class APSchedulerPipelineScheduler(SchedulerBase):
+    def __init__(
+        self,
+        pipeline: PipelineService,
+        queries: Optional[List[str]] = None,
+        interval_minutes: int = settings.scheduler_interval_minutes,
+        prewarm: bool = settings.scheduler_prewarm,
+        timezone: str = settings.scheduler_timezone,
+        account_id: Optional[str] = settings.scheduler_account_id,
+    ):
+        self.pipeline = pipeline
+        self.queries = queries or list(settings.scheduler_queries)
+        self.interval_minutes = interval_minutes
+        self.prewarm = prewarm
+        self.timezone = timezone
+        self.account_id = account_id
+        self._scheduler = None
+
+    async def start(self) -> None:
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        if self.prewarm:
+            # Pay the provider import and browser launch cost at boot rather
+            # than inside the first scheduled run.
+            logger.info("Pre-warming pipeline providers")
+            await self.pipeline.warmup()
+
+        self._scheduler = AsyncIOScheduler(timezone=self.timezone)
+
+        for index, query in enumerate(self.queries):
+            self._scheduler.add_job(
+                self.pipeline.run,
+                "interval",
+                minutes=self.interval_minutes,
+                args=[query],
+                kwargs={"account_id": self.account_id} if self.account_id else None,
+                id=f"pipeline-{index}",
+                max_instances=1,
+                coalesce=True,
+            )
+
+        self._scheduler.start()
+        logger.info(
+            "Scheduler started | queries=%d | interval=%dm",
+            len(self.queries),
+            self.interval_minutes,
+        )
+
+    async def shutdown(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+
+        await self.pipeline.close()
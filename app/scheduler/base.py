@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class SchedulerBase(ABC):
+    @abstractmethod
+    async def start(self) -> None:
+        """Register the recurring jobs and start scheduling them."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """Stop scheduling and release pipeline resources."""
+        raise NotImplementedError
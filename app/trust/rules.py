@@ -46,24 +46,21 @@ DEFAULT_AUTHORITY = 0.3
 MAX_DAYS = 365
 
 
-def source_strength(urls: List[str]) -> float:
-    if not urls:
-        return 0.0
+def domain_authority(url: str) -> float:
+    domain: str = urlparse(url).netloc.lower()
+
+    for known, score in DOMAIN_AUTHORITY.items():
+        if domain.endswith(known):
+            return score
 
-    scores: List[float] = []
+    return DEFAULT_AUTHORITY
 
-    for url in urls:
-        domain: str = urlparse(url).netloc.lower()
-        matched: bool = False
 
-        for known, score in DOMAIN_AUTHORITY.items():
-            if domain.endswith(known):
-                scores.append(score)
-                matched = True
-                break
+def source_strength(urls: List[str]) -> float:
+    if not urls:
+        return 0.0
 
-        if not matched:
-            scores.append(DEFAULT_AUTHORITY)
+    scores: List[float] = [domain_authority(url) for url in urls]
 
     return round(sum(scores) / len(scores), 2)
 
@@ -0,0 +1,85 @@
+import atexit
+import queue
+import threading
+from typing import Optional
+
+from app.config.settings import settings
+
+
+class LazyConsole:
+    """
+    Stand-in for rich.console.Console that defers importing rich until the
+    first call, so importing a provider module stays cheap.
+    """
+
+    def __init__(self):
+        self._console = None
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+
+        return getattr(self._console, name)
+
+
+class ProgressSink:
+    """
+    Optional human-readable progress output for crawl, search and analysis.
+    Messages are rendered with rich on a background thread, so providers never
+    wait on terminal I/O; when disabled, ``print`` returns immediately.
+    """
+
+    def __init__(self, enabled: bool = True, console=None):
+        self.enabled = enabled
+        self._console = console or LazyConsole()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def print(self, *objects, **kwargs) -> None:
+        if not self.enabled:
+            return
+
+        if self._thread is None:
+            self._start()
+
+        self._queue.put((objects, kwargs))
+
+    def flush(self, timeout: float = 1.0) -> None:
+        """Wait until everything printed so far has been rendered."""
+        if self._thread is None:
+            return
+
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._render, name="progress-sink", daemon=True
+                )
+                self._thread.start()
+
+    def _render(self) -> None:
+        while True:
+            item = self._queue.get()
+
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+
+            objects, kwargs = item
+            try:
+                self._console.print(*objects, **kwargs)
+            except Exception:
+                # Progress output is best effort and must never break a run.
+                pass
+
+
+progress = ProgressSink(enabled=settings.console_progress)
+
+atexit.register(progress.flush)
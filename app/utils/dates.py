@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Optional, Union
+
+
+def serialize_date(value: Optional[Union[str, datetime]]) -> Optional[str]:
+    """ISO-format datetimes so they can be stored as text or JSON."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def restore_date(value: Optional[str]) -> Optional[Union[str, datetime]]:
+    """Inverse of ``serialize_date``; plain dates stay as strings."""
+    if value and "T" in value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
@@ -1,8 +1,124 @@
+import atexit
+import json
 import logging
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
+from app.config.settings import settings
 
-def setup_logging(level: str):
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of records below WARNING for the loggers listed in
+    ``rates`` (matched by the longest dotted prefix); warnings and errors are
+    never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, float], rng: Optional[random.Random] = None):
+        super().__init__()
+        self.rates = rates
+        self.rng = rng or random.Random()
+        self._cache: Dict[str, float] = {}
+
+    def rate_for(self, name: str) -> float:
+        if name not in self._cache:
+            prefix = name
+            while prefix and prefix not in self.rates:
+                prefix = prefix.rpartition(".")[0]
+            self._cache[name] = self.rates.get(prefix, 1.0)
+
+        return self._cache[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or self.rng.random() < rate
+
+
+def setup_logging(
+    level: str,
+    fmt: Optional[str] = None,
+    sample_rates: Optional[Dict[str, float]] = None,
+) -> QueueListener:
+    """
+    Route all logging through a queue: callers only enqueue the record and a
+    listener thread formats and writes it, so slow terminals or pipes never
+    stall the event loop. Sampling runs before enqueueing, so dropped records
+    cost next to nothing.
+    """
+    global _listener, _queue_handler
+
+    fmt = fmt or settings.log_format
+    sample_rates = settings.log_sample_rates if sample_rates is None else sample_rates
+
+    stop_logging()
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(
+        JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
     )
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(records)
+    if sample_rates:
+        _queue_handler.addFilter(SamplingFilter(sample_rates))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(records, output, respect_handler_level=True)
+    _listener.start()
+
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush pending records and detach the queue handler."""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+from app.config.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Detects event-loop stalls. A heartbeat coroutine ticks every
+    ``interval`` seconds; a watchdog thread notices when a tick is more than
+    ``threshold`` late and captures the loop thread's stack at that moment,
+    which points at whatever blocking call is holding the loop.
+    """
+
+    def __init__(
+        self, threshold: float = 0.1, interval: float = 0.05, history: int = 50
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls: Deque[Dict] = deque(maxlen=history)
+        self._beat = 0.0
+        self._thread_id: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def start(self) -> None:
+        if self._heartbeat is not None:
+            return
+
+        self._thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat = asyncio.create_task(self._tick())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _tick(self) -> None:
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        stall: Optional[Dict] = None
+        beat_at_stall = 0.0
+
+        while not self._stop.wait(self.interval / 2):
+            lag = time.monotonic() - self._beat - self.interval
+
+            if stall is None and lag > self.threshold:
+                frame = sys._current_frames().get(self._thread_id)
+                stall = {
+                    "detected_at": time.time(),
+                    "lag_ms": round(lag * 1000, 1),
+                    "stack": traceback.format_stack(frame) if frame else [],
+                }
+                beat_at_stall = self._beat
+                logger.warning(
+                    "Event loop blocked for %.0f ms\n%s",
+                    lag * 1000,
+                    "".join(stall["stack"][-8:]),
+                    extra={"lag_ms": stall["lag_ms"]},
+                )
+            elif stall is not None and self._beat != beat_at_stall:
+                # The loop is running again; record how long it was blocked.
+                stall["lag_ms"] = round((self._beat - beat_at_stall) * 1000, 1)
+                self.stalls.append(stall)
+                stall = None
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's Python stack every ``interval`` seconds from a
+    background thread and counts identical stacks, producing the "collapsed"
+    format flamegraph.pl, speedscope and inferno read. When the event loop
+    is idle, samples land in the selector: time spent waiting on the network
+    and time spent blocking the loop show up as different towers.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._sample, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[_fold(frame)] += 1
+
+
+class ProfileCapture:
+    def __init__(self, capture_id: str, runs: int, path: Path):
+        self.capture_id = capture_id
+        self.runs = runs
+        self.path = path
+        self.started = 0
+        self.completed = 0
+        self.active = 0
+        self.profiler: Optional[SamplingProfiler] = None
+
+    @property
+    def done(self) -> bool:
+        return self.completed >= self.runs
+
+    def to_dict(self) -> Dict:
+        return {
+            "capture_id": self.capture_id,
+            "runs": self.runs,
+            "completed": self.completed,
+            "done": self.done,
+            "path": str(self.path),
+        }
+
+
+class RunProfiler:
+    """
+    Opt-in profiling of pipeline runs. ``arm(n)`` makes the next ``n`` runs
+    entering ``profile()`` sample the event-loop thread; once all of them
+    have finished, the collapsed stacks are written to
+    ``<output_dir>/<capture_id>.folded``. Unarmed, ``profile()`` costs one
+    attribute check.
+    """
+
+    def __init__(self, output_dir: str = "storage/profiles", interval: float = 0.005):
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.captures: Dict[str, ProfileCapture] = {}
+        self._armed: Optional[ProfileCapture] = None
+
+    def arm(self, runs: int) -> ProfileCapture:
+        if self._armed is not None and not self._armed.done:
+            raise RuntimeError(f"Capture {self._armed.capture_id} is still in progress")
+
+        capture_id = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+        capture = ProfileCapture(
+            capture_id, runs, self.output_dir / f"{capture_id}.folded"
+        )
+        self.captures[capture_id] = capture
+        self._armed = capture
+
+        logger.info(
+            "Profiling the next %d pipeline runs | capture=%s", runs, capture_id
+        )
+        return capture
+
+    @asynccontextmanager
+    async def profile(self):
+        capture = self._armed
+        if capture is None or capture.started >= capture.runs:
+            yield
+            return
+
+        capture.started += 1
+        capture.active += 1
+        if capture.profiler is None:
+            capture.profiler = SamplingProfiler(self.interval)
+            capture.profiler.start()
+
+        try:
+            yield
+        finally:
+            capture.active -= 1
+            capture.completed += 1
+
+            if capture.done and capture.active == 0:
+                capture.profiler.stop()
+                await asyncio.to_thread(self._write, capture)
+                self._armed = None
+
+    def _write(self, capture: ProfileCapture) -> None:
+        capture.path.parent.mkdir(parents=True, exist_ok=True)
+        capture.path.write_text(capture.profiler.collapsed())
+        logger.info(
+            "Profile written | capture=%s | samples=%d | path=%s",
+            capture.capture_id,
+            sum(capture.profiler.samples.values()),
+            capture.path,
+        )
+
+
+def _fold(frame) -> str:
+    names: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+lag_monitor = LoopLagMonitor(threshold=settings.loop_lag_threshold_ms / 1000)
+run_profiler = RunProfiler(settings.profile_output_dir)
@@ -0,0 +1,17 @@
+from typing import Dict, Hashable, List, Sequence
+
+# Standard reciprocal rank fusion constant; dampens the weight of top ranks.
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]], k: int = RRF_K
+) -> List[Hashable]:
+    """Merge several ranked lists into one, best fused score first."""
+    scores: Dict[Hashable, float] = {}
+
+    for ranking in rankings:
+        for rank, item in enumerate(ranking):
+            scores[item] = scores.get(item, 0.0) + 1 / (k + rank + 1)
+
+    return sorted(scores, key=scores.get, reverse=True)
@@ -0,0 +1,39 @@
+import hashlib
+import re
+from typing import List
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the to was "
+    "were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word/number tokens with common English stopwords removed."""
+    if not text:
+        return []
+
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def query_key(query: str) -> str:
+    """Case- and whitespace-insensitive key for grouping runs of one query."""
+    return " ".join(query.lower().split())
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (~4 characters per token for English prose)."""
+    if not text:
+        return 0
+
+    return max(1, len(text) // 4)
+
+
+def content_hash(text: str) -> str:
+    """Stable fingerprint of document text, insensitive to whitespace changes."""
+    normalized = " ".join((text or "").split())
+
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,20 @@
+from typing import Iterable
+from urllib.parse import urldefrag, urlparse
+
+
+def domain_of(url: str) -> str:
+    """Lowercased host without a leading ``www.``."""
+    domain = urlparse(url).netloc.lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def canonical_url(url: str) -> str:
+    """Drop fragments and trailing slashes so the same page compares equal."""
+    parsed = urlparse(urldefrag(url)[0])
+    return parsed._replace(path=parsed.path.rstrip("/") or "/").geturl()
+
+
+def is_blocked(url: str, blocked_domains: Iterable[str]) -> bool:
+    """True when the URL's host is one of the domains or a subdomain of one."""
+    domain = domain_of(url)
+    return any(domain == b or domain.endswith("." + b) for b in blocked_domains)
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+from typing import Callable, Dict, List, Optional
+
+from app.config.settings import settings
+from app.providers.crawler.base import CrawlProviderBase
+from app.utils.dates import serialize_date
+from app.workers.task_queue import SQLiteTaskQueue, TaskQueueBase
+
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlWorker:
+    """
+    Pulls crawl tasks from a shared queue and runs them with its own crawl
+    provider. The lease is renewed while a crawl is in flight; failed crawls
+    go back to the queue with exponential backoff until dead-lettered.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueueBase,
+        crawl_provider: CrawlProviderBase,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = settings.crawl_lease_seconds,
+        poll_interval: float = 0.5,
+        retry_backoff: float = 5.0,
+    ):
+        self.queue = queue
+        self.crawl_provider = crawl_provider
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry_backoff = retry_backoff
+
+    async def run(
+        self, stop: Optional[asyncio.Event] = None, max_tasks: Optional[int] = None
+    ) -> int:
+        """Process tasks until ``stop`` is set or ``max_tasks`` are handled."""
+        stop = stop or asyncio.Event()
+        handled = 0
+
+        logger.info("Crawl worker %s started", self.worker_id)
+
+        try:
+            while not stop.is_set() and (max_tasks is None or handled < max_tasks):
+                task = await self.queue.lease(self.worker_id, self.lease_seconds)
+
+                if task is None:
+                    try:
+                        await asyncio.wait_for(stop.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                await self._process(task)
+                handled += 1
+        finally:
+            if hasattr(self.crawl_provider, "close"):
+                await self.crawl_provider.close()
+
+        logger.info("Crawl worker %s stopped | handled=%d", self.worker_id, handled)
+        return handled
+
+    async def _process(self, task) -> None:
+        url = task.payload["url"]
+        heartbeat = asyncio.create_task(self._heartbeat(task.task_id))
+
+        try:
+            doc = await self.crawl_provider.crawl(url)
+        except Exception as exc:
+            doc = {"url": url, "error": str(exc)}
+        finally:
+            heartbeat.cancel()
+
+        if doc.get("error") or not doc.get("content"):
+            delay = self.retry_backoff * 2 ** (task.attempts - 1)
+            await self.queue.fail(
+                task.task_id, self.worker_id, doc.get("error") or "Empty content", delay
+            )
+            logger.warning(
+                "Crawl task %d failed (attempt %d/%d): %s",
+                task.task_id,
+                task.attempts,
+                task.max_attempts,
+                url,
+            )
+            return
+
+        await self.queue.complete(
+            task.task_id,
+            self.worker_id,
+            {**doc, "published_at": serialize_date(doc.get("published_at"))},
+        )
+
+    async def _heartbeat(self, task_id: int) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await self.queue.renew(task_id, self.worker_id, self.lease_seconds)
+
+
+def _default_provider() -> CrawlProviderBase:
+    from app.providers.crawler.crawl4ai import Crawl4AIProvider
+
+    return Crawl4AIProvider()
+
+
+def _worker_process(
+    queue_path: str,
+    index: int,
+    provider_factory: Callable[[], CrawlProviderBase],
+    worker_options: Dict,
+) -> None:
+    from app.utils.logging import setup_logging
+
+    setup_logging(settings.log_level)
+
+    worker = CrawlWorker(
+        SQLiteTaskQueue(queue_path),
+        provider_factory(),
+        worker_id=f"{socket.gethostname()}:{os.getpid()}:{index}",
+        **worker_options,
+    )
+
+    try:
+        asyncio.run(worker.run())
+    except KeyboardInterrupt:
+        pass
+
+
+def start_worker_processes(
+    workers: int = settings.crawl_workers,
+    queue_path: str = settings.task_queue_path,
+    provider_factory: Callable[[], CrawlProviderBase] = _default_provider,
+    **worker_options,
+) -> List[multiprocessing.Process]:
+    """
+    Start ``workers`` processes, each with its own crawl provider (and so its
+    own browser), pulling from the queue at ``queue_path``. ``provider_factory``
+    must be a picklable top-level callable.
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_worker_process,
+            args=(queue_path, index, provider_factory, worker_options),
+            daemon=True,
+        )
+        for index in range(workers)
+    ]
+
+    for process in processes:
+        process.start()
+
+    return processes
@@ -0,0 +1,329 @@
+import asyncio
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+CANCELLED = "cancelled"
+
+FINISHED = (DONE, DEAD, CANCELLED)
+
+
+class Task:
+    def __init__(
+        self,
+        task_id: int,
+        payload: Dict,
+        attempts: int,
+        max_attempts: int,
+        status: str = QUEUED,
+        result: Optional[Dict] = None,
+        error: Optional[str] = None,
+    ):
+        self.task_id = task_id
+        self.payload = payload
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.status = status
+        self.result = result
+        self.error = error
+
+
+class TaskQueueBase(ABC):
+    """
+    Durable work queue with leases: a leased task that is not completed,
+    failed or renewed before its lease expires becomes available to another
+    worker. Tasks that exhaust ``max_attempts`` are dead-lettered.
+    """
+
+    @abstractmethod
+    async def enqueue(self, payloads: List[Dict], max_attempts: int = 3) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lease(self, worker_id: str, lease_seconds: float) -> Optional[Task]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def renew(self, task_id: int, worker_id: str, lease_seconds: float) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(self, task_id: int, worker_id: str, result: Dict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fail(
+        self, task_id: int, worker_id: str, error: str, retry_delay: float = 0.0
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cancel(self, task_ids: List[int]) -> None:
+        """Withdraw tasks that have not been picked up yet."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, task_ids: List[int]) -> Dict[int, Task]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def dead_letters(self, limit: int = 100) -> List[Task]:
+        raise NotImplementedError
+
+    async def purge(self, older_than: float) -> int:
+        """
+        Delete done and cancelled tasks last updated more than ``older_than``
+        seconds ago and return how many were removed. Dead letters are kept
+        for inspection. Queues without storage to reclaim keep this no-op.
+        """
+        return 0
+
+
+class SQLiteTaskQueue(TaskQueueBase):
+    """
+    Task queue in a SQLite file shared by the coordinator and every worker
+    process. Leases are taken inside ``BEGIN IMMEDIATE`` transactions, so two
+    workers can never hold the same task.
+    """
+
+    def __init__(self, path: Union[str, Path] = "storage/queue/tasks.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = self._connect()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS tasks_ready ON tasks (status, available_at);
+            CREATE INDEX IF NOT EXISTS tasks_updated ON tasks (status, updated_at);
+            """
+        )
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the queue safe to use from
+        # worker threads and forked processes alike.
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    async def enqueue(self, payloads: List[Dict], max_attempts: int = 3) -> List[int]:
+        return await asyncio.to_thread(self._enqueue, payloads, max_attempts)
+
+    async def lease(self, worker_id: str, lease_seconds: float) -> Optional[Task]:
+        return await asyncio.to_thread(self._lease, worker_id, lease_seconds)
+
+    async def renew(self, task_id: int, worker_id: str, lease_seconds: float) -> bool:
+        return await asyncio.to_thread(self._renew, task_id, worker_id, lease_seconds)
+
+    async def complete(self, task_id: int, worker_id: str, result: Dict) -> None:
+        await asyncio.to_thread(self._complete, task_id, worker_id, result)
+
+    async def fail(
+        self, task_id: int, worker_id: str, error: str, retry_delay: float = 0.0
+    ) -> None:
+        await asyncio.to_thread(self._fail, task_id, worker_id, error, retry_delay)
+
+    async def cancel(self, task_ids: List[int]) -> None:
+        await asyncio.to_thread(self._cancel, task_ids)
+
+    async def get(self, task_ids: List[int]) -> Dict[int, Task]:
+        return await asyncio.to_thread(self._get, task_ids)
+
+    async def dead_letters(self, limit: int = 100) -> List[Task]:
+        return await asyncio.to_thread(self._dead_letters, limit)
+
+    async def purge(self, older_than: float) -> int:
+        return await asyncio.to_thread(self._purge, older_than)
+
+    def _enqueue(self, payloads: List[Dict], max_attempts: int) -> List[int]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            ids = [
+                conn.execute(
+                    "INSERT INTO tasks (payload, status, max_attempts, available_at, "
+                    "updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (json.dumps(payload), QUEUED, max_attempts, now, now),
+                ).lastrowid
+                for payload in payloads
+            ]
+            conn.execute("COMMIT")
+            return ids
+        finally:
+            conn.close()
+
+    def _lease(self, worker_id: str, lease_seconds: float) -> Optional[Task]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+
+            # Expired leases on tasks with no attempts left are dead-lettered.
+            conn.execute(
+                "UPDATE tasks SET status = ?, error = COALESCE(error, 'lease expired'), "
+                "lease_owner = NULL, updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (DEAD, now, LEASED, now),
+            )
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE (status = ? AND available_at <= ?) "
+                "OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (QUEUED, now, LEASED, now),
+            ).fetchone()
+
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                "UPDATE tasks SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+
+            return Task(
+                task_id=row["id"],
+                payload=json.loads(row["payload"]),
+                attempts=row["attempts"] + 1,
+                max_attempts=row["max_attempts"],
+                status=LEASED,
+            )
+        finally:
+            conn.close()
+
+    def _renew(self, task_id: int, worker_id: str, lease_seconds: float) -> bool:
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + lease_seconds, now, task_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def _complete(self, task_id: int, worker_id: str, result: Dict) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE tasks SET status = ?, result = ?, error = NULL, "
+                "lease_owner = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, json.dumps(result), time.time(), task_id, LEASED, worker_id),
+            )
+        finally:
+            conn.close()
+
+    def _fail(
+        self, task_id: int, worker_id: str, error: str, retry_delay: float
+    ) -> None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE tasks SET "
+                "status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END, "
+                "available_at = ?, error = ?, lease_owner = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (
+                    DEAD,
+                    QUEUED,
+                    now + retry_delay,
+                    error,
+                    now,
+                    task_id,
+                    LEASED,
+                    worker_id,
+                ),
+            )
+        finally:
+            conn.close()
+
+    def _cancel(self, task_ids: List[int]) -> None:
+        if not task_ids:
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE tasks SET status = ?, updated_at = ? "
+                f"WHERE status = ? AND id IN ({','.join('?' * len(task_ids))})",
+                (CANCELLED, time.time(), QUEUED, *task_ids),
+            )
+        finally:
+            conn.close()
+
+    def _get(self, task_ids: List[int]) -> Dict[int, Task]:
+        if not task_ids:
+            return {}
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE id IN ({','.join('?' * len(task_ids))})",
+                list(task_ids),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return {row["id"]: _row_to_task(row) for row in rows}
+
+    def _dead_letters(self, limit: int) -> List[Task]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE status = ? ORDER BY id LIMIT ?",
+                (DEAD, limit),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [_row_to_task(row) for row in rows]
+
+    def _purge(self, older_than: float) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "DELETE FROM tasks WHERE status IN (?, ?) AND updated_at < ?",
+                (DONE, CANCELLED, time.time() - older_than),
+            ).rowcount
+        finally:
+            conn.close()
+
+
+def _row_to_task(row: sqlite3.Row) -> Task:
+    return Task(
+        task_id=row["id"],
+        payload=json.loads(row["payload"]),
+        attempts=row["attempts"],
+        max_attempts=row["max_attempts"],
+        status=row["status"],
+        result=json.loads(row["result"]) if row["result"] else None,
+        error=row["error"],
+    )
@@ -0,0 +1,83 @@
+"""
+Compare peak Python heap while holding a large run's documents as plain
+dicts vs in a DocumentStore with a memory budget.
+
+    python -m scripts.benchmark_memory --documents 500 --budget-mb 16
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Dict, List
+
+from app.core.pipeline.documents import DocumentStore
+
+
+def synthetic_document(index: int, rng: random.Random) -> Dict:
+    sentences = [
+        f"Unit {index}-{j} in Dubai Marina sold for AED {rng.randint(800_000, 9_000_000)} "
+        f"with a {rng.uniform(4, 9):.1f}% gross rental yield."
+        for j in range(600)
+    ]
+    return {
+        "url": f"https://www.site{index % 20}.ae/market/{index}",
+        "title": f"Market report {index}",
+        "content": "\n\n".join(sentences),
+        "published_at": None,
+        "author": None,
+        "error": None,
+    }
+
+
+def _measure(mode: str, count: int, budget: int) -> Dict:
+    rng = random.Random(7)
+    store = DocumentStore(budget) if mode == "store" else None
+
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    documents: List = []
+    for index in range(count):
+        doc = synthetic_document(index, rng)
+        documents.append(store.add(doc) if store else doc)
+
+    # Read every body once, as fingerprinting and passage selection do.
+    total_chars = sum(len(d["content"]) for d in documents)
+
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    row = {
+        "mode": mode,
+        "peak_mb": peak / 1e6,
+        "seconds": elapsed,
+        "chars": total_chars,
+        "spilled_mb": store.spilled_bytes / 1e6 if store else 0.0,
+    }
+    if store:
+        store.close()
+
+    return row
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--documents", type=int, default=500)
+    arg_parser.add_argument("--budget-mb", type=float, default=16)
+    args = arg_parser.parse_args()
+
+    budget = int(args.budget_mb * 1024 * 1024)
+
+    print(f"{'mode':<8}{'peak MB':>10}{'spilled MB':>12}{'seconds':>9}")
+    for mode in ("dicts", "store"):
+        row = _measure(mode, args.documents, budget)
+        print(
+            f"{row['mode']:<8}{row['peak_mb']:>10.1f}{row['spilled_mb']:>12.1f}"
+            f"{row['seconds']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare event-loop lag with post-fetch parsing inline vs in a process pool.
+
+A probe coroutine sleeps in short ticks and records how late each wake-up
+is; synthetic article pages are then parsed either directly on the loop or
+through PostProcessPool.
+
+    python -m scripts.benchmark_postprocess --pages 40 --workers 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from app.providers.crawler.postprocess import PostProcessPool, process_html
+
+
+TICK = 0.005
+
+
+def synthetic_page(index: int) -> str:
+    paragraph = (
+        "<p>Apartment prices in Dubai Marina rose 12% year on year in March 2026, "
+        "while rental yields held near 7% according to DLD transaction data.</p>"
+    )
+    listings = "".join(
+        f"<li><a href='/listing/{i}'>Listing {i}</a> AED {1_000_000 + i}</li>"
+        for i in range(200)
+    )
+    return (
+        f"<html><head><title>Report {index}</title></head><body>"
+        f"<nav>Home | Buy | Rent</nav><article>{paragraph * 150}</article>"
+        f"<aside><ul>{listings}</ul></aside><footer>Cookies</footer></body></html>"
+    )
+
+
+async def _probe(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - started - TICK)
+
+
+async def _run(mode: str, pages: List[str], workers: int) -> dict:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    pool = PostProcessPool(workers) if mode == "pool" else None
+
+    if pool:
+        # Spawn the workers before timing so start-up is not counted.
+        await pool.html("https://warmup.test/", pages[0])
+
+    started = time.perf_counter()
+
+    if pool:
+        await asyncio.gather(
+            *(pool.html(f"https://a.test/{i}", html) for i, html in enumerate(pages))
+        )
+        pool.shutdown()
+    else:
+        for i, html in enumerate(pages):
+            process_html(f"https://a.test/{i}", html)
+            await asyncio.sleep(0)
+
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+
+    return {
+        "mode": mode,
+        "seconds": elapsed,
+        "lag_p50_ms": statistics.median(lags_ms),
+        "lag_p95_ms": lags_ms[int(len(lags_ms) * 0.95) - 1],
+        "lag_max_ms": lags_ms[-1],
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--pages", type=int, default=40)
+    arg_parser.add_argument("--workers", type=int, default=2)
+    args = arg_parser.parse_args()
+
+    pages = [synthetic_page(i) for i in range(args.pages)]
+
+    print(f"{'mode':<8}{'seconds':>9}{'lag p50':>10}{'lag p95':>10}{'lag max':>10}")
+    for mode in ("inline", "pool"):
+        row = asyncio.run(_run(mode, pages, args.workers))
+        print(
+            f"{row['mode']:<8}{row['seconds']:>9.2f}{row['lag_p50_ms']:>10.1f}"
+            f"{row['lag_p95_ms']:>10.1f}{row['lag_max_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Measure cold-start cost of the API and CLI entry points.
+
+Each target is imported in a fresh interpreter several times; the script
+reports wall-clock startup, the cumulative ``-X importtime`` of the target,
+peak RSS and which heavy provider dependencies ended up loaded.
+
+    python -m scripts.benchmark_startup --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ["crawl4ai", "playwright", "ddgs", "httpx", "rich"]
+
+TARGETS: Dict[str, str] = {
+    "app.main": "import app.main",
+    # run_path with the default run_name skips the ``__main__`` block, so only
+    # the module-level imports are measured.
+    "scripts/run_pipeline.py": "import runpy; runpy.run_path('scripts/run_pipeline.py')",
+}
+
+PROBE = """
+import json, resource, sys
+{statement}
+print(json.dumps({{
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def _run_once(statement: str) -> Dict:
+    code = PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    probe["wall_ms"] = wall_ms
+    probe["import_ms"] = _total_import_ms(completed.stderr)
+
+    return probe
+
+
+def _total_import_ms(importtime_log: str) -> float:
+    """Sum the cumulative time of every top-level import in an importtime log."""
+    total_us = 0
+
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if not name.startswith(" ") or name.startswith("  "):
+            continue
+
+        total_us += int(cumulative.strip())
+
+    return total_us / 1000
+
+
+def benchmark(runs: int) -> List[Dict]:
+    report = []
+
+    for name, statement in TARGETS.items():
+        samples = [_run_once(statement) for _ in range(runs)]
+
+        report.append(
+            {
+                "target": name,
+                "wall_ms_median": round(
+                    statistics.median(s["wall_ms"] for s in samples), 1
+                ),
+                "import_ms_median": round(
+                    statistics.median(s["import_ms"] for s in samples), 1
+                ),
+                "max_rss_mb": round(max(s["max_rss_kb"] for s in samples) / 1024, 1),
+                "heavy_loaded": samples[-1]["loaded"],
+            }
+        )
+
+    return report
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = arg_parser.parse_args()
+
+    report = benchmark(args.runs)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'target':<26}{'wall ms':>10}{'import ms':>12}{'rss MB':>9}  heavy")
+    for row in report:
+        print(
+            f"{row['target']:<26}{row['wall_ms_median']:>10}"
+            f"{row['import_ms_median']:>12}{row['max_rss_mb']:>9}  "
+            f"{', '.join(row['heavy_loaded']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measure crawl throughput against the number of worker processes.
+
+Uses a stub provider that holds each task for a fixed latency plus a burst of
+CPU work, so the numbers reflect queue and process overhead rather than the
+network.
+
+    python -m scripts.benchmark_workers --tasks 200 --workers 1 2 4
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from app.providers.crawler.base import CrawlProviderBase
+from app.providers.crawler.queued import QueuedCrawlProvider
+from app.workers.crawl_worker import start_worker_processes
+from app.workers.task_queue import SQLiteTaskQueue
+
+
+class StubCrawlProvider(CrawlProviderBase):
+    def __init__(self, latency: float = 0.05, cpu_iterations: int = 200_000):
+        self.latency = latency
+        self.cpu_iterations = cpu_iterations
+
+    async def crawl(self, url: str) -> dict:
+        await asyncio.sleep(self.latency)
+        sum(i * i for i in range(self.cpu_iterations))
+        return {"url": url, "title": None, "content": "stub", "error": None}
+
+
+def stub_provider() -> CrawlProviderBase:
+    return StubCrawlProvider()
+
+
+async def _drive(queue_path: Path, tasks: int) -> float:
+    provider = QueuedCrawlProvider(SQLiteTaskQueue(queue_path), poll_interval=0.05)
+
+    started = time.perf_counter()
+    results = await provider.crawl_many(
+        [f"https://stub.test/{i}" for i in range(tasks)]
+    )
+    elapsed = time.perf_counter() - started
+
+    assert all(not r["error"] for r in results)
+    return elapsed
+
+
+def benchmark(tasks: int, worker_counts: list) -> None:
+    print(f"{'workers':>8}{'seconds':>10}{'tasks/s':>10}{'speedup':>9}")
+    baseline = None
+
+    for workers in worker_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            queue_path = Path(tmp) / "tasks.db"
+            SQLiteTaskQueue(queue_path)
+            processes = start_worker_processes(
+                workers, str(queue_path), stub_provider, poll_interval=0.05
+            )
+            try:
+                elapsed = asyncio.run(_drive(queue_path, tasks))
+            finally:
+                for process in processes:
+                    process.terminate()
+                    process.join()
+
+        rate = tasks / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>8}{elapsed:>10.2f}{rate:>10.1f}{rate / baseline:>8.2f}x")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--tasks", type=int, default=200)
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = arg_parser.parse_args()
+
+    benchmark(args.tasks, args.workers)
+
+
+if __name__ == "__main__":
+    main()
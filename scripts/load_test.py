@@ -0,0 +1,324 @@
+"""
+Load-test the HTTP API and compare worker and concurrency configurations.
+
+The app runs with stub pipeline providers (sleeps instead of search, crawl
+and LLM calls), so the numbers measure the API, the run queue and storage.
+With no DPP_PIPELINE_API_KEYS set, stub mode also serves the run endpoints
+without an API key.
+``--workers 0`` serves the app in-process over an ASGI transport (no
+sockets, no HTTP parsing); ``--workers N`` starts ``uvicorn --workers N`` on
+a local port. Every configuration gets fresh storage seeded with one insight.
+
+    python -m scripts.load_test --workers 0 1 2 4 --concurrency 10 50 --duration 10
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+QUERY = "Dubai Marina apartment prices"
+
+# name -> (method, path, params/body)
+SCENARIOS = {
+    "health": ("GET", "/health", None),
+    "insight": ("GET", "/insights/latest", {"query": QUERY}),
+    "submit": ("POST", "/pipeline/runs", {"query": QUERY}),
+}
+
+SEED_INSIGHT = {
+    "query": QUERY,
+    "sources": [f"https://stub{i}.test/seed" for i in range(6)],
+    "insights": {
+        "summary": "Seeded insight for load testing.",
+        "key_trends": ["prices rising"],
+        "market_sentiment": "positive",
+        "evidence": [],
+    },
+}
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition(":")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario {name!r}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def _environment(storage: Path) -> Dict[str, str]:
+    return {
+        "DPP_PIPELINE_STUB_PROVIDERS": "true",
+        "DPP_INSIGHT_STORAGE_PATH": str(storage / "insights"),
+        "DPP_INSIGHT_ROLLUPS_PATH": str(storage / "insights" / "rollups.db"),
+        "DPP_PROFILE_OUTPUT_DIR": str(storage / "profiles"),
+        "DPP_LOG_LEVEL": "WARNING",
+    }
+
+
+async def _seed(storage: Path) -> None:
+    from app.data.repositories.insight_repo import JSONInsightRepository
+
+    await JSONInsightRepository(str(storage / "insights")).save(SEED_INSIGHT)
+
+
+async def _client_loop(
+    make_client: Callable[[], httpx.AsyncClient],
+    mix: Dict[str, int],
+    deadline: float,
+    rng: random.Random,
+    samples: Dict[str, List[Tuple[float, int]]],
+) -> None:
+    names, weights = list(mix), list(mix.values())
+
+    async with make_client() as client:
+        await _requests(client, names, weights, deadline, rng, samples)
+
+
+async def _requests(
+    client: httpx.AsyncClient,
+    names: List[str],
+    weights: List[int],
+    deadline: float,
+    rng: random.Random,
+    samples: Dict[str, List[Tuple[float, int]]],
+) -> None:
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, payload = SCENARIOS[name]
+
+        started = time.perf_counter()
+        try:
+            if method == "GET":
+                response = await client.get(path, params=payload)
+            else:
+                response = await client.post(path, json=payload)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        samples[name].append((time.perf_counter() - started, status))
+
+
+async def _drive(
+    make_client: Callable[[], httpx.AsyncClient],
+    concurrency: int,
+    duration: float,
+    mix: Dict[str, int],
+) -> Tuple[Dict[str, List[Tuple[float, int]]], float]:
+    samples: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+    started = time.perf_counter()
+    deadline = started + duration
+
+    # One client (and connection) per simulated user: a single shared
+    # httpx pool becomes the bottleneck well before the server does.
+    await asyncio.gather(
+        *(
+            _client_loop(make_client, mix, deadline, random.Random(i), samples)
+            for i in range(concurrency)
+        )
+    )
+    return samples, time.perf_counter() - started
+
+
+async def _run_in_process(
+    storage: Path, concurrency: int, duration: float, mix: Dict[str, int]
+):
+    # Settings are read at import time, so the environment from main() must be
+    # in place before the app is imported.
+    from app.api.deps import (
+        get_insight_repository,
+        get_insight_rollups,
+        get_pipeline_runner,
+    )
+    from app.config.settings import settings
+    from app.main import app
+
+    settings.insight_storage_path = str(storage / "insights")
+    settings.insight_rollups_path = str(storage / "insights" / "rollups.db")
+    for dependency in (
+        get_pipeline_runner,
+        get_insight_repository,
+        get_insight_rollups,
+    ):
+        dependency.cache_clear()
+
+    await _seed(storage)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        return await _drive(
+            lambda: httpx.AsyncClient(transport=transport, base_url="http://loadtest"),
+            concurrency,
+            duration,
+            mix,
+        )
+    finally:
+        if get_pipeline_runner.cache_info().currsize:
+            await get_pipeline_runner().close()
+        get_insight_rollups().close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_uvicorn(workers: int, storage: Path, port: int) -> subprocess.Popen:
+    env = {**os.environ, **_environment(storage)}
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("uvicorn did not become healthy within 30s")
+
+
+async def _run_uvicorn(
+    port: int, concurrency: int, duration: float, mix: Dict[str, int]
+):
+    return await _drive(
+        lambda: httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=30),
+        concurrency,
+        duration,
+        mix,
+    )
+
+
+def _report(
+    label: str,
+    concurrency: int,
+    samples: Dict[str, List[Tuple[float, int]]],
+    elapsed: float,
+) -> None:
+    rows = dict(samples)
+    rows["all"] = [s for name in samples for s in samples[name]]
+
+    for name, entries in rows.items():
+        if not entries:
+            continue
+        latencies = sorted(latency * 1000 for latency, _ in entries)
+        rejected = sum(1 for _, status in entries if status == 429)
+        errors = sum(
+            1 for _, status in entries if status != 429 and not 200 <= status < 400
+        )
+        print(
+            f"{label:>9}{concurrency:>6}{name:>9}{len(entries):>9}"
+            f"{len(entries) / elapsed:>9.1f}"
+            f"{_percentile(latencies, 0.5):>8.1f}"
+            f"{_percentile(latencies, 0.9):>8.1f}"
+            f"{_percentile(latencies, 0.99):>8.1f}"
+            f"{100 * errors / len(entries):>8.1f}"
+            f"{100 * rejected / len(entries):>8.1f}"
+        )
+
+
+def benchmark(
+    worker_counts: List[int],
+    concurrencies: List[int],
+    duration: float,
+    mix: Dict[str, int],
+) -> None:
+    print(
+        f"{'workers':>9}{'conc':>6}{'endpoint':>9}{'requests':>9}{'rps':>9}"
+        f"{'p50 ms':>8}{'p90 ms':>8}{'p99 ms':>8}{'err %':>8}{'429 %':>8}"
+    )
+
+    for workers in worker_counts:
+        for concurrency in concurrencies:
+            with tempfile.TemporaryDirectory() as tmp:
+                storage = Path(tmp)
+                process: Optional[subprocess.Popen] = None
+
+                if workers == 0:
+                    label = "asgi"
+                    samples, elapsed = asyncio.run(
+                        _run_in_process(storage, concurrency, duration, mix)
+                    )
+                else:
+                    label = str(workers)
+                    asyncio.run(_seed(storage))
+                    port = _free_port()
+                    process = _start_uvicorn(workers, storage, port)
+                    try:
+                        samples, elapsed = asyncio.run(
+                            _run_uvicorn(port, concurrency, duration, mix)
+                        )
+                    finally:
+                        process.terminate()
+                        process.wait(timeout=30)
+
+            _report(label, concurrency, samples, elapsed)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[0, 1, 2],
+        help="uvicorn worker processes; 0 serves the app in-process",
+    )
+    arg_parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50])
+    arg_parser.add_argument("--duration", type=float, default=10.0)
+    arg_parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default="health:2,insight:7,submit:1",
+        help="scenario weights, e.g. health:2,insight:7,submit:1",
+    )
+    args = arg_parser.parse_args()
+
+    os.environ.update(_environment(Path(tempfile.gettempdir())))
+    benchmark(args.workers, args.concurrency, args.duration, args.mix)
+
+
+if __name__ == "__main__":
+    main()
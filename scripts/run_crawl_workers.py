@@ -0,0 +1,26 @@
+import argparse
+
+from app.config.settings import settings
+from app.utils.logging import setup_logging
+from app.workers.crawl_worker import start_worker_processes
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Run crawl worker processes")
+    arg_parser.add_argument("--workers", type=int, default=settings.crawl_workers)
+    arg_parser.add_argument("--queue", default=settings.task_queue_path)
+    args = arg_parser.parse_args()
+
+    setup_logging(settings.log_level)
+
+    processes = start_worker_processes(args.workers, args.queue)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
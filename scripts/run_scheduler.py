@@ -0,0 +1,37 @@
+import asyncio
+
+from app.config.settings import settings
+from app.core.pipeline.factory import (
+    build_entitlements,
+    build_pipeline,
+    build_usage_meter,
+)
+from app.scheduler.apscheduler_impl import APSchedulerPipelineScheduler
+from app.utils.logging import setup_logging
+from app.utils.profiling import lag_monitor
+
+
+async def main() -> None:
+    setup_logging(settings.log_level)
+
+    if settings.loop_lag_monitor_enabled:
+        await lag_monitor.start()
+
+    meter = build_usage_meter()
+    entitlements = build_entitlements(meter) if meter else None
+    if meter:
+        await meter.start()
+
+    scheduler = APSchedulerPipelineScheduler(build_pipeline(meter, entitlements))
+    await scheduler.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await scheduler.shutdown()
+        if meter:
+            await meter.stop()
+        await lag_monitor.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+from datetime import date
+
+from app.api.deps import get_insight_repository, get_insight_rollups
+from app.main import app
+
+
+class StubRollups:
+    def __init__(self):
+        self.calls = []
+
+    async def range(self, query, start, end):
+        self.calls.append((query, start, end))
+        return [{"day": end.isoformat(), "runs": 1}]
+
+
+def test_insight_trends_endpoint(test_client):
+    rollups = StubRollups()
+    app.dependency_overrides[get_insight_rollups] = lambda: rollups
+
+    try:
+        response = test_client.get(
+            "/insights/trends", params={"query": "Dubai Marina", "days": 30}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["days"] == [{"day": body["end"], "runs": 1}]
+
+    query, start, end = rollups.calls[0]
+    assert query == "Dubai Marina"
+    assert (end - start).days == 29
+    assert isinstance(start, date)
+
+
+def test_insight_trends_requires_query(test_client):
+    app.dependency_overrides[get_insight_rollups] = StubRollups
+
+    try:
+        assert test_client.get("/insights/trends").status_code == 422
+    finally:
+        app.dependency_overrides.clear()
+
+
+class StubInsightRepository:
+    async def load_latest_for_query(self, query):
+        return {"query": query, "insights": {}} if query == "Dubai Marina" else None
+
+
+def test_latest_insight_endpoint(test_client):
+    app.dependency_overrides[get_insight_repository] = StubInsightRepository
+
+    try:
+        found = test_client.get("/insights/latest", params={"query": "Dubai Marina"})
+        missing = test_client.get("/insights/latest", params={"query": "Abu Dhabi"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert found.status_code == 200
+    assert found.json()["query"] == "Dubai Marina"
+    assert missing.status_code == 404
@@ -0,0 +1,109 @@
+import pytest
+
+from app.api.deps import get_entitlements, get_pipeline_runner
+from app.config.settings import settings
+from app.core.pipeline.runner import PipelineQueueFullError, PipelineRun
+from app.main import app
+from app.monetization.limits import QuotaExceededError
+
+
+AUTH = {"X-Api-Key": "key-a"}
+
+
+@pytest.fixture(autouse=True)
+def api_keys(monkeypatch):
+    monkeypatch.setattr(settings, "pipeline_api_keys", {"key-a": "acct-a"})
+
+
+class StubRunner:
+    def __init__(self, full: bool = False):
+        self.full = full
+        self.runs = {}
+
+    def submit(self, query, account_id=None):
+        if self.full:
+            raise PipelineQueueFullError("100 pipeline runs already waiting")
+        run = PipelineRun(query, account_id)
+        self.runs[run.run_id] = run
+        return run
+
+    def get(self, run_id):
+        return self.runs.get(run_id)
+
+
+class Entitlements:
+    def __init__(self, exhausted: bool = False):
+        self.exhausted = exhausted
+
+    async def enforce(self, account_id, metric, amount=1):
+        if self.exhausted:
+            raise QuotaExceededError(account_id, metric, 10, 10)
+
+
+def test_submit_and_poll_run(test_client, monkeypatch):
+    runner = StubRunner()
+    app.dependency_overrides[get_pipeline_runner] = lambda: runner
+    app.dependency_overrides[get_entitlements] = lambda: Entitlements()
+    monkeypatch.setitem(settings.pipeline_api_keys, "key-b", "acct-b")
+
+    try:
+        response = test_client.post(
+            "/pipeline/runs", json={"query": "Dubai Marina"}, headers=AUTH
+        )
+        run_id = response.json()["run_id"]
+        polled = test_client.get(f"/pipeline/runs/{run_id}", headers=AUTH)
+        other = test_client.get(
+            f"/pipeline/runs/{run_id}", headers={"X-Api-Key": "key-b"}
+        )
+        missing = test_client.get("/pipeline/runs/unknown", headers=AUTH)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+    assert runner.runs[run_id].account_id == "acct-a"
+    assert polled.json()["query"] == "Dubai Marina"
+    assert other.status_code == missing.status_code == 404
+
+
+def test_submit_rejected_when_queue_full(test_client):
+    app.dependency_overrides[get_pipeline_runner] = lambda: StubRunner(full=True)
+    app.dependency_overrides[get_entitlements] = lambda: None
+
+    try:
+        full = test_client.post(
+            "/pipeline/runs", json={"query": "Dubai Marina"}, headers=AUTH
+        )
+        empty = test_client.post("/pipeline/runs", json={"query": ""}, headers=AUTH)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert full.status_code == 429
+    assert empty.status_code == 422
+
+
+def test_submit_needs_api_key_and_quota(test_client, monkeypatch):
+    runner = StubRunner()
+    app.dependency_overrides[get_pipeline_runner] = lambda: runner
+    app.dependency_overrides[get_entitlements] = lambda: Entitlements(exhausted=True)
+    body = {"query": "Dubai Marina"}
+
+    try:
+        anonymous = test_client.post("/pipeline/runs", json=body)
+        wrong = test_client.post(
+            "/pipeline/runs", json=body, headers={"X-Api-Key": "x"}
+        )
+        over_quota = test_client.post("/pipeline/runs", json=body, headers=AUTH)
+
+        monkeypatch.setattr(settings, "pipeline_api_keys", {})
+        disabled = test_client.post("/pipeline/runs", json=body, headers=AUTH)
+        monkeypatch.setattr(settings, "pipeline_stub_providers", True)
+        stub_mode = test_client.post("/pipeline/runs", json=body)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert anonymous.status_code == wrong.status_code == 401
+    assert over_quota.status_code == 429
+    assert disabled.status_code == 404
+    assert stub_mode.status_code == 202
+    assert len(runner.runs) == 1
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from app.events.backends import InMemoryBrokerBackend, SQLiteEventBackend
+from app.events.bus import EventBus
+from app.events.events import DocumentCrawled, InsightSaved, SearchCompleted
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_only_their_event_types():
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    bus.subscribe((SearchCompleted,), handler)
+
+    await bus.publish(SearchCompleted(query="q", urls=["https://a.ae/"]))
+    await bus.publish(InsightSaved(query="q", result={}))
+    await bus.stop()
+
+    assert [type(e) for e in received] == [SearchCompleted]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    bus = EventBus()
+    release = asyncio.Event()
+
+    async def slow(event):
+        await release.wait()
+
+    bus.subscribe((SearchCompleted,), slow, max_queue=1)
+    await bus.publish(SearchCompleted(query="1", urls=[]))  # taken by the worker
+    await bus.publish(SearchCompleted(query="2", urls=[]))  # fills the queue
+    await asyncio.sleep(0)
+
+    blocked = asyncio.create_task(bus.publish(SearchCompleted(query="3", urls=[])))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_affect_other_subscribers():
+    bus = EventBus(InMemoryBrokerBackend())
+    received = []
+
+    async def broken(event):
+        raise RuntimeError("boom")
+
+    async def healthy(event):
+        received.append(event.url)
+
+    bus.subscribe((DocumentCrawled,), broken)
+    bus.subscribe((DocumentCrawled,), healthy, concurrency=2)
+
+    await bus.publish(DocumentCrawled(query="q", url="https://a.ae/"))
+    await bus.stop()
+
+    assert received == ["https://a.ae/"]
+
+
+@pytest.mark.asyncio
+async def test_durable_subscription_replays_unacknowledged_events(tmp_path):
+    backend = SQLiteEventBackend(tmp_path / "events.db")
+    bus = EventBus(backend)
+    await bus.publish(InsightSaved(query="before", result={"ok": True}))
+    await bus.stop()
+
+    replayed = []
+
+    async def persist(event):
+        replayed.append(event.query)
+
+    restarted = EventBus(SQLiteEventBackend(tmp_path / "events.db"))
+    restarted.subscribe((InsightSaved,), persist, durable_name="persistence")
+    await restarted.start()
+    await restarted.publish(InsightSaved(query="after", result={}))
+    await restarted.stop()
+
+    assert replayed == ["before", "after"]
+    assert await backend.read("persistence", ["InsightSaved"]) == []
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_keeps_only_newest_events(tmp_path):
+    backend = SQLiteEventBackend(tmp_path / "events.db", max_events=150)
+
+    for i in range(300):
+        await backend.append(SearchCompleted(query=str(i), urls=[]))
+
+    events = await backend.read("audit", ["SearchCompleted"], limit=1000)
+    backend.close()
+
+    assert len(events) == 150
+    assert events[0][1].query == "150"
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_stays_bounded_and_keeps_offsets():
+    backend = InMemoryBrokerBackend(max_events=150)
+
+    for i in range(250):
+        await backend.append(SearchCompleted(query=str(i), urls=[]))
+    await backend.ack("audit", 180)
+    for i in range(250, 300):
+        await backend.append(SearchCompleted(query=str(i), urls=[]))
+
+    assert len(backend._log) == 150
+    events = await backend.read("audit", ["SearchCompleted"], limit=1000)
+    assert [position for position, _ in events] == list(range(181, 301))
+    assert events[0][1].query == "180"
+    lagging = await backend.read("new", ["SearchCompleted"], limit=1000)
+    assert lagging[0][1].query == "150"
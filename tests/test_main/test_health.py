@@ -2,3 +2,38 @@ def test_health_endpoint(test_client):
     response = test_client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
+
+
+def test_admin_profile_endpoints(test_client, tmp_path, monkeypatch):
+    from app.config.settings import settings
+    from app.utils.profiling import run_profiler
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    monkeypatch.setattr(run_profiler, "output_dir", tmp_path)
+    monkeypatch.setattr(run_profiler, "_armed", None)
+    auth = {"X-Admin-Token": "secret"}
+
+    response = test_client.post("/admin/profile", params={"runs": 2}, headers=auth)
+    assert response.status_code == 200
+    capture_id = response.json()["capture_id"]
+
+    assert test_client.post("/admin/profile", headers=auth).status_code == 409
+    response = test_client.get(f"/admin/profile/{capture_id}", headers=auth)
+    assert response.json()["completed"] == 0
+    response = test_client.get(f"/admin/profile/{capture_id}/folded", headers=auth)
+    assert response.status_code == 404
+    response = test_client.get("/admin/loop-lag", headers=auth)
+    assert response.json()["stalls"] == []
+
+
+def test_admin_routes_need_a_configured_token(test_client, monkeypatch):
+    from app.config.settings import settings
+
+    monkeypatch.setattr(settings, "admin_token", "")
+    assert test_client.get("/admin/loop-lag").status_code == 404
+    assert test_client.post("/admin/profile").status_code == 404
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    assert test_client.get("/admin/loop-lag").status_code == 403
+    response = test_client.get("/admin/loop-lag", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = ["crawl4ai", "playwright", "ddgs", "httpx", "rich"]
+
+
+@pytest.mark.parametrize("module", ["app.main", "app.core.pipeline.factory"])
+def test_import_does_not_load_provider_dependencies(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert completed.stdout.strip() == ""
@@ -0,0 +1,103 @@
+import pytest
+
+from app.data.repositories.usage_repo import SQLiteUsageRepository
+from app.monetization.entitlements import EntitlementService
+from app.monetization.limits import LLM_TOKENS, PIPELINE_RUNS, QuotaExceededError
+from app.monetization.plans import Plan, get_plan
+from app.monetization.usage import UsageMeter
+
+
+class CountingRepository(SQLiteUsageRepository):
+    reads = 0
+
+    async def totals(self, account_ids, period):
+        self.reads += 1
+        return await super().totals(account_ids, period)
+
+
+def build(tmp_path, plan: Plan, ttl: float = 60.0):
+    repository = CountingRepository(tmp_path / "usage.db")
+    meter = UsageMeter(repository)
+    service = EntitlementService(repository, meter, lambda _: plan, ttl=ttl)
+    return repository, meter, service
+
+
+@pytest.mark.asyncio
+async def test_checks_are_served_from_cached_snapshot(tmp_path):
+    repository, meter, service = build(
+        tmp_path, Plan(name="test", daily_limits={PIPELINE_RUNS: 3})
+    )
+
+    for _ in range(3):
+        await service.enforce("acct-1", PIPELINE_RUNS)
+        meter.record("acct-1", PIPELINE_RUNS)
+
+    with pytest.raises(QuotaExceededError) as exc_info:
+        await service.enforce("acct-1", PIPELINE_RUNS)
+
+    assert exc_info.value.used == 3
+    assert await service.remaining("acct-1", PIPELINE_RUNS) == 0
+    assert repository.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_refreshes_snapshots_without_double_counting(tmp_path):
+    repository, meter, service = build(
+        tmp_path, Plan(name="test", daily_limits={LLM_TOKENS: 1000})
+    )
+    await service.snapshot("acct-1")
+
+    meter.record("acct-1", LLM_TOKENS, 400)
+    await meter.flush()
+
+    assert await service.remaining("acct-1", LLM_TOKENS) == 600
+    assert await service.check("acct-1", LLM_TOKENS, 600)
+    assert not await service.check("acct-1", LLM_TOKENS, 601)
+    assert repository.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_usage_is_counted_once_while_flush_listeners_run(tmp_path):
+    repository, meter, service = build(
+        tmp_path, Plan(name="test", daily_limits={LLM_TOKENS: 1000})
+    )
+    await service.snapshot("acct-1")
+    seen = []
+
+    async def check_during_flush(batch):
+        seen.append(await service.check("acct-1", LLM_TOKENS, 600))
+
+    meter.on_flush(check_during_flush)
+    meter.record("acct-1", LLM_TOKENS, 400)
+    await meter.flush()
+
+    assert seen == [True]
+    assert meter.pending("acct-1", LLM_TOKENS) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_reloads_stored_usage(tmp_path):
+    repository, meter, service = build(
+        tmp_path, Plan(name="test", daily_limits={PIPELINE_RUNS: 2}), ttl=0.0
+    )
+
+    # Usage recorded by another process goes straight to the store.
+    other = UsageMeter(repository)
+    other.record("acct-1", PIPELINE_RUNS, 2)
+    await other.flush()
+
+    assert not await service.check("acct-1", PIPELINE_RUNS)
+
+
+@pytest.mark.asyncio
+async def test_unlimited_metrics(tmp_path):
+    _, meter, service = build(tmp_path, get_plan("enterprise"))
+    meter.record("acct-1", LLM_TOKENS, 10**9)
+
+    assert await service.remaining("acct-1", LLM_TOKENS) is None
+    await service.enforce("acct-1", LLM_TOKENS, 10**9)
+
+
+def test_unknown_plan():
+    with pytest.raises(ValueError):
+        get_plan("platinum")
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.data.repositories.usage_repo import SQLiteUsageRepository
+from app.monetization.limits import CRAWLED_PAGES, PIPELINE_RUNS
+from app.monetization.usage import UsageMeter, current_period
+
+
+@pytest.mark.asyncio
+async def test_records_are_batched_until_flush(tmp_path):
+    repository = SQLiteUsageRepository(tmp_path / "usage.db")
+    meter = UsageMeter(repository, shards=4)
+
+    for _ in range(50):
+        meter.record("acct-1", CRAWLED_PAGES, 2)
+    meter.record("acct-2", PIPELINE_RUNS)
+
+    assert await repository.totals(["acct-1"], current_period()) == {}
+    assert meter.pending("acct-1", CRAWLED_PAGES) == 100
+
+    assert await meter.flush() == 2
+    assert meter.pending("acct-1", CRAWLED_PAGES) == 0
+
+    meter.record("acct-1", CRAWLED_PAGES, 5)
+    await meter.flush()
+
+    totals = await repository.totals(["acct-1", "acct-2"], current_period())
+    assert totals == {
+        "acct-1": {CRAWLED_PAGES: 105},
+        "acct-2": {PIPELINE_RUNS: 1},
+    }
+
+
+class FailingRepository(SQLiteUsageRepository):
+    fail = True
+
+    async def add(self, counts):
+        if self.fail:
+            raise RuntimeError("database is locked")
+        await super().add(counts)
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_counts_for_retry(tmp_path):
+    repository = FailingRepository(tmp_path / "usage.db")
+    meter = UsageMeter(repository)
+    meter.record("acct-1", PIPELINE_RUNS, 3)
+
+    with pytest.raises(RuntimeError):
+        await meter.flush()
+
+    assert meter.pending("acct-1", PIPELINE_RUNS) == 3
+
+    repository.fail = False
+    await meter.stop()
+
+    totals = await repository.totals(["acct-1"], current_period())
+    assert totals["acct-1"][PIPELINE_RUNS] == 3
+
+
+@pytest.mark.asyncio
+async def test_periodic_flush(tmp_path):
+    repository = SQLiteUsageRepository(tmp_path / "usage.db")
+    meter = UsageMeter(repository, flush_interval=0.01)
+    await meter.start()
+
+    meter.record("acct-1", PIPELINE_RUNS)
+    await asyncio.sleep(0.1)
+
+    totals = await repository.totals(["acct-1"], current_period())
+    await meter.stop()
+
+    assert totals == {"acct-1": {PIPELINE_RUNS: 1}}
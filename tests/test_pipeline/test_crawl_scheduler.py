@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from app.core.pipeline.crawl_scheduler import CrawlScheduler
+
+
+def test_rank_prefers_authority_and_spreads_domains():
+    scheduler = CrawlScheduler()
+    urls = [
+        "https://unknown-blog.com/a",
+        "https://www.bayut.com/1",
+        "https://www.bayut.com/2",
+        "https://gulfnews.com/x",
+    ]
+
+    ranked = scheduler.rank(urls)
+
+    assert ranked[:2] == ["https://www.bayut.com/1", "https://gulfnews.com/x"]
+    assert ranked[-1] == "https://unknown-blog.com/a"
+
+
+def test_rank_uses_cached_freshness():
+    scheduler = CrawlScheduler()
+    urls = ["https://a.com/stale", "https://b.com/new"]
+
+    ranked = scheduler.rank(urls, known={"https://a.com/stale": {"published_at": None}})
+
+    assert ranked == ["https://b.com/new", "https://a.com/stale"]
+
+
+@pytest.mark.asyncio
+async def test_crawl_stops_once_target_is_reached():
+    scheduler = CrawlScheduler(
+        target_documents=2, min_average_authority=0.0, min_total_chars=0, concurrency=3
+    )
+    started, cancelled = [], []
+
+    async def crawl(url):
+        started.append(url)
+        try:
+            await asyncio.sleep(0.5 if url.endswith("slow") else 0)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return {"url": url, "content": "text", "error": None}
+
+    urls = ["https://a.com/1", "https://b.com/slow", "https://c.com/2"] + [
+        f"https://d{i}.com/" for i in range(5)
+    ]
+
+    documents = await scheduler.crawl(urls, crawl)
+
+    assert [d["url"] for d in documents] == ["https://a.com/1", "https://c.com/2"]
+    assert cancelled == ["https://b.com/slow"]
+    assert len(started) == 3
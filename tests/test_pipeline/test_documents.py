@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.pipeline.documents import CompactDocument, DocumentStore, content_length
+
+
+def make_doc(index: int, content: str) -> dict:
+    return {
+        "url": f"https://www.site{index % 3}.ae/report/{index}",
+        "title": f"Report {index}",
+        "content": content,
+        "published_at": None,
+        "author": None,
+        "error": None,
+        "from_index": True,
+    }
+
+
+def test_compact_document_behaves_like_the_original_dict():
+    content = "Apartment prices in Dubai Marina rose 12%. " * 200
+    doc = make_doc(1, content)
+
+    compact = DocumentStore(memory_budget=1 << 20).add(doc)
+
+    assert isinstance(compact, CompactDocument)
+    assert compact["content"] == content
+    assert compact.get("missing") is None
+    assert compact.domain == "site1.ae"
+    assert content_length(compact) == content_length(doc) == len(content)
+    assert dict(compact) == doc
+    assert {**compact, "content": "x"}["title"] == "Report 1"
+
+
+def test_urls_and_domains_are_interned():
+    store = DocumentStore(memory_budget=1 << 20)
+    first = store.add(make_doc(3, "a"))
+    second = store.add({**make_doc(3, "b"), "url": "https://www.site0.ae/other"})
+
+    assert first.domain is second.domain
+    assert store.add(make_doc(3, "c")).url is first.url
+
+
+def test_bodies_spill_to_disk_once_budget_is_exceeded():
+    store = DocumentStore(memory_budget=10_000)
+    contents = [
+        "".join(
+            f"Unit {i}-{j} sold for AED {(i * 7919 + j * 104729) % 999983}. "
+            for j in range(300)
+        )
+        for i in range(50)
+    ]
+
+    docs = [store.add(make_doc(i, c)) for i, c in enumerate(contents)]
+
+    assert store.resident_bytes <= 10_000
+    assert store.spilled_bytes > 0
+    assert any(d.spilled for d in docs)
+    assert [d["content"] for d in docs] == contents
+
+    store.close()
+
+    with pytest.raises(ValueError):
+        next(d for d in docs if d.spilled)["content"]
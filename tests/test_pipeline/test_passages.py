@@ -0,0 +1,51 @@
+from app.core.pipeline.passages import PassageSelector
+
+
+RELEVANT = (
+    "Average apartment prices in Dubai Marina rose 12% year on year, "
+    "while rental yield held near 7% according to DLD transaction data."
+)
+NOISE = "Accept cookies to continue browsing. Sign up for our newsletter today."
+
+
+def _document(url, paragraphs):
+    return {"url": url, "title": None, "content": "\n\n".join(paragraphs)}
+
+
+def test_select_keeps_relevant_passages_tagged_with_source():
+    selector = PassageSelector(min_passage_chars=1)
+    documents = [_document("https://a.ae/1", [NOISE, RELEVANT, NOISE])]
+
+    selected = selector.select("Dubai Marina prices", documents)
+
+    assert len(selected) == 1
+    assert selected[0]["content"] == RELEVANT
+    assert selected[0]["passages"][0]["source_url"] == "https://a.ae/1"
+
+
+def test_select_respects_token_budgets():
+    selector = PassageSelector(
+        min_passage_chars=1, max_tokens_per_document=40, max_tokens_total=60
+    )
+    documents = [
+        _document(f"https://site{i}.ae/", [RELEVANT, RELEVANT + " Villas too."])
+        for i in range(3)
+    ]
+
+    selected = selector.select("prices", documents)
+
+    assert 0 < len(selected) < 3
+    for doc in selected:
+        assert len(doc["passages"]) == 1
+
+
+def test_select_drops_documents_without_relevant_passages():
+    selector = PassageSelector(min_passage_chars=1)
+    documents = [
+        _document("https://a.ae/", [RELEVANT]),
+        _document("https://b.ae/", ["Lorem ipsum dolor sit amet."]),
+    ]
+
+    selected = selector.select("prices", documents)
+
+    assert [d["url"] for d in selected] == ["https://a.ae/"]
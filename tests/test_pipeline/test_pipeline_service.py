@@ -0,0 +1,331 @@
+import pytest
+
+from app.core.pipeline.passages import PassageSelector
+from app.core.pipeline.pipeline_service import PipelineService
+from app.monetization.usage import current_period
+
+
+class StubSearch:
+    def __init__(self, urls):
+        self.urls = urls
+
+    async def search(self, query):
+        return list(self.urls)
+
+
+class StubCrawler:
+    def __init__(self, pages):
+        self.pages = pages
+        self.crawled = []
+
+    async def crawl(self, url):
+        self.crawled.append(url)
+        return {
+            "url": url,
+            "title": None,
+            "content": self.pages.get(url),
+            "published_at": None,
+            "author": None,
+            "error": None if self.pages.get(url) else "Empty content",
+        }
+
+
+class StubAI:
+    def __init__(self):
+        self.calls = []
+        self.updates = []
+
+    async def update(self, previous, documents):
+        self.updates.append((previous, documents))
+        return {
+            **previous,
+            "evidence": [{"claim": "new", "source_url": documents[0]["url"]}],
+        }
+
+    async def analyze(self, documents):
+        self.calls.append(documents)
+        return {
+            "summary": "ok",
+            "key_trends": [],
+            "market_sentiment": "neutral",
+            "evidence": [{"claim": "c", "source_url": documents[0]["url"]}],
+        }
+
+
+class StubRepository:
+    def __init__(self):
+        self.saved = []
+
+    async def save(self, data):
+        self.saved.append(data)
+
+    async def load_latest(self):
+        return self.saved[-1] if self.saved else None
+
+    async def load_latest_for_query(self, query):
+        matches = [d for d in self.saved if d.get("query") == query]
+        return matches[-1] if matches else None
+
+
+def build(pages, **kwargs):
+    return PipelineService(
+        search_provider=StubSearch(pages),
+        crawl_provider=StubCrawler(pages),
+        ai_provider=StubAI(),
+        insight_repository=StubRepository(),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_skips_failed_crawls_and_saves_result():
+    pipeline = build({"https://a.ae/": "Prices rose.", "https://b.ae/": None})
+
+    result = await pipeline.run("dubai")
+
+    assert result["sources"] == ["https://a.ae/"]
+    assert pipeline.insight_repository.saved == [result]
+
+
+@pytest.mark.asyncio
+async def test_run_sends_selected_passages_to_ai():
+    content = "Apartment prices rose 10% in Dubai.\n\nSubscribe to our newsletter."
+    pipeline = build(
+        {"https://a.ae/": content},
+        passage_selector=PassageSelector(min_passage_chars=1),
+    )
+
+    await pipeline.run("prices")
+
+    (analyzed,) = pipeline.ai_provider.calls
+    assert analyzed[0]["content"] == "Apartment prices rose 10% in Dubai."
+
+
+@pytest.mark.asyncio
+async def test_run_supplements_scarce_documents_from_corpus_index(tmp_path):
+    from app.data.repositories.corpus_repo import SQLiteCorpusIndex
+
+    index = SQLiteCorpusIndex(tmp_path / "corpus.db")
+    await index.add(
+        [
+            {"url": f"https://old{i}.ae/", "content": f"Dubai prices report {i}."}
+            for i in range(6)
+        ]
+    )
+    pipeline = build({"https://a.ae/": "Dubai prices rose."}, corpus_index=index)
+
+    result = await pipeline.run("dubai prices")
+
+    # Indexed documents reach the analysis but are not scored as corroboration.
+    assert result["documents_collected"] == 1
+    assert result["documents_from_index"] == 4
+    assert len(result["sources"]) == 5
+    assert result["sources"][0] == "https://a.ae/"
+    assert "confidence" not in result["insights"]
+
+
+@pytest.mark.asyncio
+async def test_run_ignores_stale_index_documents(tmp_path):
+    from app.data.repositories.corpus_repo import SQLiteCorpusIndex
+
+    index = SQLiteCorpusIndex(tmp_path / "corpus.db")
+    await index.add(
+        [
+            {"url": f"https://old{i}.ae/", "content": f"Dubai prices report {i}."}
+            for i in range(6)
+        ]
+    )
+    index._conn.execute("UPDATE documents SET crawled_at = 0")
+    pipeline = build(
+        {"https://a.ae/": "Dubai prices rose."},
+        corpus_index=index,
+        index_max_age=86400,
+    )
+
+    result = await pipeline.run("dubai prices")
+    await pipeline.close()
+
+    assert result["documents_from_index"] == 0
+    assert result["sources"] == ["https://a.ae/"]
+
+
+@pytest.mark.asyncio
+async def test_zero_index_max_age_uses_no_index_documents(tmp_path):
+    from app.data.repositories.corpus_repo import SQLiteCorpusIndex
+
+    index = SQLiteCorpusIndex(tmp_path / "corpus.db")
+    await index.add(
+        [
+            {"url": f"https://old{i}.ae/", "content": f"Dubai prices report {i}."}
+            for i in range(6)
+        ]
+    )
+    pipeline = build(
+        {"https://a.ae/": "Dubai prices rose."}, corpus_index=index, index_max_age=0
+    )
+
+    result = await pipeline.run("dubai prices")
+    await pipeline.close()
+
+    assert result["documents_from_index"] == 0
+
+
+@pytest.mark.asyncio
+async def test_incremental_run_only_sends_changed_documents():
+    pages = {"https://a.ae/": "Prices rose.", "https://b.ae/": "Rents flat."}
+    pipeline = build(pages, incremental=True)
+    first = await pipeline.run("dubai")
+
+    pages["https://b.ae/"] = "Rents fell 3%."
+    second = await pipeline.run("dubai")
+
+    assert first["analysis_mode"] == "full"
+    assert second["analysis_mode"] == "incremental"
+    assert second["documents_analyzed"] == 1
+    (previous, changed) = pipeline.ai_provider.updates[0]
+    assert [d["url"] for d in changed] == ["https://b.ae/"]
+    assert second["insights"]["evidence"] == [
+        {"claim": "c", "source_url": "https://a.ae/"},
+        {"claim": "new", "source_url": "https://b.ae/"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_run_reuses_insight_when_nothing_changed():
+    pipeline = build({"https://a.ae/": "Prices rose."}, incremental=True)
+    await pipeline.run("dubai")
+
+    result = await pipeline.run("dubai")
+
+    assert result["analysis_mode"] == "reused"
+    assert len(pipeline.ai_provider.calls) == 1
+    assert pipeline.ai_provider.updates == []
+
+
+@pytest.mark.asyncio
+async def test_run_publishes_stage_events():
+    from app.events.bus import EventBus
+    from app.events.events import Event
+
+    bus = EventBus()
+    seen = []
+
+    async def record(event):
+        seen.append(type(event).__name__)
+
+    bus.subscribe((Event,), record)
+    pipeline = build({"https://a.ae/": "Prices rose."}, event_bus=bus)
+
+    await pipeline.run("dubai")
+    await bus.stop()
+
+    assert seen == [
+        "SearchCompleted",
+        "DocumentCrawled",
+        "AnalysisCompleted",
+        "InsightSaved",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_meters_usage_for_account(tmp_path):
+    from app.data.repositories.usage_repo import SQLiteUsageRepository
+    from app.monetization.usage import UsageMeter
+
+    meter = UsageMeter(SQLiteUsageRepository(tmp_path / "usage.db"))
+    pipeline = build(
+        {"https://a.ae/": "Prices rose " * 10, "https://b.ae/": None},
+        usage_meter=meter,
+    )
+
+    await pipeline.run("dubai", account_id="acct-1")
+    await pipeline.run("dubai")
+
+    assert meter.pending("acct-1", "pipeline_runs") == 1
+    assert meter.pending("acct-1", "crawled_pages") == 1
+    assert meter.pending("acct-1", "llm_tokens") == 30
+
+
+@pytest.mark.asyncio
+async def test_run_records_usage_and_refuses_account_over_quota(tmp_path):
+    from app.data.repositories.usage_repo import SQLiteUsageRepository
+    from app.monetization.entitlements import EntitlementService
+    from app.monetization.limits import QuotaExceededError
+    from app.monetization.plans import Plan
+    from app.monetization.usage import UsageMeter
+
+    repository = SQLiteUsageRepository(tmp_path / "usage.db")
+    meter = UsageMeter(repository)
+    plan = Plan(name="trial", daily_limits={"pipeline_runs": 1})
+    entitlements = EntitlementService(repository, meter, lambda _: plan)
+    pipeline = build(
+        {"https://a.ae/": "Prices rose."},
+        usage_meter=meter,
+        entitlements=entitlements,
+    )
+
+    await pipeline.run("dubai", account_id="acct-1")
+    await meter.flush()
+
+    with pytest.raises(QuotaExceededError):
+        await pipeline.run("dubai", account_id="acct-1")
+
+    totals = await repository.totals(["acct-1"], current_period())
+    assert totals["acct-1"]["pipeline_runs"] == 1
+    assert len(pipeline.insight_repository.saved) == 1
+    # Runs without an account (scheduler default) are not metered or limited.
+    await pipeline.run("dubai")
+
+
+@pytest.mark.asyncio
+async def test_run_with_memory_budget_spills_documents(tmp_path):
+    pages = {f"https://a{i}.ae/": f"Dubai prices report {i}. " * 50 for i in range(6)}
+    pipeline = build(pages, memory_budget=0, spill_dir=str(tmp_path))
+
+    result = await pipeline.run("dubai prices")
+
+    assert result["sources"] == list(pages)
+    assert result["documents_collected"] == 6
+    assert result["fingerprints"]["https://a0.ae/"]
+
+
+@pytest.mark.asyncio
+async def test_failed_analysis_is_not_saved():
+    pipeline = build({"https://a.ae/": "Prices rose."})
+
+    async def failing(documents):
+        return {"error": "HTTP 503", "raw": None}
+
+    pipeline.ai_provider.analyze = failing
+
+    result = await pipeline.run("dubai")
+
+    assert result["error"] == "HTTP 503"
+    assert pipeline.insight_repository.saved == []
+
+
+@pytest.mark.asyncio
+async def test_batch_crawl_provider_gets_ranked_urls_in_one_call():
+    from app.core.pipeline.crawl_scheduler import CrawlScheduler
+
+    class BatchCrawler(StubCrawler):
+        def __init__(self, pages):
+            super().__init__(pages)
+            self.batches = []
+
+        async def crawl_many(self, urls):
+            self.batches.append(list(urls))
+            return [await self.crawl(url) for url in urls]
+
+    pages = {
+        "https://blog.example.com/": "Rents flat.",
+        "https://dubailand.gov.ae/": "Up.",
+    }
+    pipeline = build(pages, crawl_scheduler=CrawlScheduler())
+    pipeline.crawl_provider = BatchCrawler(pages)
+
+    await pipeline.run("dubai")
+
+    assert pipeline.crawl_provider.batches == [
+        ["https://dubailand.gov.ae/", "https://blog.example.com/"]
+    ]
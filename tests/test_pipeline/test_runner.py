@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from app.core.pipeline.runner import DONE, PipelineQueueFullError, PipelineRunner
+from app.core.pipeline.stubs import build_stub_pipeline
+from app.data.repositories.insight_repo import JSONInsightRepository
+
+
+async def wait_finished(run, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while run.finished_at is None:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_runner_completes_stub_pipeline_run(tmp_path):
+    repository = JSONInsightRepository(str(tmp_path))
+    runner = PipelineRunner(build_stub_pipeline(repository, latency=0))
+
+    run = runner.submit("Dubai Marina apartment prices")
+    await wait_finished(run)
+    await runner.close()
+
+    assert run.status == DONE, run.error
+    assert runner.get(run.run_id) is run
+    assert run.result["insights"]["market_sentiment"] == "positive"
+
+    saved = await repository.load_latest_for_query("Dubai Marina apartment prices")
+    assert saved["query"] == "Dubai Marina apartment prices"
+
+
+@pytest.mark.asyncio
+async def test_runner_rejects_submissions_beyond_pending_limit(tmp_path):
+    pipeline = build_stub_pipeline(JSONInsightRepository(str(tmp_path)), latency=1)
+    runner = PipelineRunner(pipeline, max_concurrent=1, max_pending=2, history=2)
+
+    runs = [runner.submit(f"query {i}") for i in range(2)]
+    with pytest.raises(PipelineQueueFullError):
+        runner.submit("one too many")
+
+    await runner.close()
+
+    assert all(run.status == "failed" for run in runs)
+    assert runner._pending == 0
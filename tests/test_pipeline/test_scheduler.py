@@ -0,0 +1,33 @@
+import pytest
+
+from app.scheduler.apscheduler_impl import APSchedulerPipelineScheduler
+
+
+class StubPipeline:
+    def __init__(self):
+        self.warmed = False
+        self.closed = False
+
+    async def warmup(self):
+        self.warmed = True
+
+    async def run(self, query):
+        return {"query": query}
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prewarm", [True, False])
+async def test_scheduler_prewarm_option(prewarm):
+    pipeline = StubPipeline()
+    scheduler = APSchedulerPipelineScheduler(
+        pipeline, queries=["dubai"], prewarm=prewarm
+    )
+
+    await scheduler.start()
+    await scheduler.shutdown()
+
+    assert pipeline.warmed is prewarm
+    assert pipeline.closed
@@ -0,0 +1,275 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.providers.ai.compaction import PromptCompactor, resolve_evidence
+from app.providers.ai.ollama import OllamaCloudProvider
+from app.providers.ai.routing import CircuitBreaker, RoutingAIProvider
+
+
+NAV = "Home | Buy | Rent | Commercial"
+COOKIES = "We use cookies to improve your experience. Accept all"
+
+DOCUMENTS = [
+    {
+        "url": "https://www.a.ae/marina",
+        "title": "Marina prices",
+        "published_at": datetime(2026, 3, 1, 9, 30),
+        "content": "\n".join(
+            [
+                NAV,
+                "## Dubai Marina",
+                "Apartment   prices rose **12%** year on year, per [DLD](https://dld.gov.ae).",
+                "",
+                "| Area | Price |",
+                "|------|-------|",
+                "| Marina | AED 1.9m |",
+                COOKIES,
+            ]
+        ),
+    },
+    {
+        "url": "https://b.com/jvc",
+        "title": "JVC yields",
+        "published_at": None,
+        "content": "\n".join(
+            [
+                NAV,
+                "Rental yields in JVC held near 8%.",
+                "![chart](https://b.com/chart.png)",
+                "Related listings",
+            ]
+        ),
+    },
+    {"url": "https://c.ae/empty", "title": "Empty", "content": None},
+]
+
+
+def test_compactor_strips_boilerplate_and_markdown():
+    compacted = PromptCompactor().compact(DOCUMENTS)
+
+    assert compacted.source_ids == {
+        "S1": "https://www.a.ae/marina",
+        "S2": "https://b.com/jvc",
+    }
+    assert compacted.text == (
+        "[S1] | Marina prices | 2026-03-01 | a.ae\n"
+        "Dubai Marina\n"
+        "Apartment prices rose 12% year on year, per DLD.\n"
+        "Area; Price\n"
+        "Marina; AED 1.9m\n"
+        "\n"
+        "[S2] | JVC yields | b.com\n"
+        "Rental yields in JVC held near 8%."
+    )
+    assert compacted.boilerplate_lines == 4
+    assert compacted.compact_tokens < compacted.original_tokens
+    assert compacted.saved_ratio > 0.3
+
+
+def test_resolve_evidence_maps_source_ids_to_urls():
+    result = {
+        "evidence": [
+            {"claim": "Prices rose", "source_url": "[S1]"},
+            {"claim": "Yields held", "source": "S2"},
+            {"claim": "Kept", "source_url": "https://x.ae/"},
+            {"claim": "Unknown", "source_url": "S9"},
+        ]
+    }
+
+    resolved = resolve_evidence(result, {"S1": "https://a.ae/", "S2": "https://b.ae/"})
+
+    assert [e["source_url"] for e in resolved["evidence"]] == [
+        "https://a.ae/",
+        "https://b.ae/",
+        "https://x.ae/",
+        "S9",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ollama_sends_compacted_prompt_and_resolves_evidence():
+    provider = OllamaCloudProvider(compactor=PromptCompactor())
+    prompts = []
+
+    async def complete(prompt):
+        prompts.append(prompt)
+        return {"summary": "ok", "evidence": [{"claim": "c", "source_url": "S2"}]}
+
+    provider._complete = complete
+
+    result = await provider.analyze(DOCUMENTS)
+
+    assert "[S2] | JVC yields | b.com" in prompts[0]
+    assert "'content':" not in prompts[0]
+    assert result["evidence"] == [{"claim": "c", "source_url": "https://b.com/jvc"}]
+
+
+@pytest.mark.asyncio
+async def test_ollama_update_sends_prior_analysis_as_compact_json():
+    provider = OllamaCloudProvider(compactor=PromptCompactor())
+    prompts = []
+
+    async def complete(prompt):
+        prompts.append(prompt)
+        return {"summary": "ok", "evidence": []}
+
+    provider._complete = complete
+    previous = {"summary": "Prix en hausse", "key_trends": [], "evidence": []}
+
+    await provider.update(previous, DOCUMENTS)
+
+    assert (
+        '{"summary":"Prix en hausse","key_trends":[],"market_sentiment":null}'
+        in prompts[0]
+    )
+
+
+GOOD = {
+    "summary": "Prices rose.",
+    "key_trends": ["prices up"],
+    "market_sentiment": "positive",
+    "evidence": [{"claim": "Prices rose 12%", "source_url": "https://www.a.ae/marina"}],
+}
+
+
+class ScriptedAI:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def analyze(self, documents):
+        self.calls += 1
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def test_circuit_breaker_opens_and_probes_half_open():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=30, clock=lambda: now[0]
+    )
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    now[0] = 31
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 62
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_small_sets_use_fast_model_and_escalate_on_invalid_output():
+    fast = ScriptedAI(
+        {**GOOD, "evidence": [{"claim": "x", "source_url": "https://made-up.ae/"}]}
+    )
+    strong = ScriptedAI(GOOD)
+    router = RoutingAIProvider(fast, strong)
+
+    assert await router.analyze(DOCUMENTS[:2]) == GOOD
+    assert (fast.calls, strong.calls) == (1, 1)
+
+    fast.results = [GOOD]
+    assert await router.analyze(DOCUMENTS[:2]) == GOOD
+    assert (fast.calls, strong.calls) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_large_sets_go_to_strong_model():
+    fast, strong = ScriptedAI(GOOD), ScriptedAI(GOOD)
+    router = RoutingAIProvider(fast, strong, max_fast_documents=1)
+
+    await router.analyze(DOCUMENTS[:2])
+
+    assert (fast.calls, strong.calls) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_large_sets_fall_back_to_fast_model_when_strong_output_is_unparseable():
+    strong = ScriptedAI({"error": "Invalid JSON", "raw_output": "Sure! Here"})
+    fast = ScriptedAI(GOOD)
+    router = RoutingAIProvider(fast, strong, max_fast_documents=1)
+
+    assert await router.analyze(DOCUMENTS[:2]) == GOOD
+    assert (fast.calls, strong.calls) == (1, 1)
+    assert router.breakers["strong"].state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_and_falls_back():
+    strong = ScriptedAI({"error": "HTTP 503", "raw": "unavailable"})
+    fast = ScriptedAI(GOOD)
+    router = RoutingAIProvider(
+        fast,
+        strong,
+        max_fast_documents=1,
+        strong_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+    )
+
+    for _ in range(3):
+        assert await router.analyze(DOCUMENTS[:2]) == GOOD
+
+    assert strong.calls == 2
+    assert router.breakers["strong"].state == "open"
+
+    fast.results = [{"error": "HTTP 503", "raw": "unavailable"}]
+    result = await router.analyze(DOCUMENTS[:2])
+    assert result["error"] == "HTTP 503"
+    assert strong.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_releases_the_breaker():
+    class HangingAI:
+        async def analyze(self, documents):
+            await asyncio.sleep(10)
+
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=30, clock=lambda: now[0]
+    )
+    breaker.record_failure()
+    now[0] = 31
+    router = RoutingAIProvider(HangingAI(), ScriptedAI(GOOD), fast_breaker=breaker)
+
+    task = asyncio.create_task(router.analyze(DOCUMENTS[:2]))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_compactor_keeps_fact_quoted_by_several_sites():
+    fact = "Prices rose 12% in Q3, per DLD"
+    documents = [
+        {"url": f"https://{site}/q3", "content": f"{NAV}\n{fact}\nSite {site} report"}
+        for site in ("a.ae", "b.com", "c.ae")
+    ] + [
+        {
+            "url": f"https://a.ae/{page}",
+            "content": f"Copyright 2026 A Media.\nPage {page} story.",
+        }
+        for page in ("x", "y")
+    ]
+
+    compactor = PromptCompactor()
+    compacted = compactor.compact(documents)
+
+    assert compacted.text.count(fact) == 3
+    assert NAV not in compacted.text
+    # Template text repeated within one site is still dropped.
+    assert "Copyright" not in compacted.text
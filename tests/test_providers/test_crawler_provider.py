@@ -0,0 +1,254 @@
+import asyncio
+import io
+from datetime import datetime
+
+import pytest
+
+from app.providers.crawler import postprocess
+from app.providers.crawler.crawl4ai import Crawl4AIProvider
+from app.providers.crawler.hedged import HedgedCrawlProvider
+from app.providers.crawler.http import HttpCrawlProvider
+from app.providers.crawler.latency import DomainLatencyTracker
+from app.providers.crawler.postprocess import (
+    PostProcessPool,
+    extract_published_date,
+    process_html,
+)
+
+
+ARTICLE = (
+    "<html><head><title>Dubai prices</title><meta name='author' content='Jo'></head>"
+    "<body><nav>Home | Buy</nav><article><h1>Prices</h1>"
+    + "<p>Published: March 15, 2026. Apartment prices in Dubai Marina rose 12% "
+    "according to DLD transaction data.</p>"
+    * 10
+    + "</article><footer>Cookies</footer></body></html>"
+)
+
+
+def test_extract_published_date_from_content():
+    content = "Market update\nPublished: March 15, 2026\nPrices rose."
+
+    published = extract_published_date(content)
+
+    assert (published.year, published.month) == (2026, 3)
+
+
+def test_process_html_builds_document():
+    doc = process_html("https://a.ae/prices", ARTICLE)
+
+    assert doc.title == "Dubai prices"
+    assert doc.author == "Jo"
+    assert "Dubai Marina rose 12%" in doc.content
+    assert "Home | Buy" not in doc.content
+    assert isinstance(doc.published_at, datetime)
+    assert (doc.published_at.year, doc.published_at.month) == (2026, 3)
+
+
+@pytest.mark.asyncio
+async def test_pool_processes_html_and_pdf_via_shared_memory(monkeypatch):
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    writer.add_metadata({"/Title": "DLD Rental Index", "/Author": "DLD"})
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    monkeypatch.setattr(postprocess, "SHARED_MEMORY_THRESHOLD", 0)
+    pool = PostProcessPool(workers=1)
+    try:
+        html_doc = await pool.html("https://a.ae/prices", ARTICLE)
+        pdf_doc = await pool.pdf("https://dld.ae/index.pdf", buffer.getvalue())
+    finally:
+        pool.shutdown()
+
+    assert html_doc["title"] == "Dubai prices"
+    assert pdf_doc["title"] == "DLD Rental Index"
+    assert pdf_doc["author"] == "DLD"
+
+
+class SleepyCrawler:
+    def __init__(self, delay, content="Body", error=None):
+        self.delay = delay
+        self.content = content
+        self.error = error
+        self.cancelled = 0
+
+    async def crawl(self, url):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"url": url, "content": self.content, "error": self.error}
+
+
+def test_latency_tracker_derives_timeouts_from_domain_history():
+    tracker = DomainLatencyTracker(
+        min_samples=3, min_timeout=1.0, max_timeout=10.0, default_timeout=20.0
+    )
+
+    assert tracker.timeout_for("https://slow.ae/a") == 20.0
+
+    for seconds in (1.0, 2.0, 3.0, 4.0):
+        tracker.record("https://slow.ae/a", seconds)
+    for seconds in (0.1, 0.2, 0.2):
+        tracker.record("https://www.fast.ae/b", seconds)
+
+    assert tracker.percentile("https://slow.ae/other", 0.95) == 4.0
+    assert tracker.timeout_for("https://slow.ae/other") == 8.0
+    assert tracker.timeout_for("https://fast.ae/c") == 1.0
+    # Domains without history use the global window.
+    assert tracker.timeout_for("https://new.ae/") == 8.0
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_when_primary_is_slow():
+    primary = SleepyCrawler(5.0, content="browser")
+    provider = HedgedCrawlProvider(
+        primary,
+        hedge=SleepyCrawler(0.01, content="http"),
+        tracker=DomainLatencyTracker(default_timeout=2.0, default_hedge_after=0.05),
+    )
+
+    doc = await provider.crawl("https://slow.ae/")
+
+    assert doc["content"] == "http"
+    assert primary.cancelled == 1
+    assert (provider.hedges_launched, provider.hedges_won) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_when_primary_answers_in_time():
+    hedge = SleepyCrawler(0.0, content="http")
+    provider = HedgedCrawlProvider(
+        SleepyCrawler(0.01, content="browser"),
+        hedge=hedge,
+        tracker=DomainLatencyTracker(default_hedge_after=1.0),
+    )
+
+    doc = await provider.crawl("https://fast.ae/")
+
+    assert doc["content"] == "browser"
+    assert provider.hedges_launched == 0
+    assert provider.tracker.percentile("https://fast.ae/", 0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_primary_failure_hedges_immediately_and_timeout_is_enforced():
+    provider = HedgedCrawlProvider(
+        SleepyCrawler(0.0, content=None, error="HTTP 403"),
+        hedge=SleepyCrawler(0.01, content="http"),
+        tracker=DomainLatencyTracker(default_hedge_after=10.0),
+    )
+    assert (await provider.crawl("https://a.ae/"))["content"] == "http"
+
+    stuck = HedgedCrawlProvider(
+        SleepyCrawler(5.0),
+        hedge=SleepyCrawler(5.0),
+        tracker=DomainLatencyTracker(default_timeout=0.1, default_hedge_after=0.02),
+    )
+    doc = await stuck.crawl("https://stuck.ae/")
+
+    assert doc["error"].startswith("Timed out")
+    assert stuck.primary.cancelled == stuck.hedge.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_latency_hedges_are_capped_but_failures_still_hedge():
+    provider = HedgedCrawlProvider(
+        SleepyCrawler(0.1, content="browser"),
+        hedge=SleepyCrawler(0.2, content="http"),
+        tracker=DomainLatencyTracker(default_timeout=2.0, default_hedge_after=0.01),
+        max_hedge_ratio=0.5,
+    )
+
+    for _ in range(4):
+        await provider.crawl("https://slow.ae/")
+
+    assert provider.hedges_launched == 2
+
+    provider.primary = SleepyCrawler(0.0, content=None, error="HTTP 403")
+    assert (await provider.crawl("https://slow.ae/"))["content"] == "http"
+    assert provider.hedges_launched == 3
+
+
+@pytest.mark.asyncio
+async def test_http_tier_skips_blocked_domains():
+    provider = HttpCrawlProvider(blocked_domains=["blocked.ae"])
+
+    doc = await provider.crawl("https://news.blocked.ae/article")
+
+    assert doc["error"] == "Blocked domain"
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_crawls_start_one_browser(monkeypatch):
+    provider = Crawl4AIProvider()
+    started = []
+
+    async def start_crawler():
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(provider, "_start_crawler", start_crawler)
+
+    crawlers = await asyncio.gather(*(provider._get_crawler() for _ in range(4)))
+
+    assert len(started) == 1
+    assert all(c is crawlers[0] for c in crawlers)
+
+
+@pytest.mark.asyncio
+async def test_offloaded_crawl_applies_domain_and_content_type_filters():
+    from crawl4ai.deep_crawling.filters import (
+        ContentTypeFilter,
+        DomainFilter,
+        FilterChain,
+    )
+
+    class Pool:
+        def __init__(self):
+            self.shut_down = False
+
+        async def html(self, url, html):
+            return {"url": url, "content": "Body", "error": None}
+
+        def shutdown(self):
+            self.shut_down = True
+
+    class Strategy:
+        def __init__(self):
+            self.fetched = []
+
+        async def crawl(self, url, config=None):
+            self.fetched.append(url)
+            return type("Response", (), {"status_code": 200, "html": "<p>x</p>"})
+
+    class Crawler:
+        crawler_strategy = Strategy()
+
+    pool = Pool()
+    provider = Crawl4AIProvider(process_pool=pool)
+    provider._config = None
+    provider._domain_filter = DomainFilter(blocked_domains=["influencedigest.com"])
+    provider._filter_chain = FilterChain(
+        [provider._domain_filter, ContentTypeFilter(allowed_types=["text/html"])]
+    )
+    crawler = Crawler()
+
+    blocked = await provider._crawl_offloaded(
+        crawler, "https://influencedigest.com/a", False
+    )
+    image = await provider._crawl_offloaded(crawler, "https://a.ae/chart.png", False)
+    page = await provider._crawl_offloaded(crawler, "https://a.ae/prices", False)
+    # The pool is shut down even though no browser was ever started.
+    await provider.close()
+
+    assert blocked["error"] and image["error"]
+    assert page["content"] == "Body"
+    assert crawler.crawler_strategy.fetched == ["https://a.ae/prices"]
+    assert pool.shut_down
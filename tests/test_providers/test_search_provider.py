@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.providers.search.planner import PlannedSearchProvider, QueryPlanner
+from app.providers.search.utils import REAL_ESTATE_KEYWORDS, normalize_query
+
+
+class RecordingSearch:
+    def __init__(self, results):
+        self.results = results
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(self, query):
+        self.queries.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+        if query not in self.results:
+            raise RuntimeError("rate limited")
+        return self.results[query]
+
+
+def test_normalize_query_appends_vocabulary():
+    normalized = normalize_query("JVC rents")
+
+    assert normalized.startswith("JVC rents ")
+    assert REAL_ESTATE_KEYWORDS[0] in normalized
+
+
+def test_planner_adds_region_and_facets():
+    planner = QueryPlanner(facets={"prices": "prices", "rent": "rental yield"})
+
+    assert planner.plan("Marina  towers") == [
+        "Dubai Marina towers",
+        "Dubai Marina towers prices",
+        "Dubai Marina towers rental yield",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_planned_search_fuses_concurrent_results_with_domain_limit():
+    planner = QueryPlanner(facets={"prices": "prices", "rent": "rent"})
+    backend = RecordingSearch(
+        {
+            "Dubai q": ["https://a.ae/1", "https://a.ae/2", "https://a.ae/3"],
+            "Dubai q prices": ["https://b.ae/x#top", "https://a.ae/1/"],
+        }
+    )
+    provider = PlannedSearchProvider(backend, planner=planner, max_per_domain=2)
+
+    urls = await provider.search("q")
+
+    assert backend.max_in_flight == 3
+    assert urls == ["https://a.ae/1", "https://b.ae/x", "https://a.ae/2"]
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+
+from app.data.repositories.corpus_repo import SQLiteCorpusIndex
+
+
+DOCUMENTS = [
+    {
+        "url": "https://a.ae/prices",
+        "title": "Dubai apartment prices",
+        "content": "Apartment prices in Dubai Marina rose 12% this quarter.",
+        "published_at": datetime(2026, 3, 1, 9, 30),
+    },
+    {
+        "url": "https://b.ae/rent",
+        "title": "Rental yields",
+        "content": "Rental yield in Jumeirah Village Circle is close to 8%.",
+        "published_at": "2026-02-01",
+    },
+    {
+        "url": "https://c.com/football",
+        "title": "Match report",
+        "content": "The home side won the derby after a late penalty.",
+    },
+]
+
+
+@pytest.mark.asyncio
+async def test_search_returns_relevant_documents(tmp_path):
+    index = SQLiteCorpusIndex(tmp_path / "corpus.db")
+    await index.add(DOCUMENTS)
+
+    results = await index.search("Dubai Marina apartment prices", limit=2)
+
+    assert results[0]["url"] == "https://a.ae/prices"
+    assert results[0]["published_at"] == datetime(2026, 3, 1, 9, 30)
+    assert "https://c.com/football" not in [r["url"] for r in results]
+
+
+@pytest.mark.asyncio
+async def test_index_persists_and_replaces_changed_content(tmp_path):
+    index = SQLiteCorpusIndex(tmp_path / "corpus.db")
+    await index.add(DOCUMENTS)
+    await index.add([{**DOCUMENTS[1], "content": "Villa supply in Arabian Ranches."}])
+    index.close()
+
+    reopened = SQLiteCorpusIndex(tmp_path / "corpus.db")
+
+    assert await reopened.search("jumeirah village circle") == []
+    assert (await reopened.search("villa supply"))[0]["url"] == "https://b.ae/rent"
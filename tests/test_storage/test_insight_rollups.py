@@ -0,0 +1,78 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.data.repositories.insight_repo import JSONInsightRepository
+from app.data.repositories.rollup_repo import SQLiteInsightRollups
+
+
+def result(sentiment, score=None, trends=(), sources=3, query="Dubai Marina"):
+    insights = {"market_sentiment": sentiment, "key_trends": list(trends)}
+    if score is not None:
+        insights["confidence"] = {"score": score}
+
+    return {
+        "query": query,
+        "insights": insights,
+        "sources": [f"https://s{i}.ae/" for i in range(sources)],
+    }
+
+
+@pytest.mark.asyncio
+async def test_rollups_aggregate_runs_per_day(tmp_path):
+    rollups = SQLiteInsightRollups(tmp_path / "rollups.db")
+    day1, day2 = datetime(2026, 3, 1, 8), datetime(2026, 3, 2, 8)
+
+    await rollups.update(result("positive", 80, ["Prices up", "Supply tight"]), day1)
+    await rollups.update(result("Positive", 60, ["prices  up"], sources=5), day1)
+    await rollups.update(result("negative", None, ["Rents fall"]), day2)
+    await rollups.update(result("neutral", 50, query="Palm Jumeirah"), day2)
+    await rollups.update({"query": "Dubai Marina", "error": "HTTP 503"}, day2)
+
+    days = await rollups.range("dubai  marina", date(2026, 2, 1), date(2026, 3, 31))
+
+    assert [d["day"] for d in days] == ["2026-03-01", "2026-03-02"]
+    assert days[0]["runs"] == 2
+    assert days[0]["sentiment"] == {"positive": 2, "neutral": 0, "negative": 0}
+    assert days[0]["mean_confidence"] == 70.0
+    assert days[0]["mean_sources"] == 4.0
+    assert days[0]["top_trends"][0] == {"trend": "prices up", "count": 2}
+    assert days[1]["mean_confidence"] is None
+    assert days[1]["sentiment"]["negative"] == 1
+
+    assert await rollups.range("dubai marina", date(2026, 3, 2), date(2026, 3, 2)) == [
+        days[1]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_repository_save_updates_rollups(tmp_path):
+    rollups = SQLiteInsightRollups(tmp_path / "rollups.db")
+    repo = JSONInsightRepository(base_path=tmp_path / "insights", rollups=rollups)
+
+    await repo.save(result("neutral", 55))
+
+    today = datetime.now(timezone.utc).date()
+    (day,) = await rollups.range("Dubai Marina", today, today)
+    assert day["runs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    writers = [SQLiteInsightRollups(tmp_path / "rollups.db") for _ in range(3)]
+    day = datetime(2026, 3, 1, 8)
+
+    await asyncio.gather(
+        *(
+            writers[i % 3].update(result("positive", 50, [f"trend {i % 2}"]), day)
+            for i in range(30)
+        )
+    )
+
+    (rollup,) = await writers[0].range("Dubai Marina", day.date(), day.date())
+    assert rollup["runs"] == 30
+    assert rollup["sentiment"]["positive"] == 30
+    assert {t["count"] for t in rollup["top_trends"]} == {15}
+    for writer in writers:
+        writer.close()
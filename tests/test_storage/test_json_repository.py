@@ -12,3 +12,30 @@ async def test_save_and_load(tmp_path):
     loaded = await repo.load_latest()
 
     assert loaded == data
+
+
+@pytest.mark.asyncio
+async def test_load_latest_for_query(tmp_path):
+    repo = JSONInsightRepository(base_path=tmp_path)
+
+    await repo.save({"query": "Dubai Marina", "insights": {"summary": "a"}})
+    await repo.save({"query": "Palm Jumeirah", "insights": {"summary": "b"}})
+
+    loaded = await repo.load_latest_for_query("dubai  marina")
+
+    assert loaded["insights"] == {"summary": "a"}
+    assert await repo.load_latest_for_query("JVC") is None
+
+
+@pytest.mark.asyncio
+async def test_repository_without_per_query_lookup_still_instantiates():
+    from app.data.repositories.base import InsightRepositoryBase
+
+    class LatestOnlyRepository(InsightRepositoryBase):
+        async def save(self, data):
+            pass
+
+        async def load_latest(self):
+            return None
+
+    assert await LatestOnlyRepository().load_latest_for_query("dubai") is None
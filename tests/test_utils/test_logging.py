@@ -0,0 +1,63 @@
+import json
+import logging
+import random
+
+from app.utils.console import ProgressSink
+from app.utils.logging import JsonFormatter, SamplingFilter
+
+
+def make_record(name: str, level: int = logging.INFO, **extra) -> logging.LogRecord:
+    record = logging.makeLogRecord(
+        {"name": name, "levelno": level, "levelname": logging.getLevelName(level)}
+    )
+    record.msg = "crawled %s"
+    record.args = ("https://a.test/",)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_extra_fields():
+    line = JsonFormatter().format(make_record("app.crawler", url_count=3))
+    payload = json.loads(line)
+
+    assert payload["logger"] == "app.crawler"
+    assert payload["level"] == "INFO"
+    assert payload["message"] == "crawled https://a.test/"
+    assert payload["url_count"] == 3
+
+
+def test_sampling_filter_uses_longest_prefix_and_keeps_warnings():
+    sampler = SamplingFilter(
+        {"app.providers": 0.0, "app.providers.search": 1.0}, rng=random.Random(0)
+    )
+
+    assert not sampler.filter(make_record("app.providers.crawler.crawl4ai"))
+    assert sampler.filter(make_record("app.providers.search.duckduckgo"))
+    assert sampler.filter(make_record("app.core.pipeline"))
+    assert sampler.filter(
+        make_record("app.providers.crawler.crawl4ai", level=logging.WARNING)
+    )
+
+
+class RecordingConsole:
+    def __init__(self):
+        self.lines = []
+
+    def print(self, *objects, **kwargs):
+        self.lines.append(" ".join(map(str, objects)))
+
+
+def test_progress_sink_renders_in_background_and_can_be_disabled():
+    console = RecordingConsole()
+    sink = ProgressSink(enabled=True, console=console)
+
+    sink.print("→ Crawling", "https://a.test/")
+    sink.flush()
+
+    assert console.lines == ["→ Crawling https://a.test/"]
+
+    sink.enabled = False
+    sink.print("dropped")
+    sink.flush()
+
+    assert console.lines == ["→ Crawling https://a.test/"]
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import pytest
+
+from app.utils.profiling import LoopLagMonitor, RunProfiler
+
+
+def blocking_date_parse():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_reports_blocking_call_stack():
+    monitor = LoopLagMonitor(threshold=0.1, interval=0.02)
+    await monitor.start()
+
+    await asyncio.sleep(0.05)
+    blocking_date_parse()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    (stall,) = monitor.stalls
+    assert stall["lag_ms"] >= 200
+    assert "blocking_date_parse" in "".join(stall["stack"])
+
+
+@pytest.mark.asyncio
+async def test_run_profiler_writes_collapsed_stacks_for_next_runs(tmp_path):
+    profiler = RunProfiler(output_dir=tmp_path, interval=0.001)
+
+    async def run():
+        async with profiler.profile():
+            blocking_date_parse()
+            await asyncio.sleep(0.01)
+
+    await run()  # not armed: nothing captured
+    capture = profiler.arm(2)
+
+    with pytest.raises(RuntimeError):
+        profiler.arm(1)
+
+    await asyncio.gather(run(), run())
+    await run()
+
+    assert capture.done and capture.completed == 2
+    lines = capture.path.read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert "blocking_date_parse" in stack and int(count) > 0
+    assert profiler.arm(1).capture_id != capture.capture_id
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.providers.crawler.queued import QueuedCrawlProvider
+from app.workers.crawl_worker import CrawlWorker
+from app.workers.task_queue import DEAD, DONE, QUEUED, SQLiteTaskQueue
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_and_expired_leases_are_reassigned(tmp_path):
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db")
+    (task_id,) = await queue.enqueue([{"url": "https://a.ae/"}])
+
+    first = await queue.lease("w1", lease_seconds=0.05)
+    assert first.task_id == task_id
+    assert await queue.lease("w2", lease_seconds=60) is None
+
+    await asyncio.sleep(0.1)
+    second = await queue.lease("w2", lease_seconds=60)
+
+    assert second.task_id == task_id
+    assert second.attempts == 2
+    # The original owner lost its lease, so its completion is ignored.
+    await queue.complete(task_id, "w1", {"url": "stale"})
+    assert (await queue.get([task_id]))[task_id].status != DONE
+
+
+@pytest.mark.asyncio
+async def test_failed_tasks_retry_then_dead_letter(tmp_path):
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db")
+    (task_id,) = await queue.enqueue([{"url": "https://a.ae/"}], max_attempts=2)
+
+    task = await queue.lease("w1", 60)
+    await queue.fail(task.task_id, "w1", "timeout")
+    assert (await queue.get([task_id]))[task_id].status == QUEUED
+
+    task = await queue.lease("w1", 60)
+    await queue.fail(task.task_id, "w1", "timeout")
+
+    (dead,) = await queue.dead_letters()
+    assert dead.status == DEAD
+    assert dead.error == "timeout"
+
+
+class FlakyCrawler:
+    def __init__(self):
+        self.calls = {}
+
+    async def crawl(self, url):
+        self.calls[url] = self.calls.get(url, 0) + 1
+        if url.endswith("flaky") and self.calls[url] == 1:
+            return {"url": url, "content": None, "error": "Empty content"}
+        return {"url": url, "title": "t", "content": "body", "error": None}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_gathers_results_from_workers(tmp_path):
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db")
+    stop = asyncio.Event()
+    workers = [
+        asyncio.create_task(
+            CrawlWorker(
+                queue, FlakyCrawler(), f"w{i}", poll_interval=0.01, retry_backoff=0
+            ).run(stop)
+        )
+        for i in range(2)
+    ]
+    coordinator = QueuedCrawlProvider(queue, poll_interval=0.01, timeout=5)
+
+    urls = ["https://a.ae/1", "https://b.ae/flaky", "https://c.ae/2"]
+    results = await coordinator.crawl_many(urls)
+
+    stop.set()
+    await asyncio.gather(*workers)
+
+    assert [r["url"] for r in results] == urls
+    assert all(r["content"] == "body" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_finished_tasks_but_keeps_dead_letters(tmp_path):
+    queue = SQLiteTaskQueue(tmp_path / "tasks.db")
+    done_id, dead_id, queued_id = await queue.enqueue(
+        [{"url": f"https://{name}.ae/"} for name in ("a", "b", "c")], max_attempts=1
+    )
+    task = await queue.lease("w1", 60)
+    await queue.complete(task.task_id, "w1", {"url": "https://a.ae/"})
+    task = await queue.lease("w1", 60)
+    await queue.fail(task.task_id, "w1", "timeout")
+
+    assert await queue.purge(older_than=60) == 0
+    assert await queue.purge(older_than=0) == 1
+
+    remaining = await queue.get([done_id, dead_id, queued_id])
+    assert sorted(remaining) == [dead_id, queued_id]